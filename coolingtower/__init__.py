@@ -1,3 +1,11 @@
 from .cooling_tower import *
+from .cooling_tower_array import *
+from .cooling_tower_cache import *
+from .merkel import *
 
-__all__ = cooling_tower.__all__
+__all__ = (
+    cooling_tower.__all__
+    + cooling_tower_array.__all__
+    + cooling_tower_cache.__all__
+    + merkel.__all__
+)
@@ -2,8 +2,14 @@ from pyfluids import HumidAir, InputHumidAir, Fluid, FluidsList, Input
 from fanpump import Fan
 from CoolProp.CoolProp import PropsSI
 
+from .merkel import TowerModel, merkelOutletWater, merkelOutletAir
+
 __all__ = ["CoolingTower"]
 
+_APPROACH_TEMP = 3  # C, default approach temperature
+# %/C. water evaporated per degree of temperature difference
+_EVAPERATE_RATE = 0.01 / 6.9
+
 
 class CoolingTower:
     def __init__(
@@ -14,6 +20,8 @@ class CoolingTower:
         LG_or_outlet_air: float | HumidAir,  # kg/s
         target_temp: float = None,
         delta_P: float = 200,
+        model: TowerModel = TowerModel.approach,
+        characteristic: tuple[float, float] = (1.6, 0.6),  # NTU = c * (L/G)^-n
     ):
         self.__inlet_air = inlet_air
         self.__inlet_water = Fluid(FluidsList.Water).with_state(
@@ -31,10 +39,8 @@ class CoolingTower:
 
         self.__target_temp: float = target_temp  # C, target water temperature
 
-        self.__approach_temp: float = 3  # C, default approach temperature
-        self.__evaperate_rate: float = (
-            0.01 / 6.9
-        )  # %/C. water evaporated per degree of temperature difference
+        self.__approach_temp: float = _APPROACH_TEMP
+        self.__evaperate_rate: float = _EVAPERATE_RATE
 
         self.__m_evap: float = None
 
@@ -42,6 +48,9 @@ class CoolingTower:
         self.__W: float = None
         self.__COP: float = None
 
+        self.__model: TowerModel = TowerModel(model)
+        self.__characteristic: tuple[float, float] = characteristic
+
         # self.__m_da: float = None
         # self.__m_a_out: float = None
         # self.__m_w_out: float = None
@@ -70,9 +79,15 @@ class CoolingTower:
             self.__setOutletWater()
         return self.__outlet_water
 
+    @property
+    def model(self) -> TowerModel:
+        return self.__model
+
     @property
     def m_evap(self):
-        if self.__m_evap is None:
+        if self.__m_evap is None and self.__model is TowerModel.merkel:
+            self.__m_evap = self.outlet_air.humidity - self.inlet_air.humidity
+        elif self.__m_evap is None:
             self.__m_evap = (
                 self.LG
                 * self.__evaperate_rate
@@ -132,7 +147,18 @@ class CoolingTower:
     #     return self.__m_w_out
 
     def __setOutletAir(self):
-        if self.__LG is not None:
+        if self.__model is TowerModel.merkel:
+            outlet_air_enthalpy, outlet_air_humidity = merkelOutletAir(
+                self.__inlet_water.temperature,
+                self.outlet_water.temperature,
+                self.__inlet_air.temperature,
+                self.__inlet_air.humidity,
+                self.LG,
+                self.__inlet_water.specific_heat,
+            )
+            outlet_air_enthalpy = float(outlet_air_enthalpy)
+            outlet_air_humidity = float(outlet_air_humidity)
+        elif self.__LG is not None:
             outlet_air_enthalpy = (
                 self.__LG
                 * self.__inlet_water.specific_heat
@@ -164,6 +190,10 @@ class CoolingTower:
         )
 
     def __setOutletWater(self):
+        if self.__model is TowerModel.merkel:
+            self.__setOutletWaterMerkel()
+            return
+
         air_wet_bulb = self.__inlet_air.wet_bulb_temperature
         if (
             self.__target_temp is not None
@@ -180,6 +210,28 @@ class CoolingTower:
             Input.pressure(101325),
         )
 
+    def __setOutletWaterMerkel(self):
+        if self.__LG is None:
+            raise ValueError("Merkel model needs L/G, not a target outlet air")
+
+        outlet_water_temperature = float(
+            merkelOutletWater(
+                self.__inlet_water.temperature,
+                self.__inlet_air.temperature,
+                self.__inlet_air.humidity,
+                self.__LG,
+                self.__characteristic,
+                self.__inlet_water.specific_heat,
+            )
+        )
+        if self.__target_temp is not None:
+            outlet_water_temperature = max(outlet_water_temperature, self.__target_temp)
+
+        self.__outlet_water = Fluid(FluidsList.Water).with_state(
+            Input.temperature(outlet_water_temperature),
+            Input.pressure(101325),
+        )
+
     def __setLG(self):
         delta_h = self.__target_enthalpy - self.__inlet_air.enthalpy
         delta_T = self.__inlet_water.temperature - self.outlet_water.temperature
@@ -201,4 +253,5 @@ class CoolingTower:
 
         W_fan_kW = self.work
 
-        self.__COP = Q_sensible / W_fan_kW
+        # undefined without fan work, as in CoolingTowerArray
+        self.__COP = Q_sensible / W_fan_kW if W_fan_kW > 0 else float("nan")
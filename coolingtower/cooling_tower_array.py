@@ -0,0 +1,310 @@
+import numpy as np
+from CoolProp.CoolProp import PropsSI
+
+import psychro
+from fanpump import FanArray
+
+from .cooling_tower import _APPROACH_TEMP, _EVAPERATE_RATE
+from .merkel import TowerModel, merkelOutletWater, merkelOutletAir, merkelAirFlow
+
+__all__ = ["CoolingTowerArray"]
+
+
+class CoolingTowerArray:
+    """
+    Column-wise counterpart of CoolingTower, e.g. one element per hour of a
+    weather year. Uses the same approach / Merkel models, evaporation rate
+    and fan model as CoolingTower; every output is one vectorized pass.
+
+    Exactly one of ``LG`` and ``target_enthalpy`` has to be given, matching
+    the float / HumidAir choice of CoolingTower's ``LG_or_outlet_air``.
+
+    With ``fan_control`` (Merkel model only) neither is given: the air flow
+    is solved for the fan speed that brings the water to ``target_temp``,
+    capped at ``design_air_flow``, and the fan is off where the inlet water
+    is already at or below the target.
+    """
+
+    def __init__(
+        self,
+        inlet_air_temperature: np.ndarray,  # C
+        inlet_air_humidity: np.ndarray,  # kg/kg
+        inlet_water_temperature: np.ndarray,  # C
+        m_water: np.ndarray,  # kg/s
+        LG: np.ndarray = None,
+        target_enthalpy: np.ndarray = None,  # J/kg, outlet air
+        target_temp: float | np.ndarray = None,  # C, target water temperature
+        delta_P: float | np.ndarray = 200,  # Pa
+        model: TowerModel = TowerModel.approach,
+        characteristic: tuple[float, float] = (1.6, 0.6),
+        design_air_flow: float = 1,  # kg/s, fan full-speed air flow
+        fan_control: bool = False,
+    ):
+        self.__model: TowerModel = TowerModel(model)
+        self.__fan_control: bool = fan_control
+
+        if fan_control:
+            if self.__model is not TowerModel.merkel or target_temp is None:
+                raise ValueError("Fan control needs the Merkel model and target_temp")
+            if LG is not None or target_enthalpy is not None:
+                raise ValueError("Fan control solves L/G, do not give LG or target")
+        elif (LG is None) == (target_enthalpy is None):
+            raise ValueError("Give exactly one of LG and target_enthalpy")
+        elif self.__model is TowerModel.merkel and LG is None:
+            raise ValueError("Merkel model needs L/G, not a target outlet air")
+
+        arrays = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    inlet_air_temperature,
+                    inlet_air_humidity,
+                    inlet_water_temperature,
+                    m_water,
+                    np.nan if LG is None else LG,
+                    np.nan if target_enthalpy is None else target_enthalpy,
+                    np.nan if target_temp is None else target_temp,
+                    delta_P,
+                )
+            )
+        )
+        (
+            self.__T_a_in,
+            self.__W_a_in,
+            self.__T_w_in,
+            self.__m_water,
+            LG,
+            self.__target_enthalpy,
+            self.__target_temp,
+            self.__delta_P,
+        ) = arrays
+
+        self.__characteristic: tuple[float, float] = characteristic
+        self.__design_air_flow: float = design_air_flow
+
+        self.__approach_temp: float = _APPROACH_TEMP
+        self.__evaperate_rate: float = _EVAPERATE_RATE
+
+        self.__h_a_in: np.ndarray = psychro.enthalpy(self.__T_a_in, self.__W_a_in)
+        self.__cp_w: np.ndarray = PropsSI(
+            "C", "T", self.__T_w_in + 273.15, "P", 101325, "Water"
+        )
+
+        self.__LG: np.ndarray = None if np.isnan(LG).all() else LG
+        self.__T_w_out: np.ndarray = None
+        self.__h_a_out: np.ndarray = None
+        self.__W_a_out: np.ndarray = None
+        self.__m_evap: np.ndarray = None
+        self.__m_air: np.ndarray = None
+        self.__W: np.ndarray = None
+        self.__COP: np.ndarray = None
+
+    @property
+    def size(self) -> int:
+        return self.__T_a_in.size
+
+    @property
+    def model(self) -> TowerModel:
+        return self.__model
+
+    @property
+    def fan_control(self) -> bool:
+        return self.__fan_control
+
+    @property
+    def inlet_air_temperature(self) -> np.ndarray:
+        """[C]"""
+        return self.__T_a_in
+
+    @property
+    def inlet_air_humidity(self) -> np.ndarray:
+        """[kg/kg]"""
+        return self.__W_a_in
+
+    @property
+    def inlet_air_enthalpy(self) -> np.ndarray:
+        """[J/kg]"""
+        return self.__h_a_in
+
+    @property
+    def inlet_water_temperature(self) -> np.ndarray:
+        """[C]"""
+        return self.__T_w_in
+
+    @property
+    def outlet_water_temperature(self) -> np.ndarray:
+        """[C]"""
+        if self.__T_w_out is None:
+            self.__setOutletWater()
+        return self.__T_w_out
+
+    @property
+    def outlet_air_enthalpy(self) -> np.ndarray:
+        """[J/kg]"""
+        if self.__h_a_out is None:
+            self.__setOutletAir()
+        return self.__h_a_out
+
+    @property
+    def outlet_air_humidity(self) -> np.ndarray:
+        """[kg/kg]"""
+        if self.__W_a_out is None:
+            self.__setOutletAir()
+        return self.__W_a_out
+
+    @property
+    def outlet_air_temperature(self) -> np.ndarray:
+        """[C]"""
+        return psychro.temperature(self.outlet_air_enthalpy, self.outlet_air_humidity)
+
+    @property
+    def m_evap(self) -> np.ndarray:
+        if self.__m_evap is None:
+            if self.__model is TowerModel.merkel:
+                self.__m_evap = self.outlet_air_humidity - self.__W_a_in
+            else:
+                self.__m_evap = self.LG * self.__evaperate_rate * self.__delta_T()
+        return self.__m_evap
+
+    @property
+    def LG(self) -> np.ndarray:
+        if self.__LG is None:
+            self.__setLG()
+        return self.__LG
+
+    @property
+    def m_G(self) -> np.ndarray:
+        """Air mass flow [kg/s], zero where the fan is off."""
+        if self.__m_air is None:
+            self.__m_air = self.__m_water / self.LG
+        return self.__m_air
+
+    @property
+    def work(self) -> np.ndarray:
+        """Fan power consumption [kW]"""
+        if self.__W is None:
+            self.__setW()
+        return self.__W
+
+    @property
+    def COP(self) -> np.ndarray:
+        """NaN where the fan is off."""
+        if self.__COP is None:
+            Q_sensible = self.__m_water * self.__cp_w * self.__delta_T() / 1e3
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self.__COP = np.where(self.work > 0, Q_sensible / self.work, np.nan)
+        return self.__COP
+
+    @property
+    def table(self) -> dict[str, np.ndarray]:
+        """All outputs as columns."""
+        return {
+            "T_water_out": self.outlet_water_temperature,
+            "h_air_out": self.outlet_air_enthalpy,
+            "W_air_out": self.outlet_air_humidity,
+            "T_air_out": self.outlet_air_temperature,
+            "LG": self.LG,
+            "m_G": self.m_G,
+            "m_evap": self.m_evap,
+            "work": self.work,
+            "COP": self.COP,
+        }
+
+    def __delta_T(self) -> np.ndarray:
+        return self.__T_w_in - self.outlet_water_temperature
+
+    def __fanOn(self) -> np.ndarray:
+        return self.m_G > 0
+
+    def __setOutletWater(self):
+        if self.__fan_control:
+            fan_on = self.__fanOn()
+            T_w_out = merkelOutletWater(
+                self.__T_w_in,
+                self.__T_a_in,
+                self.__W_a_in,
+                np.where(fan_on, self.LG, 1),
+                self.__characteristic,
+                self.__cp_w,
+            )
+            T_w_out = np.maximum(T_w_out, self.__target_temp)
+            # water already below target passes through with the fan off
+            self.__T_w_out = np.where(fan_on, T_w_out, self.__T_w_in)
+            return
+
+        if self.__model is TowerModel.merkel:
+            T_w_out = merkelOutletWater(
+                self.__T_w_in,
+                self.__T_a_in,
+                self.__W_a_in,
+                self.__LG,
+                self.__characteristic,
+                self.__cp_w,
+            )
+        else:
+            T_wb = psychro.wetBulbTemperature(self.__T_a_in, self.__W_a_in)
+            T_w_out = T_wb + self.__approach_temp
+
+        # throttle to the target temperature where the tower could go colder
+        self.__T_w_out = np.where(
+            self.__target_temp > T_w_out, self.__target_temp, T_w_out
+        )
+
+    def __setOutletAir(self):
+        T_w_out = self.outlet_water_temperature
+        delta_T = self.__delta_T()
+
+        if self.__model is TowerModel.merkel:
+            fan_on = self.__fanOn()
+            h_a_out, W_a_out = merkelOutletAir(
+                self.__T_w_in,
+                T_w_out,
+                self.__T_a_in,
+                self.__W_a_in,
+                np.where(fan_on, self.LG, 0),
+                self.__cp_w,
+            )
+            self.__h_a_out = np.where(fan_on, h_a_out, self.__h_a_in)
+            self.__W_a_out = np.where(fan_on, W_a_out, self.__W_a_in)
+            return
+
+        if np.isnan(self.__target_enthalpy).all():
+            self.__h_a_out = (
+                self.LG * self.__cp_w * delta_T * (1 + self.__evaperate_rate * T_w_out)
+                + self.__h_a_in
+            )
+        else:
+            self.__h_a_out = self.__target_enthalpy
+
+        self.__W_a_out = self.__W_a_in + self.__evaperate_rate * delta_T * self.LG
+
+    def __setLG(self):
+        if self.__fan_control:
+            self.__m_air = merkelAirFlow(
+                self.__T_w_in,
+                self.__target_temp,
+                self.__T_a_in,
+                self.__W_a_in,
+                self.__m_water,
+                self.__design_air_flow,
+                self.__characteristic,
+                self.__cp_w,
+            )
+            with np.errstate(divide="ignore"):
+                self.__LG = self.__m_water / self.__m_air
+            return
+
+        T_w_out = self.outlet_water_temperature
+        self.__LG = (self.__target_enthalpy - self.__h_a_in) / (
+            self.__cp_w * self.__delta_T() * (1 + self.__evaperate_rate * T_w_out)
+        )
+
+    def __setW(self):
+        fan = FanArray(
+            psychro.density(self.__T_a_in, self.__W_a_in),
+            self.__design_air_flow,
+            self.m_G,
+            self.__delta_P,
+        )
+
+        self.__W = fan.actual_work
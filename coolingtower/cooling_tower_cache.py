@@ -0,0 +1,129 @@
+from collections import OrderedDict
+
+from pyfluids import HumidAir
+
+from .cooling_tower import CoolingTower
+from .merkel import TowerModel
+
+__all__ = ["CoolingTowerCache"]
+
+
+class CoolingTowerCache:
+    """
+    Memoized CoolingTower construction keyed by quantized inlet conditions.
+
+    Towers with the same inlet air state, inlet water temperature, water
+    flow, L/G (or target outlet enthalpy), target temperature, fan pressure
+    drop and model share one CoolingTower instance, so its lazily computed
+    outlet water/air, LG, m_evap, work and COP are only evaluated once.
+    """
+
+    __shared: "CoolingTowerCache" = None
+
+    def __init__(self, maxsize: int = 4096, decimals: int = 6):
+        self.__maxsize: int = maxsize
+        self.__decimals: int = decimals  # rounding of every key component
+
+        self.__towers: OrderedDict[tuple, CoolingTower] = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @classmethod
+    def shared(cls) -> "CoolingTowerCache":
+        """Process-wide cache used by the system classes."""
+        if cls.__shared is None:
+            cls.__shared = cls()
+        return cls.__shared
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__towers)
+
+    def clear(self):
+        self.__towers.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(
+        self,
+        inlet_air: HumidAir,
+        inlet_water_temperature: float,  # C
+        m_water: float,
+        LG_or_outlet_air: float | HumidAir,
+        target_temp: float = None,
+        delta_P: float = 200,
+        model: TowerModel = TowerModel.approach,
+        characteristic: tuple[float, float] = (1.6, 0.6),
+    ) -> CoolingTower:
+        key = self.__key(
+            inlet_air,
+            inlet_water_temperature,
+            m_water,
+            LG_or_outlet_air,
+            target_temp,
+            delta_P,
+            model,
+            characteristic,
+        )
+
+        tower = self.__towers.get(key)
+        if tower is not None:
+            self.__hits += 1
+            self.__towers.move_to_end(key)
+            return tower
+
+        self.__misses += 1
+        tower = CoolingTower(
+            inlet_air,
+            inlet_water_temperature,
+            m_water,
+            LG_or_outlet_air,
+            target_temp,
+            delta_P,
+            model,
+            characteristic,
+        )
+        self.__towers[key] = tower
+        if len(self.__towers) > self.__maxsize:
+            self.__towers.popitem(last=False)
+        return tower
+
+    def __key(
+        self,
+        inlet_air: HumidAir,
+        inlet_water_temperature: float,
+        m_water: float,
+        LG_or_outlet_air: float | HumidAir,
+        target_temp: float | None,
+        delta_P: float,
+        model: TowerModel,
+        characteristic: tuple[float, float],
+    ) -> tuple:
+        if isinstance(LG_or_outlet_air, HumidAir):
+            # target outlet air only enters through its enthalpy
+            LG_key = ("h", self.__round(LG_or_outlet_air.enthalpy))
+        else:
+            LG_key = ("LG", self.__round(LG_or_outlet_air))
+
+        return (
+            self.__round(inlet_air.temperature),
+            self.__round(inlet_air.humidity),
+            self.__round(inlet_air.pressure),
+            self.__round(inlet_water_temperature),
+            self.__round(m_water),
+            LG_key,
+            None if target_temp is None else self.__round(target_temp),
+            self.__round(delta_P),
+            TowerModel(model),
+            tuple(characteristic),
+        )
+
+    def __round(self, value: float) -> float:
+        return round(float(value), self.__decimals)
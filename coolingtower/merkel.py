@@ -0,0 +1,152 @@
+from enum import Enum
+
+import numpy as np
+
+import psychro
+from solver import bisect
+
+__all__ = [
+    "TowerModel",
+    "merkelNTU",
+    "merkelOutletWater",
+    "merkelOutletAir",
+    "merkelAirFlow",
+]
+
+# Chebyshev 4-point abscissae on the water temperature range
+_CHEBYSHEV = (0.1, 0.4, 0.6, 0.9)
+
+# lowest fan speed searched by merkelAirFlow, fraction of the design air flow
+_MIN_AIR_FRACTION = 1e-3
+
+CP_WATER = 4186  # J/kg/K
+
+
+class TowerModel(Enum):
+    approach = "approach"  # fixed approach to the inlet wet-bulb temperature
+    merkel = "merkel"  # Merkel NTU with a tower characteristic c * (L/G)^-n
+
+
+def merkelNTU(
+    T_w_in: float | np.ndarray,  # C
+    T_w_out: float | np.ndarray,  # C
+    h_a_in: float | np.ndarray,  # J/kg
+    LG: float | np.ndarray,
+    cp_w: float = CP_WATER,
+    P: float = psychro.P_ATM,
+) -> float | np.ndarray:
+    """
+    Merkel number required to cool water from T_w_in to T_w_out, integrated
+    with the Chebyshev 4-point rule. Points where the air enthalpy reaches
+    the saturation enthalpy (no driving force) give an infinite NTU.
+    """
+    T_w_in, T_w_out, h_a_in, LG = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (T_w_in, T_w_out, h_a_in, LG))
+    )
+    delta_T = T_w_in - T_w_out
+
+    total = np.zeros(delta_T.shape)
+    for k in _CHEBYSHEV:
+        T_w = T_w_out + k * delta_T
+        h_s = psychro.enthalpy(T_w, psychro.saturationHumidity(T_w, P))
+        h_a = h_a_in + LG * cp_w * k * delta_T
+        driving = h_s - h_a
+        total += np.where(driving > 0, 1 / np.where(driving > 0, driving, 1), np.inf)
+
+    NTU = cp_w * delta_T / 4 * total
+    return np.where(delta_T > 0, NTU, 0.0)
+
+
+def merkelOutletWater(
+    T_w_in: float | np.ndarray,  # C
+    T_a_in: float | np.ndarray,  # C
+    W_a_in: float | np.ndarray,  # kg/kg
+    LG: float | np.ndarray,
+    characteristic: tuple[float, float] = (1.6, 0.6),
+    cp_w: float = CP_WATER,
+    P: float = psychro.P_ATM,
+) -> float | np.ndarray:
+    """
+    Outlet water temperature [C] at which the required Merkel number equals
+    the tower characteristic NTU = c * (L/G)^-n. Solved element-wise by
+    bisection between the inlet wet-bulb and the inlet water temperature.
+    """
+    c, n = characteristic
+    T_w_in, T_a_in, W_a_in, LG = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (T_w_in, T_a_in, W_a_in, LG))
+    )
+    h_a_in = psychro.enthalpy(T_a_in, W_a_in)
+    T_wb = psychro.wetBulbTemperature(T_a_in, W_a_in, P)
+    NTU_tower = c * LG ** (-n)
+
+    def residual(T_w_out):
+        return merkelNTU(T_w_in, T_w_out, h_a_in, LG, cp_w, P) - NTU_tower
+
+    lo = np.minimum(T_wb, T_w_in)
+    T_w_out = bisect(residual, lo, T_w_in, xtol=1e-4)
+
+    # tower large enough to reach the wet-bulb temperature
+    return np.where(np.isnan(T_w_out), lo, T_w_out)
+
+
+def merkelOutletAir(
+    T_w_in: float | np.ndarray,  # C
+    T_w_out: float | np.ndarray,  # C
+    T_a_in: float | np.ndarray,  # C
+    W_a_in: float | np.ndarray,  # kg/kg
+    LG: float | np.ndarray,
+    cp_w: float = CP_WATER,
+    P: float = psychro.P_ATM,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Outlet air (enthalpy [J/kg], humidity [kg/kg]) from the Merkel energy
+    balance, with the outlet air taken as saturated.
+    """
+    h_a_out = psychro.enthalpy(T_a_in, W_a_in) + LG * cp_w * (
+        np.asarray(T_w_in) - T_w_out
+    )
+    W_a_out = np.maximum(
+        psychro.saturationHumidity(psychro.saturationTemperature(h_a_out, P), P),
+        W_a_in,
+    )
+    return h_a_out, W_a_out
+
+
+def merkelAirFlow(
+    T_w_in: float | np.ndarray,  # C
+    T_w_out: float | np.ndarray,  # C, target outlet water temperature
+    T_a_in: float | np.ndarray,  # C
+    W_a_in: float | np.ndarray,  # kg/kg
+    m_water: float | np.ndarray,  # kg/s
+    design_air_flow: float,  # kg/s
+    characteristic: tuple[float, float] = (1.6, 0.6),
+    cp_w: float = CP_WATER,
+    P: float = psychro.P_ATM,
+) -> np.ndarray:
+    """
+    Air mass flow [kg/s] (fan speed) at which the tower cools the water to
+    T_w_out, i.e. the required Merkel number equals c * (L/G)^-n at that
+    outlet. Solved element-wise by bisection on the air flow, which is
+    capped at ``design_air_flow`` where the target cannot be reached, and
+    is zero (fan off) where the inlet water is already at or below target.
+    """
+    c, n = characteristic
+    T_w_in, T_w_out, T_a_in, W_a_in, m_water = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (T_w_in, T_w_out, T_a_in, W_a_in, m_water)
+        )
+    )
+    h_a_in = psychro.enthalpy(T_a_in, W_a_in)
+
+    def residual(m_air):
+        LG = m_water / m_air
+        return merkelNTU(T_w_in, T_w_out, h_a_in, LG, cp_w, P) - c * LG ** (-n)
+
+    lo = np.full(T_w_in.shape, _MIN_AIR_FRACTION * design_air_flow)
+    hi = np.full(T_w_in.shape, float(design_air_flow))
+    m_air = bisect(residual, lo, hi, xtol=1e-6 * design_air_flow)
+
+    # unbracketed: target out of reach at full speed, or met at minimum speed
+    m_air = np.where(np.isnan(m_air), np.where(residual(hi) > 0, hi, lo), m_air)
+    return np.where(T_w_in > T_w_out, m_air, 0.0)
@@ -1,4 +1,19 @@
+from .curve_fan import *
+from .curve_pump import *
+from .curves import *
+from .energy_integrator import *
 from .fan import *
+from .fan_array import *
 from .pump import *
+from .pump_array import *
 
-__all__ = fan.__all__ + pump.__all__
+__all__ = (
+    curve_fan.__all__
+    + curve_pump.__all__
+    + curves.__all__
+    + energy_integrator.__all__
+    + fan.__all__
+    + fan_array.__all__
+    + pump.__all__
+    + pump_array.__all__
+)
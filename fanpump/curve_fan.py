@@ -0,0 +1,28 @@
+import numpy as np
+from pyfluids import HumidAir
+
+from .curves import PerformanceCurve, SystemCurve, _CurveMachine
+
+__all__ = ["CurveFan"]
+
+
+class CurveFan(_CurveMachine):
+    """
+    Variable-speed fan on a pressure curve [Pa]. Unlike Fan, the pressure
+    rise and efficiency follow the curve at the operating point instead of
+    a fixed delta_P and 0.5 efficiency.
+    """
+
+    def __init__(
+        self,
+        air: HumidAir | float | np.ndarray,  # or density [kg/m3]
+        curve: PerformanceCurve,
+        system: SystemCurve,
+        volume_flow: float | np.ndarray = None,  # m3/s
+        speed: float | np.ndarray = None,
+    ):
+        density = air.density if isinstance(air, HumidAir) else air
+        super().__init__(density, curve, system, volume_flow, speed)
+
+    def _hydraulicPower(self) -> np.ndarray:
+        return self.volume_flow * self.head
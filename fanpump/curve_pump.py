@@ -0,0 +1,32 @@
+import numpy as np
+from pyfluids import Fluid
+from solution import Solution
+
+from .curves import PerformanceCurve, SystemCurve, _CurveMachine
+
+__all__ = ["CurvePump"]
+
+
+class CurvePump(_CurveMachine):
+    """
+    Variable-speed pump on a head curve [m]. Unlike Pump, the fluid density
+    sets the mass flow and shaft power, and the efficiency follows the
+    curve at the operating point. The curve is taken as the water curve:
+    only the density comes from the fluid, without a viscosity correction
+    (e.g. HI 9.6.7) for viscous solutions.
+    """
+
+    def __init__(
+        self,
+        fluid: Fluid | Solution | float | np.ndarray,  # or density [kg/m3]
+        curve: PerformanceCurve,
+        system: SystemCurve,
+        volume_flow: float | np.ndarray = None,  # m3/s
+        speed: float | np.ndarray = None,
+    ):
+        density = fluid.density if isinstance(fluid, (Fluid, Solution)) else fluid
+        super().__init__(density, curve, system, volume_flow, speed)
+        self.__g = 9.80665
+
+    def _hydraulicPower(self) -> np.ndarray:
+        return self.density * self.__g * self.volume_flow * self.head
@@ -0,0 +1,189 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+__all__ = ["PerformanceCurve", "SystemCurve"]
+
+
+class SystemCurve:
+    """Quadratic system curve H = static_head + resistance * Q^2, Q [m3/s]."""
+
+    def __init__(self, static_head: float, resistance: float):
+        self.__static_head: float = static_head
+        self.__resistance: float = resistance
+
+    @property
+    def static_head(self) -> float:
+        return self.__static_head
+
+    @property
+    def resistance(self) -> float:
+        return self.__resistance
+
+    def head(self, Q: float | np.ndarray) -> float | np.ndarray:
+        return self.__static_head + self.__resistance * np.asarray(Q) ** 2
+
+
+class PerformanceCurve:
+    """
+    Pump or fan curve at rated speed, quadratic in the volume flow Q [m3/s]:
+
+        H(Q)   = a + b Q + c Q^2
+        eta(Q) = e0 + e1 Q + e2 Q^2
+
+    H is the head [m] of a pump or the pressure rise [Pa] of a fan; the
+    system curve has to use the same unit. At a speed ratio s the affinity
+    laws give H(Q, s) = a s^2 + b s Q + c Q^2 and eta(Q, s) = eta(Q / s).
+    """
+
+    def __init__(
+        self,
+        head_coefficients: tuple[float, float, float],
+        efficiency_coefficients: tuple[float, float, float],
+    ):
+        self.__head_coefficients: tuple[float, float, float] = tuple(head_coefficients)
+        self.__efficiency_coefficients: tuple[float, float, float] = tuple(
+            efficiency_coefficients
+        )
+
+    @property
+    def head_coefficients(self) -> tuple[float, float, float]:
+        return self.__head_coefficients
+
+    @property
+    def efficiency_coefficients(self) -> tuple[float, float, float]:
+        return self.__efficiency_coefficients
+
+    def head(
+        self, Q: float | np.ndarray, speed: float | np.ndarray = 1
+    ) -> float | np.ndarray:
+        a, b, c = self.__head_coefficients
+        Q, s = np.asarray(Q), np.asarray(speed)
+        return a * s**2 + b * s * Q + c * Q**2
+
+    def efficiency(
+        self, Q: float | np.ndarray, speed: float | np.ndarray = 1
+    ) -> float | np.ndarray:
+        e0, e1, e2 = self.__efficiency_coefficients
+        Q_rated = np.asarray(Q) / np.asarray(speed)
+        return e0 + e1 * Q_rated + e2 * Q_rated**2
+
+    def operatingFlow(
+        self, system: SystemCurve, speed: float | np.ndarray = 1
+    ) -> np.ndarray:
+        """
+        Flow [m3/s] where the curve at ``speed`` meets the system curve, in
+        closed form. Zero where the shut-off head is below the static head.
+        """
+        a, b, c = self.__head_coefficients
+        s = np.asarray(speed, dtype=float)
+
+        # (c - k) Q^2 + b s Q + (a s^2 - H0) = 0, positive root
+        A = c - system.resistance
+        B = b * s
+        C = a * s**2 - system.static_head
+        root = np.sqrt(np.maximum(B**2 - 4 * A * C, 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Q = 2 * C / (root - B)
+        return np.where(C > 0, Q, 0.0)
+
+    def speedForFlow(self, system: SystemCurve, Q: float | np.ndarray) -> np.ndarray:
+        """Speed ratio at which the curve delivers ``Q`` [m3/s] against the
+        system curve, in closed form."""
+        a, b, c = self.__head_coefficients
+        Q = np.asarray(Q, dtype=float)
+
+        # a s^2 + b Q s + (c Q^2 - H_sys) = 0, positive root
+        B = b * Q
+        C = c * Q**2 - system.head(Q)
+        return (-B + np.sqrt(B**2 - 4 * a * C)) / (2 * a)
+
+
+class _CurveMachine(ABC):
+    """
+    Operating point of a PerformanceCurve on a SystemCurve, either at given
+    speed ratios or at given volume flow set points (exactly one of them).
+    """
+
+    def __init__(
+        self,
+        density: float | np.ndarray,  # kg/m3
+        curve: PerformanceCurve,
+        system: SystemCurve,
+        volume_flow: float | np.ndarray = None,  # m3/s
+        speed: float | np.ndarray = None,
+    ):
+        if (volume_flow is None) == (speed is None):
+            raise ValueError("Give exactly one of volume_flow and speed")
+
+        self.__density: np.ndarray = np.asarray(density, dtype=float)
+        self.__curve: PerformanceCurve = curve
+        self.__system: SystemCurve = system
+
+        self.__volume_flow: np.ndarray = (
+            None if volume_flow is None else np.asarray(volume_flow, dtype=float)
+        )
+        self.__speed: np.ndarray = (
+            None if speed is None else np.asarray(speed, dtype=float)
+        )
+        self.__head: np.ndarray = None
+        self.__efficiency: np.ndarray = None
+        self.__work: np.ndarray = None
+
+    @property
+    def curve(self) -> PerformanceCurve:
+        return self.__curve
+
+    @property
+    def system(self) -> SystemCurve:
+        return self.__system
+
+    @property
+    def density(self) -> np.ndarray:
+        """[kg/m3]"""
+        return self.__density
+
+    @property
+    def volume_flow(self) -> np.ndarray:
+        """[m3/s]"""
+        if self.__volume_flow is None:
+            self.__volume_flow = self.__curve.operatingFlow(self.__system, self.__speed)
+        return self.__volume_flow
+
+    @property
+    def speed(self) -> np.ndarray:
+        """Speed ratio to the rated speed."""
+        if self.__speed is None:
+            self.__speed = self.__curve.speedForFlow(self.__system, self.__volume_flow)
+        return self.__speed
+
+    @property
+    def mass_flow(self) -> np.ndarray:
+        """[kg/s]"""
+        return self.__density * self.volume_flow
+
+    @property
+    def head(self) -> np.ndarray:
+        """Head [m] or pressure rise [Pa], in the unit of the curve."""
+        if self.__head is None:
+            self.__head = self.__system.head(self.volume_flow)
+        return self.__head
+
+    @property
+    def efficiency(self) -> np.ndarray:
+        if self.__efficiency is None:
+            self.__efficiency = self.__curve.efficiency(self.volume_flow, self.speed)
+        return self.__efficiency
+
+    @property
+    def work(self) -> np.ndarray:
+        """[kW]"""
+        if self.__work is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                work = self._hydraulicPower() / self.efficiency / 1e3
+            self.__work = np.where(self.volume_flow > 0, work, 0.0)
+        return self.__work
+
+    @abstractmethod
+    def _hydraulicPower(self) -> np.ndarray:
+        """[W]"""
@@ -0,0 +1,80 @@
+import numpy as np
+
+__all__ = ["EnergyIntegrator", "monthOfHour"]
+
+# cumulative hours at the start of each month of a non-leap year
+_MONTH_START_HOURS = 24 * np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+
+def monthOfHour(hour: int | np.ndarray) -> np.ndarray:
+    """Month (1-12) of an hour of a non-leap year (0-8759)."""
+    hour = np.asarray(hour) % 8760
+    return np.searchsorted(_MONTH_START_HOURS, hour, side="right")
+
+
+class EnergyIntegrator:
+    """
+    Running energy totals of power columns, per component and per month.
+
+    Power columns [kW] are fed chunk by chunk with ``update``; each chunk is
+    reduced to twelve monthly sums immediately, so a year of data never has
+    to be kept in memory.
+    """
+
+    def __init__(self, time_step: float = 3600):
+        self.__time_step: float = time_step  # s, duration of one sample
+        self.__monthly: dict[str, np.ndarray] = {}
+        self.__samples: int = 0
+
+    @property
+    def time_step(self) -> float:
+        """[s]"""
+        return self.__time_step
+
+    @property
+    def samples(self) -> int:
+        return self.__samples
+
+    @property
+    def components(self) -> list[str]:
+        return list(self.__monthly)
+
+    @property
+    def monthly(self) -> dict[str, np.ndarray]:
+        """Energy of each component per month, index 0 = January [kWh]."""
+        return {name: energy.copy() for name, energy in self.__monthly.items()}
+
+    @property
+    def total(self) -> dict[str, float]:
+        """Energy of each component [kWh]."""
+        return {name: float(energy.sum()) for name, energy in self.__monthly.items()}
+
+    @property
+    def monthly_total(self) -> np.ndarray:
+        """Energy of all components per month [kWh]."""
+        return sum(self.__monthly.values(), np.zeros(12))
+
+    def update(self, month: int | np.ndarray, **power: np.ndarray):
+        """
+        Add one chunk. ``month`` (1-12) labels every sample of the chunk and
+        each keyword is a component power column [kW] of the same length.
+        Components missing from a chunk count as zero power.
+        """
+        month = np.asarray(month, dtype=int)
+        kWh_per_kW = self.__time_step / 3600
+
+        n = 0
+        for name, column in power.items():
+            column, month_idx = np.broadcast_arrays(
+                np.asarray(column, dtype=float), month - 1
+            )
+            energy = np.bincount(
+                month_idx.ravel(), weights=column.ravel() * kWh_per_kW, minlength=12
+            )
+            self.__monthly[name] = self.__monthly.get(name, np.zeros(12)) + energy
+            n = max(n, column.size)
+        self.__samples += n
+
+    def clear(self):
+        self.__monthly.clear()
+        self.__samples = 0
@@ -1,6 +1,23 @@
+import numpy as np
 from pyfluids import HumidAir, InputHumidAir
 
-__all__ = ["Fan"]
+__all__ = ["Fan", "partLoadFraction"]
+
+
+# lower root of the part-load cubic
+_PLR_MIN = 0.00839
+
+
+def partLoadFraction(plr):
+    """
+    ASHRAE 90.1 G3 Method 2 fan part-load curve, floats or arrays. Only
+    the low end is clamped: the cubic is negative below PLR ~0.0084 and
+    returns zero there. Larger PLR values are left to the cubic.
+    """
+    fraction = -0.0013 + 0.1470 * plr + 0.9506 * plr**2 - 0.0998 * plr**3
+    if np.ndim(fraction):
+        return np.where(np.asarray(plr) < _PLR_MIN, 0.0, fraction)
+    return 0.0 if plr < _PLR_MIN else fraction
 
 
 class Fan:
@@ -57,7 +74,7 @@ class Fan:
         plr = self.PLR
 
         # ASHRAE 90.1 G3 Method 2 部分負載曲線
-        frac = -0.0013 + 0.1470 * plr + 0.9506 * plr**2 - 0.0998 * plr**3
+        frac = partLoadFraction(plr)
 
         # 實際軸功率 (kW)
         self.__actual_work = Pd * frac
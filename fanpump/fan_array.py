@@ -0,0 +1,68 @@
+import numpy as np
+
+from .fan import partLoadFraction
+
+__all__ = ["FanArray"]
+
+
+class FanArray:
+    """
+    Column-wise counterpart of Fan: one element per fan or per time step.
+    Same design work and ASHRAE 90.1 part-load curve as Fan; elements with
+    no air flow draw no power.
+    """
+
+    def __init__(
+        self,
+        air_density: float | np.ndarray,  # kg/m3
+        design_mass_flow: float | np.ndarray,  # kg/s
+        actual_mass_flow: float | np.ndarray,  # kg/s
+        delta_P: float | np.ndarray,  # Pa
+        fan_eff: float = 0.5,
+    ):
+        (
+            self.__air_density,
+            self.__design_mass_flow,
+            self.__actual_mass_flow,
+            self.__delta_P,
+        ) = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (air_density, design_mass_flow, actual_mass_flow, delta_P)
+            )
+        )
+        self.__fan_eff: float = fan_eff
+
+        self.__design_work: np.ndarray = None
+        self.__actual_work: np.ndarray = None
+        self.__PLR: np.ndarray = None
+
+    @property
+    def size(self) -> int:
+        return self.__design_mass_flow.size
+
+    @property
+    def design_work(self) -> np.ndarray:
+        """[kW]"""
+        if self.__design_work is None:
+            volumetric_flow_rate = self.__design_mass_flow / self.__air_density
+            self.__design_work = (
+                volumetric_flow_rate * self.__delta_P / self.__fan_eff / 1e3
+            )
+        return self.__design_work
+
+    @property
+    def actual_work(self) -> np.ndarray:
+        """[kW]"""
+        if self.__actual_work is None:
+            plr = self.PLR
+            self.__actual_work = np.where(
+                plr > 0, self.design_work * partLoadFraction(plr), 0.0
+            )
+        return self.__actual_work
+
+    @property
+    def PLR(self) -> np.ndarray:
+        if self.__PLR is None:
+            self.__PLR = self.__actual_mass_flow / self.__design_mass_flow
+        return self.__PLR
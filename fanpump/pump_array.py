@@ -0,0 +1,33 @@
+import numpy as np
+
+__all__ = ["PumpArray"]
+
+
+class PumpArray:
+    """Column-wise counterpart of Pump: one element per pump or per time step."""
+
+    def __init__(
+        self,
+        mass_flow: float | np.ndarray,  # kg/s
+        head: float | np.ndarray,  # m
+        pump_eff: float | np.ndarray = 0.6,
+    ):
+        self.__mass_flow, self.__head, self.__pump_eff = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in (mass_flow, head, pump_eff))
+        )
+        self.__g = 9.80665
+
+        self.__work: np.ndarray = None
+
+    @property
+    def size(self) -> int:
+        return self.__mass_flow.size
+
+    @property
+    def work(self) -> np.ndarray:
+        """[kW]"""
+        if self.__work is None:
+            self.__work = (
+                self.__mass_flow * self.__g * self.__head / self.__pump_eff / 1e3
+            )
+        return self.__work
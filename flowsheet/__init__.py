@@ -0,0 +1,5 @@
+from .flowsheet import *
+from .stream import *
+from .unit import *
+
+__all__ = flowsheet.__all__ + stream.__all__ + unit.__all__
@@ -0,0 +1,258 @@
+import numpy as np
+
+from solver import Acceleration, FixedPointResult, fixedPoint
+
+from .stream import Stream
+from .unit import Unit
+
+__all__ = ["Flowsheet"]
+
+
+class Flowsheet:
+    """
+    Plant assembled from Units (nodes) and Streams (edges), solved as a
+    whole instead of through a hand-written loop per configuration.
+
+    Recycle loops are broken automatically: a depth-first search from the
+    units in insertion order marks every edge that closes a cycle as a
+    tear stream, and the remaining graph gives the calculation order. The
+    tear streams' state vectors are then solved as x = g(x), one pass over
+    the order per evaluation, with Broyden's quasi-Newton method by default.
+    A torn edge needs a starting stream, given by ``guess`` in connect;
+    adding the units in flow order keeps the tears on the recycle edges.
+    """
+
+    def __init__(
+        self,
+        tol: float = 1e-9,  # absolute and relative, on the tear vectors
+        max_iter: int = 100,
+        acceleration: Acceleration = Acceleration.broyden,
+        mixing: float = 1.0,
+    ):
+        self.__tol: float = tol
+        self.__max_iter: int = max_iter
+        self.__acceleration: Acceleration = Acceleration(acceleration)
+        self.__mixing: float = mixing
+
+        self.__units: dict[str, Unit] = {}
+        self.__feeds: dict[tuple[str, str], Stream] = {}
+        # (target, inlet) -> (source, outlet)
+        self.__links: dict[tuple[str, str], tuple[str, str]] = {}
+        self.__guesses: dict[tuple[str, str], Stream] = {}
+
+        self.__order: list[str] = None
+        self.__tears: list[tuple[str, str]] = None  # (target, inlet)
+
+        self.__result: FixedPointResult = None
+        self.__components: dict[str, object] = None
+        self.__streams: dict[tuple[str, str], Stream] = None  # (unit, outlet)
+
+    def addUnit(self, unit: Unit) -> Unit:
+        if unit.name in self.__units:
+            raise ValueError(f"Unit {unit.name!r} already in the flowsheet")
+        self.__units[unit.name] = unit
+        self.__reset()
+        return unit
+
+    def feed(self, target: str, inlet: str, stream: Stream):
+        """Boundary stream into ``inlet`` of ``target``."""
+        self.__checkPort(target, inlet, "inlets")
+        self.__checkFree(target, inlet)
+        self.__feeds[(target, inlet)] = stream
+        self.__reset()
+
+    def connect(
+        self,
+        source: str,
+        outlet: str,
+        target: str,
+        inlet: str,
+        guess: Stream = None,
+    ):
+        """
+        Feed ``outlet`` of ``source`` into ``inlet`` of ``target``.
+        ``guess`` starts the iteration if the edge becomes a tear stream.
+        """
+        self.__checkPort(source, outlet, "outlets")
+        self.__checkPort(target, inlet, "inlets")
+        self.__checkFree(target, inlet)
+        self.__links[(target, inlet)] = (source, outlet)
+        if guess is not None:
+            self.__guesses[(target, inlet)] = guess
+        self.__reset()
+
+    @property
+    def order(self) -> list[str]:
+        """Unit names in calculation order."""
+        if self.__order is None:
+            self.__sequence()
+        return self.__order
+
+    @property
+    def tears(self) -> list[tuple[str, str, str, str]]:
+        """Torn edges as (source, outlet, target, inlet)."""
+        if self.__tears is None:
+            self.__sequence()
+        return [self.__links[key] + key for key in self.__tears]
+
+    @property
+    def result(self) -> FixedPointResult:
+        if self.__result is None:
+            self.solve()
+        return self.__result
+
+    @property
+    def iterations(self) -> int:
+        return self.result.iterations
+
+    @property
+    def residual(self) -> float:
+        return self.result.residual
+
+    @property
+    def work_total(self) -> float:
+        """Sum of the units' power draw [kW]."""
+        self.result
+        return sum(
+            unit.work(self.__components[name]) for name, unit in self.__units.items()
+        )
+
+    def component(self, name: str) -> object:
+        """Solved component of a unit, e.g. its LiquidDesiccantSystem."""
+        self.result
+        return self.__components[name]
+
+    def outlet(self, name: str, port: str) -> Stream:
+        self.result
+        return self.__streams[(name, port)]
+
+    def inlet(self, name: str, port: str) -> Stream:
+        self.result
+        key = (name, port)
+        return (
+            self.__feeds[key]
+            if key in self.__feeds
+            else self.__streams[self.__links[key]]
+        )
+
+    def solve(self) -> FixedPointResult:
+        for name, unit in self.__units.items():
+            for inlet in unit.inlets:
+                if (name, inlet) not in self.__feeds and (
+                    name,
+                    inlet,
+                ) not in self.__links:
+                    raise ValueError(f"Inlet {inlet!r} of {name!r} is not connected")
+
+        missing = [key for key in self.tears if key[2:] not in self.__guesses]
+        if missing:
+            raise ValueError(f"Tear streams need a guess: {missing}")
+
+        guesses = [self.__guesses[key] for key in self.__tears]
+        sizes = [guess.vector.size for guess in guesses]
+        bounds = np.cumsum([0] + sizes)
+
+        def sweep(x: np.ndarray) -> np.ndarray:
+            torn = {
+                key: guess.withVector(x[lo:hi])
+                for key, guess, lo, hi in zip(
+                    self.__tears, guesses, bounds[:-1], bounds[1:]
+                )
+            }
+            self.__pass(torn)
+            return np.concatenate(
+                [self.__streams[self.__links[key]].vector for key in self.__tears]
+                or [np.empty(0)]
+            )
+
+        x0 = np.concatenate([guess.vector for guess in guesses] or [np.empty(0)])
+        if not self.__tears:
+            sweep(x0)
+            self.__result = FixedPointResult(x0, 1, 0.0)
+            return self.__result
+
+        result = fixedPoint(
+            sweep,
+            x0,
+            atol=self.__tol,
+            rtol=self.__tol,
+            max_iter=self.__max_iter,
+            acceleration=self.__acceleration,
+            mixing=self.__mixing,
+        )
+        if not result.converged:
+            raise ValueError(
+                f"Flowsheet did not converge after {result.iterations} "
+                f"passes (residual {result.residual:.3g} x tol)"
+            )
+        self.__result = result
+        return result
+
+    def __pass(self, torn: dict[tuple[str, str], Stream]):
+        """One evaluation of every unit in order, with the tears fixed."""
+        self.__components, self.__streams = {}, {}
+        for name in self.__order:
+            unit = self.__units[name]
+            inlets = {}
+            for inlet in unit.inlets:
+                key = (name, inlet)
+                if key in self.__feeds:
+                    inlets[inlet] = self.__feeds[key]
+                elif key in torn:
+                    inlets[inlet] = torn[key]
+                else:
+                    inlets[inlet] = self.__streams[self.__links[key]]
+
+            component, outlets = unit.evaluate(inlets)
+            self.__components[name] = component
+            for outlet, stream in outlets.items():
+                self.__streams[(name, outlet)] = stream
+
+    def __sequence(self):
+        """
+        Depth-first search from the units in insertion order; edges back
+        to a unit still on the search path are torn, the reverse postorder
+        is the calculation order.
+        """
+        downstream: dict[str, list[tuple[str, str]]] = {
+            name: [] for name in self.__units
+        }
+        for (target, inlet), (source, _) in self.__links.items():
+            downstream[source].append((target, inlet))
+
+        state = dict.fromkeys(self.__units, 0)  # 0 new, 1 on path, 2 done
+        postorder, tears = [], []
+
+        def visit(name: str):
+            state[name] = 1
+            for target, inlet in downstream[name]:
+                if state[target] == 1:
+                    tears.append((target, inlet))
+                elif state[target] == 0:
+                    visit(target)
+            state[name] = 2
+            postorder.append(name)
+
+        for name in self.__units:
+            if state[name] == 0:
+                visit(name)
+
+        self.__order = postorder[::-1]
+        self.__tears = tears
+
+    def __checkPort(self, name: str, port: str, side: str):
+        if name not in self.__units:
+            raise ValueError(f"Unknown unit: {name!r}")
+        if port not in getattr(self.__units[name], side):
+            raise ValueError(f"Unit {name!r} has no {side[:-1]} {port!r}")
+
+    def __checkFree(self, target: str, inlet: str):
+        if (target, inlet) in self.__feeds or (target, inlet) in self.__links:
+            raise ValueError(f"Inlet {inlet!r} of {target!r} already fed")
+
+    def __reset(self):
+        self.__order = None
+        self.__tears = None
+        self.__result = None
+        self.__components = None
+        self.__streams = None
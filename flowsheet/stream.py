@@ -0,0 +1,79 @@
+import numpy as np
+from pyfluids import HumidAir, InputHumidAir, Fluid, Input
+from solution import Solution, InputSolution
+
+__all__ = ["Stream"]
+
+
+class Stream:
+    """
+    State on a flowsheet edge: a HumidAir, Fluid or Solution with its mass
+    flow [kg/s], or a plain float for non-material couplings such as the
+    wheel moisture carried between desiccant sections.
+
+    ``vector`` packs the state into the floats a tear solver iterates on:
+
+        HumidAir  [h (J/kg), W (kg/kg), m]
+        Fluid     [T (C), m]
+        Solution  [T (K), m X (salt flow, kg/s), m]
+        float     [value]
+
+    and ``withVector`` rebuilds a stream of the same kind from them,
+    keeping the pressure (and solution type) of this one. Carrying the salt
+    flow rather than X keeps the salt inventory of a solution loop, which
+    every unit conserves, out of the tear solver's steps.
+    """
+
+    def __init__(self, fluid: HumidAir | Fluid | Solution | float, m: float = 0.0):
+        self.__fluid: HumidAir | Fluid | Solution | float = fluid
+        self.__m: float = m
+
+    @property
+    def fluid(self) -> HumidAir | Fluid | Solution | float:
+        return self.__fluid
+
+    @property
+    def m(self) -> float:
+        """[kg/s]"""
+        return self.__m
+
+    @property
+    def vector(self) -> np.ndarray:
+        fluid = self.__fluid
+        if isinstance(fluid, HumidAir):
+            return np.array([fluid.enthalpy, fluid.humidity, self.__m])
+        elif isinstance(fluid, Fluid):
+            return np.array([fluid.temperature, self.__m])
+        elif isinstance(fluid, Solution):
+            return np.array(
+                [fluid.temperature, self.__m * fluid.concentration, self.__m]
+            )
+        return np.array([float(fluid)])
+
+    def withVector(self, vector: np.ndarray) -> "Stream":
+        fluid = self.__fluid
+        if isinstance(fluid, HumidAir):
+            h, w, m = vector
+            return Stream(
+                HumidAir().with_state(
+                    InputHumidAir.pressure(fluid.pressure),
+                    InputHumidAir.enthalpy(h),
+                    InputHumidAir.humidity(w),
+                ),
+                m,
+            )
+        elif isinstance(fluid, Fluid):
+            T, m = vector
+            return Stream(
+                fluid.with_state(Input.pressure(fluid.pressure), Input.temperature(T)),
+                m,
+            )
+        elif isinstance(fluid, Solution):
+            T, salt, m = vector
+            return Stream(
+                fluid.withState(
+                    InputSolution.temperature(T), InputSolution.concentration(salt / m)
+                ),
+                m,
+            )
+        return Stream(float(vector[0]), self.__m)
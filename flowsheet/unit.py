@@ -0,0 +1,176 @@
+from typing import Callable
+
+from pyfluids import HumidAir
+
+from coolingtower import CoolingTowerCache
+from fanpump import Fan, Pump
+from ldac import ContactorGeometry, LiquidDesiccantSystem
+from sdac import SolidDesiccantSystem
+from solution import Solution
+from wasteheat import HeatExchanger, HeatPump, Refrigerant
+
+from .stream import Stream
+
+__all__ = ["Unit"]
+
+
+class Unit:
+    """
+    Flowsheet node. ``model`` builds the component from the inlet streams
+    (by port name) and returns it with its outlet streams; ``work`` gives
+    the component's power draw [kW] for Flowsheet.work_total.
+
+    The classmethods wrap the package components with their usual ports.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        inlets: tuple[str, ...],
+        outlets: tuple[str, ...],
+        model: Callable[[dict[str, Stream]], tuple[object, dict[str, Stream]]],
+        work: Callable[[object], float] = None,
+    ):
+        self.__name: str = name
+        self.__inlets: tuple[str, ...] = tuple(inlets)
+        self.__outlets: tuple[str, ...] = tuple(outlets)
+        self.__model = model
+        self.__work = work
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def inlets(self) -> tuple[str, ...]:
+        return self.__inlets
+
+    @property
+    def outlets(self) -> tuple[str, ...]:
+        return self.__outlets
+
+    def evaluate(self, inlets: dict[str, Stream]) -> tuple[object, dict[str, Stream]]:
+        return self.__model(inlets)
+
+    def work(self, component: object) -> float:
+        return 0.0 if self.__work is None else self.__work(component)
+
+    @classmethod
+    def liquidDesiccant(
+        cls,
+        name: str,
+        solution_type: Solution,
+        dehumid_eff: float | ContactorGeometry = 0.64,
+    ) -> "Unit":
+        """Absorber or regenerator. Ports: air, solution."""
+
+        def model(inlets: dict[str, Stream]):
+            air, sol = inlets["air"], inlets["solution"]
+            lds = LiquidDesiccantSystem(
+                solution_type, air.fluid, sol.fluid, air.m, sol.m, dehumid_eff
+            )
+            return lds, {
+                "air": Stream(lds.outlet_air, air.m),
+                "solution": Stream(lds.outlet_solution, lds.m_s_out),
+            }
+
+        return cls(name, ("air", "solution"), ("air", "solution"), model)
+
+    @classmethod
+    def solidDesiccant(cls, name: str, func_percentage: float = 0.5) -> "Unit":
+        """
+        Adsorption or regeneration section of a wheel. Ports: air and
+        moisture, the wheel moisture [kg/kg] entering / leaving the section.
+        """
+
+        def model(inlets: dict[str, Stream]):
+            air = inlets["air"]
+            sds = SolidDesiccantSystem(
+                air.fluid, air.m, inlets["moisture"].fluid, func_percentage
+            )
+            return sds, {
+                "air": Stream(sds.outlet_air, air.m),
+                "moisture": Stream(sds.current_moisture),
+            }
+
+        return cls(name, ("air", "moisture"), ("air", "moisture"), model)
+
+    @classmethod
+    def heatExchanger(cls, name: str, efficiency_rate: float = 0.80) -> "Unit":
+        """Ports: hot, cold."""
+
+        def model(inlets: dict[str, Stream]):
+            hot, cold = inlets["hot"], inlets["cold"]
+            hx = HeatExchanger(hot.fluid, hot.m, cold.fluid, cold.m, efficiency_rate)
+            return hx, {
+                "hot": Stream(hx.outlet_hot, hot.m),
+                "cold": Stream(hx.outlet_cold, cold.m),
+            }
+
+        return cls(name, ("hot", "cold"), ("hot", "cold"), model)
+
+    @classmethod
+    def heatPump(cls, name: str, refrigerant: Refrigerant, m_ref: float) -> "Unit":
+        """Ports: evap, cond. Work is the compressor power."""
+
+        def model(inlets: dict[str, Stream]):
+            evap, cond = inlets["evap"], inlets["cond"]
+            hp = HeatPump(refrigerant, m_ref, evap.fluid, evap.m, cond.fluid, cond.m)
+            return hp, {
+                "evap": Stream(hp.outlet_evap, evap.m),
+                "cond": Stream(hp.outlet_cond, cond.m),
+            }
+
+        return cls(
+            name, ("evap", "cond"), ("evap", "cond"), model, lambda hp: hp.W_comp
+        )
+
+    @classmethod
+    def coolingTower(
+        cls,
+        name: str,
+        LG_or_outlet_air: float | HumidAir,
+        target_temp: float = None,
+        cache: CoolingTowerCache = None,
+    ) -> "Unit":
+        """Ports: air, water. Goes through the shared CoolingTowerCache."""
+        cache = CoolingTowerCache.shared() if cache is None else cache
+
+        def model(inlets: dict[str, Stream]):
+            air, water = inlets["air"], inlets["water"]
+            tower = cache.get(
+                air.fluid,
+                water.fluid.temperature,
+                water.m,
+                LG_or_outlet_air,
+                target_temp,
+            )
+            return tower, {
+                "air": Stream(tower.outlet_air, air.m),
+                "water": Stream(tower.outlet_water, water.m),
+            }
+
+        return cls(name, ("air", "water"), ("air", "water"), model, lambda ct: ct.work)
+
+    @classmethod
+    def fan(
+        cls, name: str, delta_P: float = 50, design_mass_flow: float = None
+    ) -> "Unit":
+        """Pass-through from in to out; work is the fan power."""
+
+        def model(inlets: dict[str, Stream]):
+            air = inlets["in"]
+            design = air.m if design_mass_flow is None else design_mass_flow
+            return Fan(air.fluid, design, air.m, delta_P), {"out": air}
+
+        return cls(name, ("in",), ("out",), model, lambda fan: fan.actual_work)
+
+    @classmethod
+    def pump(cls, name: str, head: float, pump_eff: float = 0.6) -> "Unit":
+        """Pass-through from in to out; work is the pump power."""
+
+        def model(inlets: dict[str, Stream]):
+            fluid = inlets["in"]
+            return Pump(fluid.fluid, fluid.m, head, pump_eff), {"out": fluid}
+
+        return cls(name, ("in",), ("out",), model, lambda pump: pump.work)
@@ -1,3 +1,19 @@
+from .contactor import *
+from .equations import *
+from .liquid_desiccant_array import *
+from .liquid_desiccant_kernel import *
 from .liquid_desiccant_system import *
+from .packed_bed import *
+from .storage_loop import *
+from .storage_tank import *
 
-__all__ = liquid_desiccant_system.__all__
+__all__ = (
+    contactor.__all__
+    + equations.__all__
+    + liquid_desiccant_array.__all__
+    + liquid_desiccant_kernel.__all__
+    + liquid_desiccant_system.__all__
+    + packed_bed.__all__
+    + storage_loop.__all__
+    + storage_tank.__all__
+)
@@ -0,0 +1,192 @@
+from collections import OrderedDict
+
+import numpy as np
+from solution import Solution, SolutionList
+
+from .equations import CP_AIR, waterEvapEnthalpy
+
+__all__ = ["ContactorGeometry", "counterflowEffectiveness"]
+
+
+def counterflowEffectiveness(NTU, capacity_ratio):
+    """
+    Counterflow effectiveness on the air side for an air-side NTU and
+    capacity ratio C = C_air / C_solution, including the C = 1 limit.
+    """
+    NTU, C = np.broadcast_arrays(
+        np.asarray(NTU, dtype=float), np.asarray(capacity_ratio, dtype=float)
+    )
+    balanced = np.isclose(C, 1.0)
+    C_safe = np.where(balanced, 0.0, C)  # keeps the unused branch finite
+
+    decay = np.exp(-NTU * (1 - C_safe))
+    eff = np.where(balanced, NTU / (1 + NTU), (1 - decay) / (1 - C_safe * decay))
+    return eff if eff.ndim else float(eff)
+
+
+class ContactorGeometry:
+    """
+    Packed liquid-desiccant contactor described by its bed geometry and a
+    mass-transfer correlation, as an alternative to a constant dehumid_eff.
+
+    The mass-transfer coefficient follows h_D = c * G_a^n_a * G_s^n_s with
+    the air and solution mass fluxes G [kg/m2s], which gives the bed
+
+        NTU = h_D * a * A * Z / m_a
+
+    The humidity effectiveness is the counterflow effectiveness at this NTU
+    with the capacity ratio m_a * c_sat / (m_s * cp_s), where
+    c_sat = cp_a + hfg * dw_eq/dT is the effective heat capacity of air in
+    equilibrium with the solution. The temperature effectiveness uses
+    Le * NTU and m_a * cp_a / (m_s * cp_s).
+
+    The default correlation constants give the 0.64 used by the systems at
+    1 kg/s air, 2 kg/s solution and ILD at 30 C and 0.8. Scalar evaluations
+    are memoized on the instance, keyed by rounded flows and solution
+    state; arrays are evaluated in one vectorized pass. Geometries compare
+    and hash by their parameters, so equal beds share warm-start entries.
+    """
+
+    def __init__(
+        self,
+        height: float = 0.6,  # m, packing depth in the air flow direction
+        face_area: float = 1.0,  # m2, cross-section of the air flow
+        specific_area: float = 210,  # m2/m3, wetted packing surface
+        coefficient: float = 0.0089,  # h_D at unit fluxes [kg/m2s]
+        air_exponent: float = 0.8,
+        solution_exponent: float = 0.2,
+        lewis: float = 1.0,
+        maxsize: int = 4096,
+        decimals: int = 6,
+    ):
+        self.__height: float = height
+        self.__face_area: float = face_area
+        self.__specific_area: float = specific_area
+        self.__coefficient: float = coefficient
+        self.__air_exponent: float = air_exponent
+        self.__solution_exponent: float = solution_exponent
+        self.__lewis: float = lewis
+
+        self.__maxsize: int = maxsize
+        self.__decimals: int = decimals
+        self.__cache: OrderedDict[tuple, tuple[float, float]] = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def height(self) -> float:
+        """[m]"""
+        return self.__height
+
+    @property
+    def face_area(self) -> float:
+        """[m2]"""
+        return self.__face_area
+
+    @property
+    def specific_area(self) -> float:
+        """[m2/m3]"""
+        return self.__specific_area
+
+    @property
+    def lewis(self) -> float:
+        return self.__lewis
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __key(self) -> tuple:
+        """Defining parameters, the memo settings only round the flows"""
+        return (
+            self.__height,
+            self.__face_area,
+            self.__specific_area,
+            self.__coefficient,
+            self.__air_exponent,
+            self.__solution_exponent,
+            self.__lewis,
+            self.__decimals,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ContactorGeometry):
+            return NotImplemented
+        return self.__key() == other.__key()
+
+    def __hash__(self) -> int:
+        return hash(self.__key())
+
+    def clear(self):
+        self.__cache.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def NTU(self, air_mass_flow, solution_mass_flow):
+        """Mass-transfer NTU of the whole bed."""
+        m_a = np.asarray(air_mass_flow, dtype=float)
+        m_s = np.asarray(solution_mass_flow, dtype=float)
+        G_a = m_a / self.__face_area
+        G_s = m_s / self.__face_area
+
+        h_D = (
+            self.__coefficient
+            * G_a**self.__air_exponent
+            * G_s**self.__solution_exponent
+        )
+        return h_D * self.__specific_area * self.__face_area * self.__height / m_a
+
+    def effectiveness(
+        self,
+        solution_type: Solution | SolutionList,
+        air_mass_flow,  # kg/s
+        solution_mass_flow,  # kg/s
+        solution_temperature,  # K
+        solution_concentration,
+    ):
+        """(humidity effectiveness, temperature effectiveness)"""
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        sol_cls = SolutionList(solution_type).sol_cls
+
+        args = (
+            air_mass_flow,
+            solution_mass_flow,
+            solution_temperature,
+            solution_concentration,
+        )
+        if any(np.ndim(value) for value in args):
+            return self.__effectiveness(sol_cls, *args)
+
+        key = (sol_cls,) + tuple(round(float(v), self.__decimals) for v in args)
+        eff = self.__cache.get(key)
+        if eff is not None:
+            self.__hits += 1
+            self.__cache.move_to_end(key)
+            return eff
+
+        self.__misses += 1
+        eff = self.__effectiveness(sol_cls, *args)
+        self.__cache[key] = eff
+        if len(self.__cache) > self.__maxsize:
+            self.__cache.popitem(last=False)
+        return eff
+
+    def __effectiveness(self, sol_cls: type, m_a, m_s, T_s, X_s):
+        m_a, m_s, T_s, X_s = (
+            np.asarray(value, dtype=float) for value in (m_a, m_s, T_s, X_s)
+        )
+        NTU = self.NTU(m_a, m_s)
+        C_s = m_s * sol_cls.specificHeat(T_s, X_s)  # kW/K
+
+        # slope of the equilibrium humidity, central difference over 1 K
+        dw_dT = sol_cls.humidity(T_s + 0.5, X_s) - sol_cls.humidity(T_s - 0.5, X_s)
+        c_sat = CP_AIR + waterEvapEnthalpy(T_s) * dw_dT
+
+        mass = counterflowEffectiveness(NTU, m_a * c_sat / C_s)
+        heat = counterflowEffectiveness(self.__lewis * NTU, m_a * CP_AIR / C_s)
+        return mass, heat
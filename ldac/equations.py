@@ -0,0 +1,97 @@
+"""
+Absorber / regenerator balance equations shared by LiquidDesiccantSystem
+and LiquidDesiccantArray. Every function works on floats or numpy arrays.
+
+Air temperatures are in C, solution temperatures in K, air enthalpy in
+kJ/kg, solution enthalpy in kJ/kg and heat in kW, as in
+LiquidDesiccantSystem.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from CoolProp.CoolProp import PropsSI
+
+__all__ = [
+    "CP_AIR",
+    "outletAirHumidity",
+    "requiredEquilibriumHumidity",
+    "equilibriumAirTemperature",
+    "waterEvapEnthalpy",
+    "sensibleHeatTransfer",
+    "outletAirEnthalpy",
+    "outletSolutionConcentration",
+    "outletSolutionEnthalpy",
+]
+
+CP_AIR = 1.006  # kJ/kg/K
+
+
+def outletAirHumidity(w_in, w_eq, dehumid_eff):
+    """Outlet air humidity [kg/kg] approaching the solution equilibrium."""
+    return w_in - (w_in - w_eq) * dehumid_eff
+
+
+def requiredEquilibriumHumidity(w_in, w_out, dehumid_eff):
+    """Solution equilibrium humidity [kg/kg] giving outlet air humidity
+    w_out, the inverse of outletAirHumidity."""
+    return w_in - (w_in - w_out) / dehumid_eff
+
+
+def equilibriumAirTemperature(T_a_in, T_s_in, dehumid_eff):
+    """Outlet air temperature [C] approaching the solution temperature [K]."""
+    return T_a_in - (T_a_in - (T_s_in - 273.15)) * dehumid_eff
+
+
+def waterEvapEnthalpy(T):
+    """Latent heat of water at T [K] [kJ/kg]."""
+    if np.ndim(T) == 0:
+        return _waterEvapEnthalpy(float(T))
+
+    # time-series columns often hold one set point, evaluate it only once
+    T_unique, inverse = np.unique(np.asarray(T, dtype=float), return_inverse=True)
+    if T_unique.size == 1:
+        return np.full(np.shape(T), _waterEvapEnthalpy(float(T_unique[0])))
+    # otherwise interpolate a fine table (~1e-10 relative), CoolProp off it
+    T_grid, hfg_grid = _waterEvapEnthalpyTable()
+    hfg = np.interp(T_unique, T_grid, hfg_grid)
+    outside = (T_unique < T_grid[0]) | (T_unique > T_grid[-1])
+    if np.any(outside):
+        hfg[outside] = _coolPropEvapEnthalpy(T_unique[outside])
+    return hfg[inverse].reshape(np.shape(T))  # kJ/kg
+
+
+def _coolPropEvapEnthalpy(T):
+    h_f = PropsSI("H", "T", T, "Q", 0, "water") / 1e3  # Convert to kJ/kg
+    h_g = PropsSI("H", "T", T, "Q", 1, "water") / 1e3  # Convert to kJ/kg
+    return h_g - h_f  # kJ/kg
+
+
+@lru_cache(maxsize=1)
+def _waterEvapEnthalpyTable() -> tuple[np.ndarray, np.ndarray]:
+    T_grid = np.linspace(273.16, 423.16, 7501)  # 0.02 K steps
+    return T_grid, _coolPropEvapEnthalpy(T_grid)
+
+
+@lru_cache(maxsize=4096)
+def _waterEvapEnthalpy(T: float) -> float:
+    return float(_coolPropEvapEnthalpy(T))
+
+
+def sensibleHeatTransfer(m_da, T_a_in, T_eq):
+    """Sensible heat from the air to the solution [kW]."""
+    return m_da * CP_AIR * (T_a_in - T_eq)  # kW
+
+
+def outletAirEnthalpy(m_da, h_a_in, m_dehumid, hfg, Q_heat):
+    """Outlet air enthalpy [kJ/kg]."""
+    return (m_da * h_a_in - m_dehumid * hfg - Q_heat) / m_da
+
+
+def outletSolutionConcentration(m_s_in, x_in, m_s_out):
+    return m_s_in * x_in / m_s_out
+
+
+def outletSolutionEnthalpy(m_s_in, h_s_in, m_s_out, m_dehumid, hfg, Q_heat):
+    """Outlet solution enthalpy [kJ/kg]."""
+    return (m_s_in * h_s_in + m_dehumid * hfg + Q_heat) / m_s_out
@@ -0,0 +1,274 @@
+import numpy as np
+from solution import Solution, SolutionList
+
+import psychro
+
+from .equations import (
+    outletAirHumidity,
+    equilibriumAirTemperature,
+    waterEvapEnthalpy,
+    sensibleHeatTransfer,
+    outletAirEnthalpy,
+    outletSolutionConcentration,
+    outletSolutionEnthalpy,
+)
+
+__all__ = ["LiquidDesiccantArray"]
+
+
+class LiquidDesiccantArray:
+    """
+    Column-wise counterpart of LiquidDesiccantSystem for an absorber or
+    regenerator: one element per air/solution pair, evaluated with the same
+    equations in one vectorized pass.
+
+    Air is given as temperature [C] and humidity [kg/kg], optionally with
+    its enthalpy [J/kg] (otherwise from psychro.enthalpy); solution as
+    temperature [K] and concentration, optionally with its enthalpy [kJ/kg].
+    Points where the solution vapour pressure reaches the atmospheric
+    pressure come out as NaN instead of raising.
+    """
+
+    def __init__(
+        self,
+        solution_type: Solution | SolutionList,
+        inlet_air_temperature: np.ndarray,  # C
+        inlet_air_humidity: np.ndarray,  # kg/kg
+        inlet_solution_temperature: np.ndarray,  # K
+        inlet_solution_concentration: np.ndarray,
+        air_mass_flow: np.ndarray,  # kg/s
+        solution_mass_flow: np.ndarray,  # kg/s
+        dehumid_eff: np.ndarray,  # efficiency of dehumidifier (0-1)
+        inlet_air_enthalpy: np.ndarray = None,  # J/kg
+        inlet_solution_enthalpy: np.ndarray = None,  # kJ/kg
+        heat_eff: np.ndarray = None,  # temperature effectiveness, default dehumid_eff
+    ):
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        self.__sol_cls = SolutionList(solution_type).sol_cls
+
+        (
+            self.__T_a_in,
+            self.__w_a_in,
+            self.__T_s_in,
+            self.__x_s_in,
+            self.__m_a_in,
+            self.__m_s_in,
+            self.__dehumid_eff,
+            self.__heat_eff,
+            h_a_in,
+            h_s_in,
+        ) = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    inlet_air_temperature,
+                    inlet_air_humidity,
+                    inlet_solution_temperature,
+                    inlet_solution_concentration,
+                    air_mass_flow,
+                    solution_mass_flow,
+                    dehumid_eff,
+                    dehumid_eff if heat_eff is None else heat_eff,
+                    np.nan if inlet_air_enthalpy is None else inlet_air_enthalpy,
+                    (
+                        np.nan
+                        if inlet_solution_enthalpy is None
+                        else inlet_solution_enthalpy
+                    ),
+                )
+            )
+        )
+
+        self.__h_a_in: np.ndarray = (
+            psychro.enthalpy(self.__T_a_in, self.__w_a_in)
+            if inlet_air_enthalpy is None
+            else h_a_in
+        )
+        self.__h_s_in: np.ndarray = (
+            self.__sol_cls.enthalpy(self.__T_s_in, self.__x_s_in)
+            if inlet_solution_enthalpy is None
+            else h_s_in
+        )
+
+        self.__m_da: np.ndarray = None
+        self.__w_eq: np.ndarray = None
+        self.__hfg: np.ndarray = None
+        self.__Q_heat: np.ndarray = None
+        self.__w_dehumid: np.ndarray = None
+        self.__m_dehumid: np.ndarray = None
+
+        self.__h_a_out: np.ndarray = None
+        self.__x_s_out: np.ndarray = None
+        self.__h_s_out: np.ndarray = None
+        self.__T_s_out: np.ndarray = None
+
+    @property
+    def size(self) -> int:
+        return self.__T_a_in.size
+
+    @property
+    def inlet_air_temperature(self) -> np.ndarray:
+        """[C]"""
+        return self.__T_a_in
+
+    @property
+    def inlet_air_humidity(self) -> np.ndarray:
+        """[kg/kg]"""
+        return self.__w_a_in
+
+    @property
+    def inlet_air_enthalpy(self) -> np.ndarray:
+        """[J/kg]"""
+        return self.__h_a_in
+
+    @property
+    def inlet_solution_temperature(self) -> np.ndarray:
+        """[K]"""
+        return self.__T_s_in
+
+    @property
+    def inlet_solution_concentration(self) -> np.ndarray:
+        return self.__x_s_in
+
+    @property
+    def inlet_solution_enthalpy(self) -> np.ndarray:
+        """[kJ/kg]"""
+        return self.__h_s_in
+
+    @property
+    def inlet_solution_humidity(self) -> np.ndarray:
+        """Equilibrium humidity of the inlet solution [kg/kg]."""
+        if self.__w_eq is None:
+            Pv = self.__sol_cls.partialPressure(self.__T_s_in, self.__x_s_in)
+            w_eq = self.__sol_cls.humidity(self.__T_s_in, self.__x_s_in)
+            self.__w_eq = np.where(Pv < 101325, w_eq, np.nan)
+        return self.__w_eq
+
+    @property
+    def outlet_air_humidity(self) -> np.ndarray:
+        """[kg/kg]"""
+        return self.__w_a_in - self.dehumid_humidity
+
+    @property
+    def outlet_air_enthalpy(self) -> np.ndarray:
+        """[J/kg]"""
+        if self.__h_a_out is None:
+            self.__h_a_out = (
+                outletAirEnthalpy(
+                    self.m_a,
+                    self.__h_a_in / 1e3,
+                    self.dehumid_mass_flow,
+                    self.__latentHeat(),
+                    self.sensible_heat,
+                )
+                * 1e3
+            )
+        return self.__h_a_out
+
+    @property
+    def outlet_air_temperature(self) -> np.ndarray:
+        """[C]"""
+        return psychro.temperature(self.outlet_air_enthalpy, self.outlet_air_humidity)
+
+    @property
+    def outlet_solution_concentration(self) -> np.ndarray:
+        if self.__x_s_out is None:
+            self.__x_s_out = outletSolutionConcentration(
+                self.__m_s_in, self.__x_s_in, self.m_s_out
+            )
+        return self.__x_s_out
+
+    @property
+    def outlet_solution_enthalpy(self) -> np.ndarray:
+        """[kJ/kg]"""
+        if self.__h_s_out is None:
+            self.__h_s_out = outletSolutionEnthalpy(
+                self.__m_s_in,
+                self.__h_s_in,
+                self.m_s_out,
+                self.dehumid_mass_flow,
+                self.__latentHeat(),
+                self.sensible_heat,
+            )
+        return self.__h_s_out
+
+    @property
+    def outlet_solution_temperature(self) -> np.ndarray:
+        """[K]"""
+        if self.__T_s_out is None:
+            self.__T_s_out = self.__sol_cls.temperature(
+                self.outlet_solution_enthalpy, self.outlet_solution_concentration
+            )
+        return self.__T_s_out
+
+    @property
+    def m_a_in(self) -> np.ndarray:
+        return self.__m_a_in
+
+    @property
+    def m_a_out(self) -> np.ndarray:
+        return self.__m_a_in - self.dehumid_mass_flow
+
+    @property
+    def m_a(self) -> np.ndarray:
+        """Dry air mass flow [kg/s]."""
+        if self.__m_da is None:
+            self.__m_da = self.__m_a_in / (1 + self.__w_a_in)
+        return self.__m_da
+
+    @property
+    def m_s_in(self) -> np.ndarray:
+        return self.__m_s_in
+
+    @property
+    def m_s_out(self) -> np.ndarray:
+        return self.__m_s_in + self.dehumid_mass_flow
+
+    @property
+    def dehumid_humidity(self) -> np.ndarray:
+        if self.__w_dehumid is None:
+            self.__setDehimidProperties()
+        return self.__w_dehumid
+
+    @property
+    def dehumid_mass_flow(self) -> np.ndarray:
+        if self.__m_dehumid is None:
+            self.__setDehimidProperties()
+        return self.__m_dehumid
+
+    @property
+    def sensible_heat(self) -> np.ndarray:
+        """Sensible heat from the air to the solution [kW]."""
+        if self.__Q_heat is None:
+            T_eq = equilibriumAirTemperature(
+                self.__T_a_in, self.__T_s_in, self.__heat_eff
+            )
+            self.__Q_heat = sensibleHeatTransfer(self.m_a, self.__T_a_in, T_eq)
+        return self.__Q_heat
+
+    @property
+    def table(self) -> dict[str, np.ndarray]:
+        """All outputs as columns."""
+        return {
+            "T_air_out": self.outlet_air_temperature,
+            "W_air_out": self.outlet_air_humidity,
+            "h_air_out": self.outlet_air_enthalpy,
+            "T_solution_out": self.outlet_solution_temperature,
+            "X_solution_out": self.outlet_solution_concentration,
+            "h_solution_out": self.outlet_solution_enthalpy,
+            "m_dehumid": self.dehumid_mass_flow,
+            "Q_sensible": self.sensible_heat,
+        }
+
+    def __setDehimidProperties(self):
+        w_a_out = outletAirHumidity(
+            self.__w_a_in, self.inlet_solution_humidity, self.__dehumid_eff
+        )
+        self.__w_dehumid = self.__w_a_in - w_a_out
+        self.__m_dehumid = self.m_a * self.__w_dehumid
+
+    def __latentHeat(self) -> np.ndarray:
+        if self.__hfg is None:
+            self.__hfg = waterEvapEnthalpy(self.__T_s_in)  # kJ/kg
+        return self.__hfg
@@ -0,0 +1,125 @@
+from typing import NamedTuple
+
+from pyfluids import HumidAir, Fluid
+from solution import Solution, SolutionList
+from wasteheat import HeatExchangerArray
+
+from .contactor import ContactorGeometry
+from .liquid_desiccant_array import LiquidDesiccantArray
+
+__all__ = ["LiquidDesiccantKernel", "SolutionState"]
+
+
+class SolutionState(NamedTuple):
+    """Solution stream as plain floats."""
+
+    T: float  # K
+    X: float
+    m: float  # kg/s
+
+
+class LiquidDesiccantKernel:
+    """
+    The steps of the liquid-desiccant system loops on SolutionState records
+    instead of Solution, LiquidDesiccantSystem and HeatExchanger objects:
+    the contactor through LiquidDesiccantArray and the heat exchangers
+    through HeatExchangerArray, so the equations are the components' own.
+
+    The inlet air, its flow and the contactor effectiveness are fixed per
+    kernel, as they are per system. A solve iterates with these functions
+    and builds the component objects once, at the converged state.
+    """
+
+    def __init__(
+        self,
+        solution_type: Solution | SolutionList,
+        air: HumidAir,
+        m_air: float,  # kg/s
+        dehumid_eff: float | ContactorGeometry,
+    ):
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        self.__sol_list: SolutionList = SolutionList(solution_type)
+        self.__sol_cls: type = self.__sol_list.sol_cls
+
+        self.__T_a: float = air.temperature
+        self.__w_a: float = air.humidity
+        self.__h_a: float = air.enthalpy
+        self.__m_air: float = m_air
+        self.__dehumid_eff: float | ContactorGeometry = dehumid_eff
+
+    def contact(self, inlet: SolutionState) -> SolutionState:
+        """Outlet solution of an absorber / regenerator with the kernel air."""
+        if isinstance(self.__dehumid_eff, ContactorGeometry):
+            mass_eff, heat_eff = self.__dehumid_eff.effectiveness(
+                self.__sol_list, self.__m_air, inlet.m, inlet.T, inlet.X
+            )
+        else:
+            mass_eff = heat_eff = self.__dehumid_eff
+
+        lds = LiquidDesiccantArray(
+            self.__sol_list,
+            self.__T_a,
+            self.__w_a,
+            inlet.T,
+            inlet.X,
+            self.__m_air,
+            inlet.m,
+            mass_eff,
+            self.__h_a,
+            heat_eff=heat_eff,
+        )
+        return SolutionState(
+            float(lds.outlet_solution_temperature),
+            float(lds.outlet_solution_concentration),
+            float(lds.m_s_out),
+        )
+
+    def enthalpy(self, state: SolutionState) -> float:
+        """[kJ/kg]"""
+        return float(self.__sol_cls.enthalpy(state.T, state.X))
+
+    def withEnthalpy(self, enthalpy: float, X: float, m: float) -> SolutionState:
+        """State at ``enthalpy`` [kJ/kg], as Solution.withState would give."""
+        return SolutionState(float(self.__sol_cls.temperature(enthalpy, X)), X, m)
+
+    def exchange(
+        self, hot: SolutionState, cold: SolutionState, efficiency_rate: float = 0.80
+    ) -> tuple[SolutionState, SolutionState]:
+        """Solution-to-solution HeatExchanger, (hot outlet, cold outlet)."""
+        hx = HeatExchangerArray(
+            self.__cp(hot),
+            hot.T - 273.15,
+            hot.m,
+            self.__cp(cold),
+            cold.T - 273.15,
+            cold.m,
+            efficiency_rate,
+        )
+        return (
+            SolutionState(float(hx.T_hot_out) + 273.15, hot.X, hot.m),
+            SolutionState(float(hx.T_cold_out) + 273.15, cold.X, cold.m),
+        )
+
+    def exchangeWater(
+        self,
+        state: SolutionState,
+        water: Fluid,
+        m_water: float,  # kg/s
+        efficiency_rate: float = 0.80,
+    ) -> SolutionState:
+        """Solution side of a HeatExchanger with water, heating or cooling."""
+        hx = HeatExchangerArray(
+            self.__cp(state),
+            state.T - 273.15,
+            state.m,
+            water.specific_heat,
+            water.temperature,
+            m_water,
+            efficiency_rate,
+        )
+        return SolutionState(float(hx.T_hot_out) + 273.15, state.X, state.m)
+
+    def __cp(self, state: SolutionState) -> float:
+        """[J/kg/K], as HeatExchanger takes it from Solution.specific_heat"""
+        return self.__sol_cls.specificHeat(state.T, state.X) * 1e3
@@ -1,6 +1,24 @@
-from solution import Solution, InputSolution
+import math
+
+import numpy as np
+from solution import Solution, InputSolution, SolutionList
 from pyfluids import HumidAir, InputHumidAir
-from CoolProp.CoolProp import PropsSI
+
+import psychro
+from solver import bisect
+
+from .equations import (
+    outletAirHumidity,
+    requiredEquilibriumHumidity,
+    equilibriumAirTemperature,
+    waterEvapEnthalpy,
+    sensibleHeatTransfer,
+    outletAirEnthalpy,
+    outletSolutionConcentration,
+    outletSolutionEnthalpy,
+)
+from .contactor import ContactorGeometry
+from .packed_bed import ContactorModel, PackedBed
 
 __all__ = ["LiquidDesiccantSystem"]
 
@@ -13,18 +31,55 @@ class LiquidDesiccantSystem:
         inlet_solution: Solution,
         air_mass_flow: float,  # kg/s
         solution_mass_flow: float,  # kg/s
-        dehumid_eff: float,  # efficiency of dehumidifier (0-1)
+        dehumid_eff: float | ContactorGeometry,  # efficiency of dehumidifier (0-1)
+        model: ContactorModel = ContactorModel.effectiveness,
+        NTU: float = None,  # packed bed, default -ln(1 - dehumid_eff)
+        lewis: float = None,  # packed bed, default 1 or the contactor's
+        cells: int = 50,  # packed bed
     ):
         self.__solution_type = solution_type
         self.__inlet_air = inlet_air
         self.__inlet_solution = inlet_solution
         self.__m_a_in = air_mass_flow
         self.__m_s_in = solution_mass_flow
-        self.__dehumid_eff = dehumid_eff
+
+        # a contactor geometry replaces the constant by flow-dependent
+        # humidity and temperature effectivenesses
+        self.__contactor: ContactorGeometry = None
+        if isinstance(dehumid_eff, ContactorGeometry):
+            self.__contactor = dehumid_eff
+            dehumid_eff, heat_eff = dehumid_eff.effectiveness(
+                solution_type,
+                air_mass_flow,
+                solution_mass_flow,
+                inlet_solution.temperature,
+                inlet_solution.concentration,
+            )
+            if NTU is None:
+                NTU = float(self.__contactor.NTU(air_mass_flow, solution_mass_flow))
+            if lewis is None:
+                lewis = self.__contactor.lewis
+        else:
+            heat_eff = dehumid_eff
+        self.__dehumid_eff: float = dehumid_eff
+        self.__heat_eff: float = heat_eff
+
+        self.__model: ContactorModel = ContactorModel(model)
+        self.__NTU: float = NTU  # packed bed only, default set with the bed
+        self.__lewis: float = 1.0 if lewis is None else lewis
+        self.__cells: int = cells
+        self.__bed: PackedBed = None
 
         self.__outlet_air: HumidAir = None
         self.__outlet_solution: Solution = None
 
+        # raw outlet states, the objects above are only built when read
+        self.__h_a_out: float = None  # J/kg
+        self.__h_s_out: float = None  # kJ/kg
+        self.__x_s_out: float = None
+        self.__Q_heat: float = None  # kW
+        self.__hfg: float = None  # kJ/kg
+
         self.__m_da: float = None
         self.__m_a_out: float = None
         self.__m_s_out: float = None
@@ -32,6 +87,124 @@ class LiquidDesiccantSystem:
         self.__w_dehumid: float = None
         self.__m_dehumid: float = None
 
+    # Inverse design: solve an inlet quantity for a target outlet humidity
+    # ratio or dew point, element-wise over arrays of targets. Targets that
+    # cannot be reached within ``bounds`` come out as NaN.
+
+    @staticmethod
+    def requiredConcentration(
+        solution_type: Solution | SolutionList,
+        inlet_air_humidity: float | np.ndarray,  # kg/kg
+        solution_temperature: float | np.ndarray,  # K
+        dehumid_eff: float | np.ndarray,
+        target_humidity: float | np.ndarray = None,  # kg/kg
+        target_dew_point: float | np.ndarray = None,  # C
+        bounds: tuple[float, float] = (0.5, 0.99),
+    ) -> np.ndarray:
+        """Inlet solution concentration for the target outlet air."""
+        sol_cls = LiquidDesiccantSystem.__solutionClass(solution_type)
+        w_eq = requiredEquilibriumHumidity(
+            inlet_air_humidity,
+            LiquidDesiccantSystem.__targetHumidity(target_humidity, target_dew_point),
+            dehumid_eff,
+        )
+        w_eq, T = np.broadcast_arrays(w_eq, np.asarray(solution_temperature, float))
+
+        return bisect(
+            lambda X: sol_cls.humidity(T, X) - w_eq,
+            np.full(w_eq.shape, bounds[0]),
+            np.full(w_eq.shape, bounds[1]),
+            xtol=1e-8,
+        )
+
+    @staticmethod
+    def requiredSolutionTemperature(
+        solution_type: Solution | SolutionList,
+        inlet_air_humidity: float | np.ndarray,  # kg/kg
+        solution_concentration: float | np.ndarray,
+        dehumid_eff: float | np.ndarray,
+        target_humidity: float | np.ndarray = None,  # kg/kg
+        target_dew_point: float | np.ndarray = None,  # C
+        bounds: tuple[float, float] = (273.15, 353.15),  # K
+    ) -> np.ndarray:
+        """Inlet solution temperature [K] for the target outlet air."""
+        sol_cls = LiquidDesiccantSystem.__solutionClass(solution_type)
+        w_eq = requiredEquilibriumHumidity(
+            inlet_air_humidity,
+            LiquidDesiccantSystem.__targetHumidity(target_humidity, target_dew_point),
+            dehumid_eff,
+        )
+        w_eq, X = np.broadcast_arrays(w_eq, np.asarray(solution_concentration, float))
+
+        return bisect(
+            lambda T: sol_cls.humidity(T, X) - w_eq,
+            np.full(w_eq.shape, bounds[0]),
+            np.full(w_eq.shape, bounds[1]),
+            xtol=1e-6,
+        )
+
+    @staticmethod
+    def requiredSolutionFlow(
+        solution_type: Solution,
+        inlet_air: HumidAir,
+        inlet_solution: Solution,
+        air_mass_flow: float,  # kg/s
+        NTU: float,
+        target_humidity: float | np.ndarray = None,  # kg/kg
+        target_dew_point: float | np.ndarray = None,  # C
+        lewis: float = 1.0,
+        cells: int = 50,
+        bounds: tuple[float, float] = (0.5, 10),  # kg/s
+    ) -> np.ndarray:
+        """
+        Solution mass flow [kg/s] for the target outlet air. The
+        effectiveness model does not depend on the solution flow, so this
+        solves the packed-bed model, one bed per target in each bisection
+        step. Targets whose bed diverges during the search come out as NaN.
+        """
+        w_target = np.asarray(
+            LiquidDesiccantSystem.__targetHumidity(target_humidity, target_dew_point),
+            dtype=float,
+        )
+
+        def residual(m_s: np.ndarray) -> np.ndarray:
+            bed = PackedBed(
+                solution_type,
+                inlet_air.temperature,
+                inlet_air.humidity,
+                inlet_air.enthalpy / 1e3,
+                inlet_solution.temperature,
+                inlet_solution.concentration,
+                inlet_solution.enthalpy,
+                air_mass_flow,
+                np.ravel(m_s),
+                NTU,
+                lewis,
+                cells,
+            )
+            return bed.outlet_air_humidity.reshape(np.shape(m_s)) - w_target
+
+        return bisect(
+            residual,
+            np.full(w_target.shape, bounds[0]),
+            np.full(w_target.shape, bounds[1]),
+            xtol=1e-4,
+        )
+
+    @staticmethod
+    def __targetHumidity(target_humidity, target_dew_point):
+        if (target_humidity is None) == (target_dew_point is None):
+            raise ValueError("Give exactly one of target_humidity and target_dew_point")
+        if target_humidity is None:
+            return psychro.humidityFromDewPoint(np.asarray(target_dew_point, float))
+        return np.asarray(target_humidity, dtype=float)
+
+    @staticmethod
+    def __solutionClass(solution_type: Solution | SolutionList) -> type:
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        return SolutionList(solution_type).sol_cls
+
     @property
     def inlet_air(self) -> HumidAir:
         return self.__inlet_air
@@ -40,6 +213,48 @@ class LiquidDesiccantSystem:
     def inlet_solution(self) -> Solution:
         return self.__inlet_solution
 
+    @property
+    def contactor(self) -> ContactorGeometry | None:
+        return self.__contactor
+
+    @property
+    def dehumid_eff(self) -> float:
+        """Humidity effectiveness of the effectiveness model."""
+        return self.__dehumid_eff
+
+    @property
+    def heat_eff(self) -> float:
+        """Temperature effectiveness, dehumid_eff unless from a contactor."""
+        return self.__heat_eff
+
+    @property
+    def model(self) -> ContactorModel:
+        return self.__model
+
+    @property
+    def bed(self) -> PackedBed | None:
+        """Axial profiles of the packed-bed model, None otherwise."""
+        if self.__bed is None and self.__model is ContactorModel.packed_bed:
+            if self.__NTU is None:
+                # a perfect contactor (dehumid_eff = 1) has infinite NTU
+                eff = self.__dehumid_eff
+                self.__NTU = -math.log(1 - eff) if eff < 1 else math.inf
+            self.__bed = PackedBed(
+                self.__solution_type,
+                self.__inlet_air.temperature,
+                self.__inlet_air.humidity,
+                self.__inlet_air.enthalpy / 1e3,
+                self.__inlet_solution.temperature,
+                self.__inlet_solution.concentration,
+                self.__inlet_solution.enthalpy,
+                self.__m_a_in,
+                self.__m_s_in,
+                self.__NTU,
+                self.__lewis,
+                self.__cells,
+            )
+        return self.__bed
+
     @property
     def outlet_air(self) -> HumidAir:
         if self.__outlet_air is None:
@@ -52,6 +267,34 @@ class LiquidDesiccantSystem:
             self.__setOutletSolution()
         return self.__outlet_solution
 
+    @property
+    def outlet_air_humidity(self) -> float:
+        """[kg/kg], without building outlet_air."""
+        return self.__inlet_air.humidity - self.dehumid_humidity
+
+    @property
+    def outlet_air_enthalpy(self) -> float:
+        """[J/kg], without building outlet_air."""
+        if self.__h_a_out is None:
+            self.__setOutletAirEnthalpy()
+        return self.__h_a_out
+
+    @property
+    def outlet_solution_enthalpy(self) -> float:
+        """[kJ/kg], without building outlet_solution."""
+        if self.__h_s_out is None:
+            self.__setOutletSolutionEnthalpy()
+        return self.__h_s_out
+
+    @property
+    def outlet_solution_concentration(self) -> float:
+        """Without building outlet_solution."""
+        if self.__x_s_out is None:
+            self.__x_s_out = outletSolutionConcentration(
+                self.__m_s_in, self.inlet_solution.concentration, self.m_s_out
+            )
+        return self.__x_s_out
+
     @property
     def m_a_in(self):
         return self.__m_a_in
@@ -91,62 +334,81 @@ class LiquidDesiccantSystem:
         return self.__m_dehumid
 
     def __setOutletAir(self):
-        if self.__w_dehumid is None or self.__m_dehumid is None:
-            self.__setDehimidProperties()
-
-        w_a_out = self.__inlet_air.humidity - self.__w_dehumid
-
-        Q_heat = self.__sensibleHeatTransfer()  # kW
-        hfg = self.__waterEvapEnthalpy(self.__inlet_solution.temperature)  # kJ/kg
-        h_a_out = (
-            self.m_a * self.__inlet_air.enthalpy / 1e3
-            - self.dehumid_mass_flow * hfg
-            - Q_heat
-        ) / self.m_a
-
         self.__outlet_air = HumidAir().with_state(
             InputHumidAir.pressure(101325),
-            InputHumidAir.enthalpy(h_a_out * 1e3),  # Convert kJ/kg to J/kg
-            InputHumidAir.humidity(w_a_out),
+            InputHumidAir.enthalpy(self.outlet_air_enthalpy),
+            InputHumidAir.humidity(self.outlet_air_humidity),
         )
 
+    def __setOutletAirEnthalpy(self):
+        if self.__model is ContactorModel.packed_bed:
+            h_a_out = self.bed.outlet_air_enthalpy
+        else:
+            Q_heat, hfg = self.__heatTransfer()  # kW, kJ/kg
+            h_a_out = outletAirEnthalpy(
+                self.m_a,
+                self.__inlet_air.enthalpy / 1e3,
+                self.dehumid_mass_flow,
+                hfg,
+                Q_heat,
+            )
+
+        self.__h_a_out = h_a_out * 1e3  # Convert kJ/kg to J/kg
+
     def __setDehimidProperties(self):
         w_a_out = self.__dehumidAirHumidity()
         self.__w_dehumid = self.__inlet_air.humidity - w_a_out
         self.__m_dehumid = self.m_a * self.__w_dehumid
 
     def __setOutletSolution(self):
-        x_out = self.__m_s_in * self.inlet_solution.concentration / self.m_s_out
-
-        Q_heat = self.__sensibleHeatTransfer()  # kW
-        hfg = self.__waterEvapEnthalpy(self.__inlet_solution.temperature)  # kJ/kg
-        h_s_out = (
-            self.__m_s_in * self.__inlet_solution.enthalpy
-            + self.dehumid_mass_flow * hfg
-            + Q_heat
-        ) / self.m_s_out
-
         self.__outlet_solution = self.__solution_type.withState(
-            InputSolution.concentration(x_out), InputSolution.enthalpy(h_s_out)
+            InputSolution.concentration(self.outlet_solution_concentration),
+            InputSolution.enthalpy(self.outlet_solution_enthalpy),
         )
 
+    def __setOutletSolutionEnthalpy(self):
+        if self.__model is ContactorModel.packed_bed:
+            h_s_out = self.bed.outlet_solution_enthalpy
+        else:
+            Q_heat, hfg = self.__heatTransfer()  # kW, kJ/kg
+            h_s_out = outletSolutionEnthalpy(
+                self.__m_s_in,
+                self.__inlet_solution.enthalpy,
+                self.m_s_out,
+                self.dehumid_mass_flow,
+                hfg,
+                Q_heat,
+            )
+
+        self.__h_s_out = h_s_out
+
     def __dehumidAirHumidity(self) -> float:
-        w_in = self.__inlet_air.humidity
-        w_eq = self.__inlet_solution.humidity
-        return w_in - (w_in - w_eq) * self.__dehumid_eff
+        if self.__model is ContactorModel.packed_bed:
+            return self.bed.outlet_air_humidity
+        return outletAirHumidity(
+            self.__inlet_air.humidity,
+            self.__inlet_solution.humidity,
+            self.__dehumid_eff,
+        )
 
     def __dehumidAirTemperature(self) -> float:
-        T_a_in = self.__inlet_air.temperature
-        T_s_in = self.__inlet_solution.temperature.toC
-        return T_a_in - (T_a_in - T_s_in) * self.__dehumid_eff
+        return equilibriumAirTemperature(
+            self.__inlet_air.temperature,
+            self.__inlet_solution.temperature,
+            self.__heat_eff,
+        )
+
+    def __heatTransfer(self) -> tuple[float, float]:
+        """Sensible heat [kW] and latent heat of water [kJ/kg], shared by
+        the outlet air and outlet solution balances."""
+        if self.__Q_heat is None:
+            self.__Q_heat = self.__sensibleHeatTransfer()
+            self.__hfg = self.__waterEvapEnthalpy(self.__inlet_solution.temperature)
+        return self.__Q_heat, self.__hfg
 
     def __waterEvapEnthalpy(self, T):
-        # Calculate the enthalpy of water at given temperature and pressure
-        h_f = PropsSI("H", "T", T, "Q", 0, "water") / 1e3  # Convert to kJ/kg
-        h_g = PropsSI("H", "T", T, "Q", 1, "water") / 1e3  # Convert to kJ/kg
-        return h_g - h_f  # kJ/kg
+        return waterEvapEnthalpy(T)  # kJ/kg
 
     def __sensibleHeatTransfer(self):
         T_eq = self.__dehumidAirTemperature()
-        cp_air = 1.006  # kJ/kg/K
-        return self.m_a * cp_air * (self.__inlet_air.temperature - T_eq)  # kW
+        return sensibleHeatTransfer(self.m_a, self.__inlet_air.temperature, T_eq)  # kW
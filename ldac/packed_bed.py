@@ -0,0 +1,344 @@
+from enum import Enum
+
+import numpy as np
+from solution import Solution, SolutionList
+
+from solver import fixedPoint
+
+from .equations import CP_AIR, waterEvapEnthalpy
+
+__all__ = ["ContactorModel", "PackedBed"]
+
+
+class ContactorModel(Enum):
+    effectiveness = "effectiveness"  # single dehumid_eff on humidity/temperature
+    packed_bed = "packed_bed"  # discretized counterflow packed bed
+
+
+class PackedBed:
+    """
+    Counterflow packed bed split into ``cells`` axial cells. Air enters at
+    cell 0, solution at the last cell.
+
+    Each cell applies the LiquidDesiccantSystem equations with the local
+    cell effectiveness 1 - exp(-NTU / cells) for mass and
+    1 - exp(-Le NTU / cells) for heat. The air approaches the equilibrium
+    humidity and temperature of the solution entering that cell. The
+    absorbed water releases its latent heat into the film. With one cell
+    and NTU = -ln(1 - eff) this reduces to LiquidDesiccantSystem.
+
+    Both air profiles are linear recurrences and the solution balances are
+    cumulative sums, so each sweep is a few vectorized NumPy operations.
+    Sweeps repeat until the solution temperature profile converges.
+
+    The inlet states, flows, NTU and Lewis number may also be arrays: the
+    beds are then solved column-wise in one batch, the profiles gain a
+    leading axis and beds that diverge or do not converge come out as NaN
+    instead of raising.
+
+    Units follow LiquidDesiccantSystem: air in C and kJ/kg, solution in K
+    and kJ/kg.
+    """
+
+    def __init__(
+        self,
+        solution_type: Solution | SolutionList,
+        T_a_in: float | np.ndarray,  # C
+        w_a_in: float | np.ndarray,  # kg/kg
+        h_a_in: float | np.ndarray,  # kJ/kg
+        T_s_in: float | np.ndarray,  # K
+        x_s_in: float | np.ndarray,
+        h_s_in: float | np.ndarray,  # kJ/kg
+        air_mass_flow: float | np.ndarray,  # kg/s
+        solution_mass_flow: float | np.ndarray,  # kg/s
+        NTU: float | np.ndarray,  # mass-transfer NTU of the whole bed
+        lewis: float | np.ndarray = 1.0,
+        cells: int = 50,
+        tol: float = 1e-6,  # K
+        max_iter: int = 200,
+    ):
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        self.__sol_cls = SolutionList(solution_type).sol_cls
+
+        inlets = [
+            np.asarray(value, dtype=float)
+            for value in (
+                T_a_in,
+                w_a_in,
+                h_a_in,
+                T_s_in,
+                x_s_in,
+                h_s_in,
+                air_mass_flow,
+                solution_mass_flow,
+                NTU,
+                lewis,
+            )
+        ]
+        self.__batch: bool = any(value.ndim for value in inlets)
+        # one row per bed, shape (beds,)
+        (
+            self.__T_a_in,
+            self.__w_a_in,
+            self.__h_a_in,
+            self.__T_s_in,
+            self.__x_s_in,
+            self.__h_s_in,
+            m_a_in,
+            self.__m_s_in,
+            self.__NTU,
+            self.__lewis,
+        ) = (value.ravel() for value in np.broadcast_arrays(*inlets))
+        self.__m_da: np.ndarray = m_a_in / (1 + self.__w_a_in)
+
+        self.__cells: int = cells
+        self.__tol: float = tol
+        self.__max_iter: int = max_iter
+
+        self.__iterations: int = None
+        # node profiles (beds, cells + 1), index 0 = air inlet / solution outlet
+        self.__w_a: np.ndarray = None
+        self.__T_a: np.ndarray = None
+        self.__h_a: np.ndarray = None
+        self.__T_s: np.ndarray = None
+        self.__x_s: np.ndarray = None
+        self.__h_s: np.ndarray = None
+        self.__m_s: np.ndarray = None
+        self.__m_w: np.ndarray = None  # water absorbed per cell
+        self.__Q: np.ndarray = None  # sensible heat per cell
+
+    @property
+    def cells(self) -> int:
+        return self.__cells
+
+    @property
+    def NTU(self) -> float | np.ndarray:
+        return self.__bed(self.__NTU)
+
+    @property
+    def lewis(self) -> float | np.ndarray:
+        return self.__bed(self.__lewis)
+
+    @property
+    def iterations(self) -> int:
+        """Sweeps until the solution temperature profile converged."""
+        self.__profiles()
+        return self.__iterations
+
+    @property
+    def air_humidity(self) -> np.ndarray:
+        """Air humidity at the cells + 1 nodes [kg/kg]."""
+        self.__profiles()
+        return self.__bed(self.__w_a)
+
+    @property
+    def air_temperature(self) -> np.ndarray:
+        """[C]"""
+        self.__profiles()
+        return self.__bed(self.__T_a)
+
+    @property
+    def air_enthalpy(self) -> np.ndarray:
+        """[kJ/kg]"""
+        self.__profiles()
+        return self.__bed(self.__h_a)
+
+    @property
+    def solution_temperature(self) -> np.ndarray:
+        """[K]"""
+        self.__profiles()
+        return self.__bed(self.__T_s)
+
+    @property
+    def solution_concentration(self) -> np.ndarray:
+        self.__profiles()
+        return self.__bed(self.__x_s)
+
+    @property
+    def solution_enthalpy(self) -> np.ndarray:
+        """[kJ/kg]"""
+        self.__profiles()
+        return self.__bed(self.__h_s)
+
+    @property
+    def solution_mass_flow(self) -> np.ndarray:
+        """[kg/s]"""
+        self.__profiles()
+        return self.__bed(self.__m_s)
+
+    @property
+    def outlet_air_humidity(self) -> float | np.ndarray:
+        self.__profiles()
+        return self.__bed(self.__w_a[:, -1])
+
+    @property
+    def outlet_air_enthalpy(self) -> float | np.ndarray:
+        """[kJ/kg]"""
+        self.__profiles()
+        return self.__bed(self.__h_a[:, -1])
+
+    @property
+    def outlet_solution_concentration(self) -> float | np.ndarray:
+        self.__profiles()
+        return self.__bed(self.__x_s[:, 0])
+
+    @property
+    def outlet_solution_enthalpy(self) -> float | np.ndarray:
+        """[kJ/kg]"""
+        self.__profiles()
+        return self.__bed(self.__h_s[:, 0])
+
+    @property
+    def outlet_solution_temperature(self) -> float | np.ndarray:
+        """[K]"""
+        self.__profiles()
+        return self.__bed(self.__T_s[:, 0])
+
+    @property
+    def m_s_out(self) -> float | np.ndarray:
+        self.__profiles()
+        return self.__bed(self.__m_s[:, 0])
+
+    @property
+    def dehumid_mass_flow(self) -> float | np.ndarray:
+        self.__profiles()
+        return self.__bed(self.__m_w.sum(axis=1))
+
+    @property
+    def sensible_heat(self) -> float | np.ndarray:
+        """[kW]"""
+        self.__profiles()
+        return self.__bed(self.__Q.sum(axis=1))
+
+    def __bed(self, value: np.ndarray) -> float | np.ndarray:
+        """Per-bed value, unwrapped for a single bed."""
+        if self.__batch:
+            return value
+        return float(value[0]) if value.ndim == 1 else value[0]
+
+    def __profiles(self):
+        if self.__iterations is None:
+            self.__solve()
+
+    def __airSweep(
+        self, x0: np.ndarray, target: np.ndarray, eff: np.ndarray
+    ) -> np.ndarray:
+        """
+        Nodes of x[k + 1] = x[k] + eff * (target[k] - x[k]) in closed form:
+        x[k] = a^k (x0 + eff * sum_{j<k} a^-(j+1) target[j]), a = 1 - eff,
+        for every bed (row).
+        """
+        a = (1 - eff)[:, None]
+        eff = eff[:, None]
+        passing = a <= 0  # the air leaves each cell at the target
+        a = np.where(passing, 1.0, a)
+
+        k = np.arange(self.__cells + 1)
+        scaled = eff * target * a ** -(k[1:])
+        nodes = a**k * (
+            x0[:, None]
+            + np.concatenate((np.zeros((len(x0), 1)), np.cumsum(scaled, axis=1)), 1)
+        )
+        return np.where(passing, np.concatenate((x0[:, None], target), 1), nodes)
+
+    def __sweep(self, T_s: np.ndarray, x_s: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        One pass over the beds for given solution node temperatures and
+        concentrations (beds, cells + 1): air profiles, cell transfers and
+        the solution balances they imply.
+        """
+        n = self.__cells
+        eff_m = 1 - np.exp(-self.__NTU / n)
+        eff_h = 1 - np.exp(-self.__lewis * self.__NTU / n)
+        tail = np.zeros((len(T_s), 1))
+        m_da = self.__m_da[:, None]
+        m_s_in = self.__m_s_in[:, None]
+
+        # cell k meets the solution entering it from node k + 1
+        T_cell, x_cell = T_s[:, 1:], x_s[:, 1:]
+        w_eq = self.__sol_cls.humidity(T_cell, x_cell)
+        hfg = waterEvapEnthalpy(T_cell)  # kJ/kg
+
+        w_a = self.__airSweep(self.__w_a_in, w_eq, eff_m)
+        T_a = self.__airSweep(self.__T_a_in, T_cell - 273.15, eff_h)
+
+        m_w = m_da * (w_a[:, :-1] - w_a[:, 1:])
+        Q = m_da * CP_AIR * (T_a[:, :-1] - T_a[:, 1:])  # kW
+        latent_sensible = m_w * hfg + Q
+
+        # solution balances accumulated against the flow
+        m_s = m_s_in + np.concatenate(
+            (np.cumsum(m_w[:, ::-1], axis=1)[:, ::-1], tail), 1
+        )
+        H_s = m_s_in * self.__h_s_in[:, None] + np.concatenate(
+            (np.cumsum(latent_sensible[:, ::-1], axis=1)[:, ::-1], tail), 1
+        )
+        x_s = m_s_in * self.__x_s_in[:, None] / m_s
+        h_s = H_s / m_s
+
+        return {
+            "w_a": w_a,
+            "T_a": T_a,
+            "h_a": self.__h_a_in[:, None]
+            - np.concatenate((tail, np.cumsum(latent_sensible, axis=1)), 1) / m_da,
+            "T_s": self.__sol_cls.temperature(h_s, x_s),
+            "x_s": x_s,
+            "h_s": h_s,
+            "m_s": m_s,
+            "m_w": m_w,
+            "Q": Q,
+        }
+
+    def __solve(self):
+        """
+        Fixed point of the sweep in the solution profile (temperatures and
+        concentrations of the nodes the solution leaves), with Anderson
+        mixing over the last few sweeps; plain sweeps diverge at low
+        solution-to-air flow ratios. The beds are the rows of one batch.
+        """
+        n = self.__cells
+        T_in, x_in = self.__T_s_in[:, None], self.__x_s_in[:, None]
+        last = {}
+
+        def sweep(state: np.ndarray) -> np.ndarray:
+            T_s = np.concatenate((state[:, :n], T_in), 1)
+            x_s = np.concatenate((state[:, n:], x_in), 1)
+            last["profiles"] = self.__sweep(T_s, x_s)
+            return np.concatenate(
+                (last["profiles"]["T_s"][:, :-1], last["profiles"]["x_s"][:, :-1]), 1
+            )
+
+        result = fixedPoint(
+            sweep,
+            np.concatenate((np.repeat(T_in, n, 1), np.repeat(x_in, n, 1)), 1),
+            atol=np.concatenate((np.full(n, self.__tol), np.full(n, np.inf))),
+            rtol=0,
+            max_iter=self.__max_iter,
+        )
+        if not self.__batch and result.diverged[0]:
+            raise ValueError("Packed bed diverged, check the flow ratio and NTU")
+        if not self.__batch and not result.converged[0]:
+            raise ValueError(
+                "Packed bed did not converge, check the flow ratio and NTU"
+            )
+
+        # beds that did not converge have no profile
+        failed = ~result.converged[:, None]
+        profiles = {
+            key: np.where(failed, np.nan, value)
+            for key, value in last["profiles"].items()
+        }
+        self.__iterations = result.iterations
+        self.__w_a, self.__T_a, self.__h_a = (
+            profiles["w_a"],
+            profiles["T_a"],
+            profiles["h_a"],
+        )
+        self.__T_s, self.__x_s, self.__h_s, self.__m_s = (
+            profiles["T_s"],
+            profiles["x_s"],
+            profiles["h_s"],
+            profiles["m_s"],
+        )
+        self.__m_w, self.__Q = profiles["m_w"], profiles["Q"]
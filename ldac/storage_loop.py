@@ -0,0 +1,213 @@
+import numpy as np
+from solution import Solution, SolutionList
+
+from .liquid_desiccant_array import LiquidDesiccantArray
+from .storage_tank import SolutionTank
+
+__all__ = ["StorageLoop"]
+
+
+class StorageLoop:
+    """
+    Liquid-desiccant loop with a strong and a weak solution tank, for load
+    shifting studies:
+
+        strong tank -> cooler -> absorber  -> weak tank
+        weak tank   -> heater -> regenerator -> strong tank
+
+    Each time step the absorber and regenerator are evaluated at the tank
+    states from the start of the step (LiquidDesiccantArray), then both
+    tanks are advanced with SolutionTank.step. Pumps run at the design flow
+    for the part of the step their supply tank content lasts, and outputs
+    are averaged over the step; inflows become available from the next
+    step, so use ``substeps`` when tanks hold less than a step of flow.
+    The regenerator only runs in steps flagged in ``regenerate`` (e.g.
+    when waste heat is available), so absorption can run on stored strong
+    solution.
+
+    Tank states are arrays, so tank sizes or other parameters given as
+    arrays are simulated side by side as variants.
+    """
+
+    def __init__(
+        self,
+        solution_type: Solution | SolutionList,
+        strong_tank: SolutionTank,
+        weak_tank: SolutionTank,
+        absorber_air_flow: float = 1,  # kg/s
+        absorber_solution_flow: float = 2,  # kg/s
+        absorber_temperature: float = 303.15,  # K, solution after the cooler
+        regenerator_air_flow: float = 1,  # kg/s
+        regenerator_solution_flow: float = 2,  # kg/s
+        regeneration_temperature: float = 333.15,  # K, solution after heater
+        dehumid_eff: float = 0.64,
+    ):
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        self.__sol_type: SolutionList = SolutionList(solution_type)
+        self.__sol_cls = self.__sol_type.sol_cls
+
+        self.__strong: SolutionTank = strong_tank
+        self.__weak: SolutionTank = weak_tank
+
+        self.__m_a_abs: float = absorber_air_flow
+        self.__m_s_abs: float = absorber_solution_flow
+        self.__T_abs: float = absorber_temperature
+        self.__m_a_reg: float = regenerator_air_flow
+        self.__m_s_reg: float = regenerator_solution_flow
+        self.__T_reg: float = regeneration_temperature
+        self.__dehumid_eff: float = dehumid_eff
+
+    @property
+    def strong_tank(self) -> SolutionTank:
+        return self.__strong
+
+    @property
+    def weak_tank(self) -> SolutionTank:
+        return self.__weak
+
+    def run(
+        self,
+        T_air: np.ndarray,  # C, per time step
+        W_air: np.ndarray,  # kg/kg, per time step
+        regenerate: np.ndarray,  # bool, per time step
+        dehumidify: np.ndarray = None,  # bool, per time step, default always
+        dt: float = 3600,  # s
+        substeps: int = 1,
+    ) -> dict[str, np.ndarray]:
+        """
+        Simulate the time series and return columns of shape
+        (time steps, variants): absorber outlet humidity, dehumidified water
+        [kg/s], cooler and heater loads [kW] averaged over each step, and
+        both tank states at the end of each step. Steps can be split into
+        ``substeps`` for small tanks.
+        """
+        T_air = np.asarray(T_air, dtype=float)
+        W_air = np.asarray(W_air, dtype=float)
+        regenerate = np.asarray(regenerate, dtype=bool)
+        dehumidify = (
+            np.ones(T_air.shape, dtype=bool)
+            if dehumidify is None
+            else np.asarray(dehumidify, dtype=bool)
+        )
+
+        n = T_air.size
+        shape = np.shape(self.__strong.mass + self.__weak.mass)
+        columns = {
+            name: np.empty((n,) + shape)
+            for name in (
+                "W_air_out",
+                "m_dehumid",
+                "Q_cooler",
+                "Q_heater",
+                "strong_mass",
+                "strong_concentration",
+                "strong_temperature",
+                "weak_mass",
+                "weak_concentration",
+                "weak_temperature",
+            )
+        }
+
+        h = dt / substeps
+        for t in range(n):
+            sums = {
+                "W_air_out": 0.0,
+                "m_dehumid": 0.0,
+                "Q_cooler": 0.0,
+                "Q_heater": 0.0,
+            }
+            for _ in range(substeps):
+                result = self.__step(
+                    h, T_air[t], W_air[t], dehumidify[t], regenerate[t]
+                )
+                for key in sums:
+                    sums[key] = sums[key] + result[key] / substeps
+
+            for key, value in sums.items():
+                columns[key][t] = value
+            for prefix, tank in (("strong", self.__strong), ("weak", self.__weak)):
+                columns[f"{prefix}_mass"][t] = tank.mass
+                columns[f"{prefix}_concentration"][t] = tank.concentration
+                columns[f"{prefix}_temperature"][t] = tank.temperature
+
+        return columns
+
+    def __step(
+        self, dt: float, T_air: float, W_air: float, dehumidify: bool, regenerate: bool
+    ) -> dict[str, np.ndarray]:
+        strong, weak = self.__strong, self.__weak
+
+        # absorber on strong solution, regenerator on weak solution when heat
+        # is available, both evaluated at the design flows
+        h_abs = self.__sol_cls.enthalpy(self.__T_abs, strong.concentration)
+        absorber = LiquidDesiccantArray(
+            self.__sol_type,
+            T_air,
+            W_air,
+            self.__T_abs,
+            strong.concentration,
+            self.__m_a_abs,
+            self.__m_s_abs,
+            self.__dehumid_eff,
+            inlet_solution_enthalpy=h_abs,
+        )
+        h_reg = self.__sol_cls.enthalpy(self.__T_reg, weak.concentration)
+        regenerator = LiquidDesiccantArray(
+            self.__sol_type,
+            T_air,
+            W_air,
+            self.__T_reg,
+            weak.concentration,
+            self.__m_a_reg,
+            self.__m_s_reg,
+            self.__dehumid_eff,
+            inlet_solution_enthalpy=h_reg,
+        )
+
+        # run time at the design flows from the tank contents; inflows mix in
+        # at the end of the step and are drawn from the next (sub)step on
+        on_abs = self.__runTime(self.__m_s_abs, dehumidify, strong.available(dt))
+        on_reg = self.__runTime(self.__m_s_reg, regenerate, weak.available(dt))
+        m_abs = on_abs * self.__m_s_abs
+        m_reg = on_reg * self.__m_s_reg
+
+        Q_cooler = m_abs * (strong.enthalpy - h_abs)  # kW
+        Q_heater = m_reg * (h_reg - weak.enthalpy)  # kW
+
+        # outlets scale with the delivered flows
+        abs_out = self.__outflow(absorber, on_abs)
+        reg_out = self.__outflow(regenerator, on_reg)
+        strong.step(dt, [reg_out], m_abs)
+        weak.step(dt, [abs_out], m_reg)
+
+        # untreated air passes while the absorber pump is off
+        W_air_out = np.where(
+            on_abs > 0,
+            on_abs * absorber.outlet_air_humidity + (1 - on_abs) * W_air,
+            W_air,
+        )
+        return {
+            "W_air_out": W_air_out,
+            "m_dehumid": on_abs * absorber.dehumid_mass_flow,
+            "Q_cooler": Q_cooler,
+            "Q_heater": Q_heater,
+        }
+
+    @staticmethod
+    def __runTime(design: float, on: bool, available: np.ndarray) -> np.ndarray:
+        """
+        Fraction of the step a pump runs at the design flow: the
+        effectiveness model does not hold at a fraction of the design
+        solution flow, so a short tank shortens the run instead.
+        """
+        return np.where(on, np.clip(available / design, 0.0, 1.0), 0.0)
+
+    def __outflow(
+        self, contactor: LiquidDesiccantArray, run_time: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return (
+            run_time * contactor.m_s_out,
+            contactor.outlet_solution_concentration,
+            contactor.outlet_solution_enthalpy,
+        )
@@ -0,0 +1,124 @@
+import numpy as np
+from solution import Solution, SolutionList
+
+__all__ = ["SolutionTank"]
+
+
+class SolutionTank:
+    """
+    Well-mixed solution storage tank with mass, concentration and enthalpy
+    states. States are arrays, so one instance can carry several tank
+    variants (e.g. a sweep of storage sizes) through the same time steps.
+
+    ``step`` advances the balances over one time step: the outflow is drawn
+    at the state from the start of the step (the state the downstream
+    component saw), then the inflows are mixed in. With the outflow limited
+    to the tank content this conserves salt exactly and stays bounded for
+    any step size, even when an hour of flow is many times the tank
+    content. Heat loss relaxes the remaining content towards the ambient
+    temperature with the exact exponential over the step.
+    """
+
+    def __init__(
+        self,
+        solution_type: Solution | SolutionList,
+        mass: float | np.ndarray,  # kg
+        concentration: float | np.ndarray,
+        temperature: float | np.ndarray,  # K
+        UA: float | np.ndarray = 0.0,  # kW/K, heat loss coefficient
+        ambient_temperature: float = 298.15,  # K
+    ):
+        if isinstance(solution_type, Solution):
+            solution_type = solution_type.sol_list
+        self.__sol_cls = SolutionList(solution_type).sol_cls
+
+        mass, concentration, temperature, UA = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (mass, concentration, temperature, UA)
+            )
+        )
+        self.__mass: np.ndarray = mass.copy()
+        self.__concentration: np.ndarray = concentration.copy()
+        self.__enthalpy: np.ndarray = self.__sol_cls.enthalpy(
+            temperature, concentration
+        )
+        self.__UA: np.ndarray = UA
+        self.__ambient_temperature: float = ambient_temperature
+
+        self.__temperature: np.ndarray = temperature.copy()
+        self.__last_temperature: np.ndarray = self.__temperature
+
+    @property
+    def mass(self) -> np.ndarray:
+        """[kg]"""
+        return self.__mass
+
+    @property
+    def concentration(self) -> np.ndarray:
+        return self.__concentration
+
+    @property
+    def enthalpy(self) -> np.ndarray:
+        """[kJ/kg]"""
+        return self.__enthalpy
+
+    @property
+    def temperature(self) -> np.ndarray:
+        """[K]"""
+        if self.__temperature is None:
+            self.__temperature = self.__sol_cls.temperature(
+                self.__enthalpy,
+                self.__concentration,
+                T_guess=self.__last_temperature,
+            )
+            self.__last_temperature = self.__temperature
+        return self.__temperature
+
+    def available(self, dt: float) -> np.ndarray:
+        """Largest outflow [kg/s] the tank can deliver over ``dt`` [s]."""
+        return self.__mass / dt
+
+    def step(
+        self,
+        dt: float,  # s
+        inflows: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = (),
+        outflow: float | np.ndarray = 0.0,  # kg/s
+    ) -> np.ndarray:
+        """
+        Advance by ``dt`` with inflows given as (mass flow [kg/s],
+        concentration, enthalpy [kJ/kg]) and one outflow at the tank state.
+        Returns the outflow actually delivered, limited by the tank content.
+        """
+        m_in = sum((np.asarray(m) for m, _, _ in inflows), 0.0)
+        salt_in = sum((np.asarray(m) * X for m, X, _ in inflows), 0.0)
+        heat_in = sum((np.asarray(m) * h for m, _, h in inflows), 0.0)
+        m_out = np.minimum(outflow, self.available(dt))
+
+        # draw the outflow at the current state and let what remains relax
+        # towards the ambient (exact for the step, bounded for any content)
+        remaining = np.maximum(self.__mass - dt * m_out, 0.0)
+        sol = self.__sol_cls
+        h_ambient = sol.enthalpy(self.__ambient_temperature, self.__concentration)
+        C_remaining = remaining * sol.specificHeat(
+            self.temperature, self.__concentration
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cooled = 1 - np.exp(-self.__UA * dt / C_remaining)
+        h_remaining = self.__enthalpy + np.where(
+            remaining > 0, cooled * (h_ambient - self.__enthalpy), 0.0
+        )
+
+        # then mix the inflows in
+        mass = remaining + dt * m_in
+        with np.errstate(divide="ignore", invalid="ignore"):
+            concentration = (remaining * self.__concentration + dt * salt_in) / mass
+            enthalpy = (remaining * h_remaining + dt * heat_in) / mass
+
+        # an emptied tank keeps its last composition
+        filled = mass > 0
+        self.__concentration = np.where(filled, concentration, self.__concentration)
+        self.__enthalpy = np.where(filled, enthalpy, self.__enthalpy)
+        self.__mass = np.maximum(mass, 0.0)
+        self.__temperature = None
+        return m_out
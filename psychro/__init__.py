@@ -0,0 +1,3 @@
+from .psychrometrics import *
+
+__all__ = psychrometrics.__all__
@@ -0,0 +1,158 @@
+"""
+Vectorized moist-air relations for array models.
+
+Units follow pyfluids.HumidAir: temperature [C], pressure [Pa], humidity
+ratio [kg/kg dry air], relative humidity [%], enthalpy [J/kg humid air].
+Ideal-gas ASHRAE relations with the Hyland-Wexler saturation pressure are
+used, which agree with the CoolProp humid-air model within a few hundredths
+of a degree in the range of interest here.
+"""
+
+import numpy as np
+
+from solver import bisect
+
+__all__ = [
+    "P_ATM",
+    "saturationPressure",
+    "humidityRatio",
+    "vaporPressure",
+    "saturationHumidity",
+    "humidityFromRelativeHumidity",
+    "relativeHumidity",
+    "enthalpy",
+    "temperature",
+    "saturationTemperature",
+    "wetBulbTemperature",
+    "dewPointTemperature",
+    "humidityFromDewPoint",
+    "density",
+]
+
+P_ATM = 101325  # Pa
+
+_CP_DA = 1006  # J/kg/K, dry air
+_CP_V = 1860  # J/kg/K, water vapour
+_CP_W = 4186  # J/kg/K, liquid water
+_H_FG = 2501000  # J/kg, at 0 C
+_EPS = 0.621945  # M_w / M_da
+_R_DA = 287.042  # J/kg/K
+_F = 1.0044  # enhancement factor of water vapour in air near 1 atm
+
+
+def saturationPressure(T: float | np.ndarray) -> float | np.ndarray:
+    """Saturation vapour pressure over water (ice below 0 C) [Pa]."""
+    T = np.asarray(T, dtype=float)
+    T_K = T + 273.15
+    ln_water = (
+        -5.8002206e3 / T_K
+        + 1.3914993
+        - 4.8640239e-2 * T_K
+        + 4.1764768e-5 * T_K**2
+        - 1.4452093e-8 * T_K**3
+        + 6.5459673 * np.log(T_K)
+    )
+    ln_ice = (
+        -5.6745359e3 / T_K
+        + 6.3925247
+        - 9.677843e-3 * T_K
+        + 6.2215701e-7 * T_K**2
+        + 2.0747825e-9 * T_K**3
+        - 9.484024e-13 * T_K**4
+        + 4.1635019 * np.log(T_K)
+    )
+    return np.exp(np.where(T >= 0, ln_water, ln_ice))
+
+
+def humidityRatio(Pv: float | np.ndarray, P: float = P_ATM) -> float | np.ndarray:
+    """Humidity ratio from vapour partial pressure [kg/kg]."""
+    return _EPS * Pv / (P - Pv)
+
+
+def vaporPressure(W: float | np.ndarray, P: float = P_ATM) -> float | np.ndarray:
+    """Vapour partial pressure from humidity ratio [Pa]."""
+    return P * W / (_EPS + W)
+
+
+def saturationHumidity(T: float | np.ndarray, P: float = P_ATM) -> float | np.ndarray:
+    """Humidity ratio of saturated air [kg/kg]."""
+    return humidityRatio(_F * saturationPressure(T), P)
+
+
+def humidityFromRelativeHumidity(
+    T: float | np.ndarray, RH: float | np.ndarray, P: float = P_ATM
+) -> float | np.ndarray:
+    """Humidity ratio from dry-bulb temperature and relative humidity [%]."""
+    return humidityRatio(np.asarray(RH) / 100 * _F * saturationPressure(T), P)
+
+
+def relativeHumidity(
+    T: float | np.ndarray, W: float | np.ndarray, P: float = P_ATM
+) -> float | np.ndarray:
+    """Relative humidity [%]."""
+    return 100 * vaporPressure(W, P) / (_F * saturationPressure(T))
+
+
+def enthalpy(T: float | np.ndarray, W: float | np.ndarray) -> float | np.ndarray:
+    """Specific enthalpy [J/kg humid air]."""
+    return (_CP_DA * T + W * (_H_FG + _CP_V * T)) / (1 + W)
+
+
+def temperature(h: float | np.ndarray, W: float | np.ndarray) -> float | np.ndarray:
+    """Dry-bulb temperature [C] from enthalpy [J/kg humid air] and humidity."""
+    return (h * (1 + W) - _H_FG * W) / (_CP_DA + _CP_V * W)
+
+
+def saturationTemperature(
+    h: float | np.ndarray, P: float = P_ATM
+) -> float | np.ndarray:
+    """Temperature of saturated air with enthalpy ``h`` [C]."""
+    h = np.asarray(h, dtype=float)
+    return bisect(
+        lambda T: enthalpy(T, saturationHumidity(T, P)) - h,
+        np.full(h.shape, -40.0),
+        np.full(h.shape, 95.0),
+        xtol=1e-5,
+    )
+
+
+def wetBulbTemperature(
+    T: float | np.ndarray, W: float | np.ndarray, P: float = P_ATM
+) -> float | np.ndarray:
+    """Thermodynamic wet-bulb temperature (ASHRAE psychrometric equation) [C]."""
+    T, W = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(W, dtype=float))
+
+    def residual(T_wb):
+        W_s = saturationHumidity(T_wb, P)
+        W_calc = ((_H_FG - (_CP_W - _CP_V) * T_wb) * W_s - _CP_DA * (T - T_wb)) / (
+            _H_FG + _CP_V * T - _CP_W * T_wb
+        )
+        return W_calc - W
+
+    return bisect(residual, T - 60, T, xtol=1e-5)
+
+
+def dewPointTemperature(W: float | np.ndarray, P: float = P_ATM) -> float | np.ndarray:
+    """Dew-point temperature [C]."""
+    Pv = np.asarray(vaporPressure(W, P), dtype=float)
+    return bisect(
+        lambda T: _F * saturationPressure(T) - Pv,
+        np.full(Pv.shape, -60.0),
+        np.full(Pv.shape, 100.0),
+        xtol=1e-5,
+    )
+
+
+def humidityFromDewPoint(
+    T_dp: float | np.ndarray, P: float = P_ATM
+) -> float | np.ndarray:
+    """Humidity ratio of air with dew point T_dp [kg/kg]."""
+    return saturationHumidity(T_dp, P)
+
+
+def density(
+    T: float | np.ndarray, W: float | np.ndarray, P: float = P_ATM
+) -> float | np.ndarray:
+    """Density of humid air [kg humid air / m3]."""
+    v_da = _R_DA * (np.asarray(T) + 273.15) * (1 + W / _EPS) / P
+    return (1 + W) / v_da
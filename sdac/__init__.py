@@ -1,3 +1,11 @@
+from .rotating_wheel import *
+from .solid_desiccant_array import *
 from .solid_desiccant_system import *
+from .wheel_transient import *
 
-__all__ = solid_desiccant_system.__all__
+__all__ = (
+    rotating_wheel.__all__
+    + solid_desiccant_array.__all__
+    + solid_desiccant_system.__all__
+    + wheel_transient.__all__
+)
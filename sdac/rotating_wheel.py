@@ -0,0 +1,309 @@
+import math
+
+import numpy as np
+from pyfluids import HumidAir, InputHumidAir
+
+import psychro
+from solver import fixedPoint
+
+from .solid_desiccant_system import SolidDesiccantSystem
+
+__all__ = ["RotatingWheel"]
+
+_CP_DA = 1.006  # kJ/kg/K, dry air
+_CP_V = 1.86  # kJ/kg/K, water vapour
+_CP_W = 4.186  # kJ/kg/K, adsorbed water
+_ADSORPTION_HEAT = 53 / 0.01801524  # kJ/kg, 53 kJ/mol
+
+
+class RotatingWheel:
+    """
+    Desiccant wheel on an angular x axial grid, with the process and
+    regeneration air in counterflow over their sectors.
+
+    The matrix turns through ``angular_cells`` sectors per revolution and
+    is split into ``axial_cells`` along the air path. While in a cell, the
+    solid approaches the equilibrium moisture of the air entering that cell
+    (isotherm of SolidDesiccantSystem) with its linear-driving-force
+    coefficient, and the air temperature with the heat transfer NTU; the
+    heat of adsorption goes into the solid. The air is quasi-steady, so the
+    gas balances are a march along the depth over all angular cells at
+    once, and the solid balances are linear recurrences around the wheel
+    whose cyclic steady state is closed form. The two are alternated until
+    the solid state converges.
+
+    Process air enters at axial node 0, regeneration air at the other face.
+    Air temperatures in C, air flows in kg/s of humid air.
+
+    The solid starts at equilibrium with the process air unless
+    ``initial_moisture`` / ``initial_temperature`` are given, e.g. the
+    ``moisture`` and ``solid_temperature`` of the previous point of a
+    sweep. The iteration count grows quickly with the regeneration
+    temperature, so sweeps should be started from their neighbours; with
+    regeneration air above about 90 C it may not converge at all.
+    """
+
+    def __init__(
+        self,
+        process_air: HumidAir,
+        m_air_process: float,  # kg/s
+        regeneration_air: HumidAir,
+        m_air_regeneration: float,  # kg/s
+        rotation_speed: float = 20,  # revolutions per hour
+        process_fraction: float = 0.5,  # share of the face in the process sector
+        angular_cells: int = 24,
+        axial_cells: int = 10,
+        radius: float = 0.4,  # m
+        width: float = 0.4,  # m
+        density: float = 500,  # kg/m3
+        specific_heat: float = 0.92,  # kJ/kg/K, dry matrix
+        heat_transfer_NTU: float = 5,  # over the wheel depth
+        tol: float = 1e-9,  # kg/kg
+        max_iter: int = 500,
+        initial_moisture: float | np.ndarray = None,  # kg/kg, (angular, axial)
+        initial_temperature: float | np.ndarray = None,  # C, (angular, axial)
+    ):
+        self.__process_air: HumidAir = process_air
+        self.__regeneration_air: HumidAir = regeneration_air
+        self.__m_air_process: float = m_air_process
+        self.__m_air_regeneration: float = m_air_regeneration
+
+        self.__rotation_speed: float = rotation_speed
+        self.__angular_cells: int = angular_cells
+        self.__axial_cells: int = axial_cells
+        self.__process_cells: int = min(
+            max(round(process_fraction * angular_cells), 1), angular_cells - 1
+        )
+
+        self.__mass: float = density * radius**2 * math.pi * width
+        self.__specific_heat: float = specific_heat
+        self.__heat_transfer_NTU: float = heat_transfer_NTU
+        self.__tol: float = tol
+        self.__max_iter: int = max_iter
+        self.__initial_moisture: float | np.ndarray = initial_moisture
+        self.__initial_temperature: float | np.ndarray = initial_temperature
+
+        self.__iterations: int = None
+        # solid state entering angular cell j at axial node k
+        self.__q: np.ndarray = None
+        self.__T_s: np.ndarray = None
+        # air leaving each angular cell
+        self.__w_out: np.ndarray = None
+        self.__T_out: np.ndarray = None
+
+        self.__outlet_air: HumidAir = None
+        self.__regeneration_outlet_air: HumidAir = None
+
+    @property
+    def inlet_air(self) -> HumidAir:
+        return self.__process_air
+
+    @property
+    def regeneration_inlet_air(self) -> HumidAir:
+        return self.__regeneration_air
+
+    @property
+    def process_fraction(self) -> float:
+        """Process share of the face after rounding to whole cells."""
+        return self.__process_cells / self.__angular_cells
+
+    @property
+    def period(self) -> float:
+        """[s] per revolution"""
+        return 3600 / self.__rotation_speed
+
+    @property
+    def iterations(self) -> int:
+        self.__profiles()
+        return self.__iterations
+
+    @property
+    def moisture(self) -> np.ndarray:
+        """Solid moisture [kg/kg] entering each (angular, axial) cell."""
+        self.__profiles()
+        return self.__q
+
+    @property
+    def solid_temperature(self) -> np.ndarray:
+        """[C]"""
+        self.__profiles()
+        return self.__T_s
+
+    @property
+    def outlet_air(self) -> HumidAir:
+        """Mixed process outlet air."""
+        if self.__outlet_air is None:
+            self.__outlet_air = self.__mixedOutlet(self.__processRows())
+        return self.__outlet_air
+
+    @property
+    def regeneration_outlet_air(self) -> HumidAir:
+        if self.__regeneration_outlet_air is None:
+            self.__regeneration_outlet_air = self.__mixedOutlet(~self.__processRows())
+        return self.__regeneration_outlet_air
+
+    @property
+    def adsorption_rate(self) -> float:
+        """Water taken from the process air [kg/s]."""
+        self.__profiles()
+        w_in = self.__process_air.humidity
+        w_out = self.__w_out[self.__processRows()].mean()
+        return self.__m_air_process / (1 + w_in) * (w_in - w_out)
+
+    @property
+    def desorption_rate(self) -> float:
+        """Water released to the regeneration air [kg/s]."""
+        self.__profiles()
+        w_in = self.__regeneration_air.humidity
+        w_out = self.__w_out[~self.__processRows()].mean()
+        return self.__m_air_regeneration / (1 + w_in) * (w_out - w_in)
+
+    def __processRows(self) -> np.ndarray:
+        return np.arange(self.__angular_cells) < self.__process_cells
+
+    def __mixedOutlet(self, rows: np.ndarray) -> HumidAir:
+        self.__profiles()
+        w_out = self.__w_out[rows]
+        h_out = psychro.enthalpy(self.__T_out[rows], w_out)  # J/kg
+        return HumidAir().with_state(
+            InputHumidAir.pressure(101325),
+            InputHumidAir.humidity(float(w_out.mean())),
+            InputHumidAir.enthalpy(float(h_out.mean())),
+        )
+
+    def __profiles(self):
+        if self.__iterations is None:
+            self.__solve()
+
+    def __march(self, q: np.ndarray, T_s: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Air through the depth of every angular cell for the given solid
+        inlet states, and the per-cell coefficients of the solid updates
+        q_out = a_q q_in + b_q and T_out = a_T T_in + b_T.
+        """
+        n, n_ax = q.shape
+        process = self.__processRows()
+        dt = self.period / n
+        M = self.__mass / (n * n_ax)  # kg solid per cell
+
+        air = (self.__process_air, self.__regeneration_air)
+        m_air = (
+            self.__m_air_process / self.__process_cells,
+            self.__m_air_regeneration / (n - self.__process_cells),
+        )
+        T_a = np.where(process, air[0].temperature, air[1].temperature)
+        w_a = np.where(process, air[0].humidity, air[1].humidity)
+        m_da = np.where(process, m_air[0], m_air[1]) / (1 + w_a)  # per cell
+
+        # axial order along the air path, the regeneration air runs backwards
+        flip = lambda x: np.where(process[:, None], x, x[:, ::-1])
+        q_g, T_g = flip(q), flip(T_s)
+        a_q, b_q, a_T, b_T = (np.empty((n, n_ax)) for _ in range(4))
+
+        NTU_cell = self.__heat_transfer_NTU / n_ax
+        for k in range(n_ax):
+            q_in, T_in = q_g[:, k], T_g[:, k]
+            decay = np.exp(-SolidDesiccantSystem.rateCoefficient(T_in) * dt)
+            C_s = M * (self.__specific_heat + _CP_W * q_in)  # kJ/K
+            C_a = m_da * dt * (_CP_DA + _CP_V * w_a)  # kJ/K, air through the cell
+            relax = np.exp(-C_a / C_s * (1 - np.exp(-NTU_cell)))
+
+            # the solid sees the mean air of the cell: predict the outlet
+            # with the inlet air, then correct with the mean
+            T_drive, w_drive = T_a, w_a
+            for _ in range(2):
+                # exact LDF decay towards the air's equilibrium moisture
+                q_eq = SolidDesiccantSystem.equilibriumMoisture(
+                    T_drive, psychro.relativeHumidity(T_drive, w_drive)
+                )
+                dq = (1 - decay) * (q_eq - q_in)
+
+                # solid relaxes towards the air temperature and takes the
+                # heat of adsorption of its uptake
+                b_T[:, k] = (1 - relax) * T_drive + M * dq * _ADSORPTION_HEAT / C_s
+                T_out = relax * T_in + b_T[:, k]
+
+                # air leaving the cell from the solid's mass and heat balances
+                sensible = C_s * (T_out - T_in) - M * dq * _ADSORPTION_HEAT
+                w_next = w_a - M * dq / (m_da * dt)
+                T_next = T_a - sensible / C_a
+                T_drive, w_drive = (T_a + T_next) / 2, (w_a + w_next) / 2
+
+            a_q[:, k], b_q[:, k] = decay, (1 - decay) * q_eq
+            a_T[:, k] = relax
+            T_a, w_a = T_next, w_next
+
+        return {
+            "a_q": flip(a_q),
+            "b_q": flip(b_q),
+            "a_T": flip(a_T),
+            "b_T": flip(b_T),
+            "w_out": w_a,
+            "T_out": T_a,
+        }
+
+    @staticmethod
+    def __cyclic(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Periodic solution of x[j + 1] = a[j] x[j] + b[j] around the wheel,
+        x[n] = x[0], column-wise.
+        """
+        n = a.shape[0]
+        # products of a over the cells after j, bounded by 1
+        after = np.cumprod(np.vstack((np.ones((1,) + a.shape[1:]), a[:0:-1])), axis=0)
+        after = after[::-1]
+        x = np.empty_like(b)
+        x[0] = (after * b).sum(axis=0) / (1 - np.prod(a, axis=0))
+        for j in range(n - 1):
+            x[j + 1] = a[j] * x[j] + b[j]
+        return x
+
+    def __solve(self):
+        """
+        Fixed point of march + cyclic update in the solid state, with
+        Anderson mixing over the last few updates.
+        """
+        n, n_ax = self.__angular_cells, self.__axial_cells
+        last = {}
+
+        def update(state: np.ndarray) -> np.ndarray:
+            q, T_s = state.reshape(2, n, n_ax)
+            cells = self.__march(q, T_s)
+            last.update(q=q, T_s=T_s, cells=cells)
+            return np.concatenate(
+                (
+                    self.__cyclic(cells["a_q"], cells["b_q"]).ravel(),
+                    self.__cyclic(cells["a_T"], cells["b_T"]).ravel(),
+                )
+            )
+
+        q0, T0 = self.__initial_moisture, self.__initial_temperature
+        if q0 is None:
+            q0 = SolidDesiccantSystem.equilibriumMoisture(
+                self.__process_air.temperature, self.__process_air.relative_humidity
+            )
+        if T0 is None:
+            T0 = self.__process_air.temperature
+        result = fixedPoint(
+            update,
+            np.concatenate(
+                (
+                    np.broadcast_to(q0, (n, n_ax)).ravel(),
+                    np.broadcast_to(T0, (n, n_ax)).ravel(),
+                )
+            ),
+            atol=np.concatenate(
+                (np.full(n * n_ax, self.__tol), np.full(n * n_ax, np.inf))
+            ),
+            rtol=0,
+            max_iter=self.__max_iter,
+        )
+        if result.diverged:
+            raise ValueError("Wheel model diverged, check the flows and speed")
+        if not result.converged:
+            raise ValueError("Wheel model did not converge, check the flows and speed")
+
+        q, T_s, cells = last["q"], last["T_s"], last["cells"]
+        self.__iterations = result.iterations
+        self.__q, self.__T_s = q, T_s
+        self.__w_out, self.__T_out = cells["w_out"], cells["T_out"]
@@ -0,0 +1,222 @@
+import math
+
+import numpy as np
+
+import psychro
+
+from .solid_desiccant_system import (
+    SolidDesiccantSystem,
+    _ADSORPTION_ENTHALPY,
+    _DENSITY,
+    _RADIUS,
+    _WIDTH,
+)
+
+__all__ = ["SolidDesiccantArray"]
+
+
+class SolidDesiccantArray:
+    """
+    Column-wise counterpart of SolidDesiccantSystem, e.g. one element per
+    hour of a weather year or per point of a wheel sweep. Uses the same
+    isotherm, adsorption rate and outlet air equations in one vectorized
+    pass, with the outlet air as (enthalpy, humidity) columns instead of
+    HumidAir objects.
+
+    Air is given as temperature [C] and humidity [kg/kg], optionally with
+    its relative humidity [%] and enthalpy [J/kg] (otherwise from psychro).
+    """
+
+    def __init__(
+        self,
+        inlet_air_temperature: np.ndarray,  # C
+        inlet_air_humidity: np.ndarray,  # kg/kg
+        m_air: np.ndarray,  # kg/s
+        moisture: np.ndarray = 0,  # kg/kg, previous wheel moisture
+        func_percentage: np.ndarray = 0.5,
+        inlet_air_relative_humidity: np.ndarray = None,  # %
+        inlet_air_enthalpy: np.ndarray = None,  # J/kg
+    ):
+        (
+            self.__T_a_in,
+            self.__w_a_in,
+            self.__m_air,
+            self.__previous_moisture,
+            self.__percentage,
+            RH_in,
+            h_a_in,
+        ) = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    inlet_air_temperature,
+                    inlet_air_humidity,
+                    m_air,
+                    moisture,
+                    func_percentage,
+                    (
+                        np.nan
+                        if inlet_air_relative_humidity is None
+                        else inlet_air_relative_humidity
+                    ),
+                    np.nan if inlet_air_enthalpy is None else inlet_air_enthalpy,
+                )
+            )
+        )
+
+        self.__RH_in: np.ndarray = (
+            psychro.relativeHumidity(self.__T_a_in, self.__w_a_in)
+            if inlet_air_relative_humidity is None
+            else RH_in
+        )
+        self.__h_a_in: np.ndarray = (
+            psychro.enthalpy(self.__T_a_in, self.__w_a_in)
+            if inlet_air_enthalpy is None
+            else h_a_in
+        )
+
+        self.__mass: float = _DENSITY * _RADIUS**2 * math.pi * _WIDTH
+
+        self.__q: np.ndarray = None
+        self.__EMC: np.ndarray = None
+        self.__rate_constant: np.ndarray = None
+        self.__adsorption_rate: np.ndarray = None
+        self.__current_moisture: np.ndarray = None
+        self.__w_a_out: np.ndarray = None
+        self.__h_a_out: np.ndarray = None
+
+    @classmethod
+    def steadyState(
+        cls,
+        ads_air_temperature: np.ndarray,  # C
+        ads_air_humidity: np.ndarray,  # kg/kg
+        m_air_ads: np.ndarray,  # kg/s
+        reg_air_temperature: np.ndarray,  # C
+        reg_air_humidity: np.ndarray,  # kg/kg
+        m_air_reg: np.ndarray,  # kg/s
+        func_percentage: np.ndarray = 0.5,
+    ) -> tuple["SolidDesiccantArray", "SolidDesiccantArray"]:
+        """
+        Element-wise closed-form periodic steady state of adsorption and
+        regeneration sections with fixed inlet air, as in
+        SolidDesiccantSystem.steadyState.
+        """
+        ads = cls(ads_air_temperature, ads_air_humidity, m_air_ads, 0, func_percentage)
+        reg = cls(reg_air_temperature, reg_air_humidity, m_air_reg, 0, func_percentage)
+        a1, a2 = ads.rate_constant, reg.rate_constant
+        moisture = ((1 - a2) * a1 * ads.EMC + a2 * reg.EMC) / (1 - (1 - a1) * (1 - a2))
+
+        ads = cls(
+            ads_air_temperature, ads_air_humidity, m_air_ads, moisture, func_percentage
+        )
+        reg = cls(
+            reg_air_temperature,
+            reg_air_humidity,
+            m_air_reg,
+            ads.current_moisture,
+            func_percentage,
+        )
+        return ads, reg
+
+    @property
+    def size(self) -> int:
+        return self.__T_a_in.size
+
+    @property
+    def inlet_air_temperature(self) -> np.ndarray:
+        """[C]"""
+        return self.__T_a_in
+
+    @property
+    def inlet_air_humidity(self) -> np.ndarray:
+        """[kg/kg]"""
+        return self.__w_a_in
+
+    @property
+    def inlet_air_relative_humidity(self) -> np.ndarray:
+        """[%]"""
+        return self.__RH_in
+
+    @property
+    def inlet_air_enthalpy(self) -> np.ndarray:
+        """[J/kg]"""
+        return self.__h_a_in
+
+    @property
+    def previous_moisture(self) -> np.ndarray:
+        return self.__previous_moisture
+
+    @property
+    def q(self) -> np.ndarray:
+        if self.__q is None:
+            self.__q = SolidDesiccantSystem.loading(self.__T_a_in, self.__RH_in)
+        return self.__q
+
+    @property
+    def EMC(self) -> np.ndarray:
+        if self.__EMC is None:
+            self.__EMC = SolidDesiccantSystem.equilibriumMoisture(
+                self.__T_a_in, self.__RH_in
+            )
+        return self.__EMC
+
+    @property
+    def rate_constant(self) -> np.ndarray:
+        if self.__rate_constant is None:
+            self.__rate_constant = (
+                SolidDesiccantSystem.rateCoefficient(self.__T_a_in) * self.__percentage
+            )
+        return self.__rate_constant
+
+    @property
+    def adsorption_rate(self) -> np.ndarray:
+        if self.__adsorption_rate is None:
+            self.__adsorption_rate = (
+                self.rate_constant * (self.EMC - self.__previous_moisture) * self.__mass
+            )
+        return self.__adsorption_rate
+
+    @property
+    def current_moisture(self) -> np.ndarray:
+        if self.__current_moisture is None:
+            self.__current_moisture = (
+                self.__previous_moisture + self.adsorption_rate / self.__mass
+            )
+        return self.__current_moisture
+
+    @property
+    def outlet_air_humidity(self) -> np.ndarray:
+        """[kg/kg]"""
+        if self.__w_a_out is None:
+            self.__w_a_out = self.__w_a_in - np.minimum(
+                self.adsorption_rate / self.__m_air, self.__w_a_in
+            )
+        return self.__w_a_out
+
+    @property
+    def outlet_air_enthalpy(self) -> np.ndarray:
+        """[J/kg]"""
+        if self.__h_a_out is None:
+            self.__h_a_out = (
+                self.__h_a_in
+                + self.adsorption_rate * _ADSORPTION_ENTHALPY * 1e3 / self.__m_air
+            )
+        return self.__h_a_out
+
+    @property
+    def outlet_air_temperature(self) -> np.ndarray:
+        """[C]"""
+        return psychro.temperature(self.outlet_air_enthalpy, self.outlet_air_humidity)
+
+    @property
+    def table(self) -> dict[str, np.ndarray]:
+        """All outputs as columns."""
+        return {
+            "EMC": self.EMC,
+            "q": self.q,
+            "adsorption_rate": self.adsorption_rate,
+            "current_moisture": self.current_moisture,
+            "h_air_out": self.outlet_air_enthalpy,
+            "W_air_out": self.outlet_air_humidity,
+            "T_air_out": self.outlet_air_temperature,
+        }
@@ -1,9 +1,19 @@
 from pyfluids import HumidAir, InputHumidAir
 import math
+import numpy as np
 from enum import Enum
+from typing import Callable
+
+from solver import Acceleration, FixedPointResult, fixedPoint
 
 __all__ = ["SolidDesiccantSystem"]
 
+_MAX_MOISTURE = 0.39  # kg water per kg adsorbent
+_DENSITY = 500  # kg/m3
+_RADIUS = 0.4  # m
+_WIDTH = 0.4  # m
+_ADSORPTION_ENTHALPY = 53  # kJ/mol
+
 
 class SolidDesiccantSystem:
     def __init__(
@@ -28,13 +38,161 @@ class SolidDesiccantSystem:
 
         self.__m_air: float = m_air
 
-        self.__density: float = 500  # kg/m3
-        self.__radius: float = 0.4
-        self.__width: float = 0.4
+        self.__density: float = _DENSITY  # kg/m3
+        self.__radius: float = _RADIUS
+        self.__width: float = _WIDTH
         self.__velocity: float = self.__radius**2 * math.pi * self.__width
         self.__mass: float = self.__density * self.__velocity
 
         self.__q: float = None
+        self.__rate_constant: float = None
+
+    @classmethod
+    def steadyState(
+        cls,
+        ads_air: HumidAir,
+        m_air_ads: float,
+        reg_air: HumidAir | Callable[["SolidDesiccantSystem"], HumidAir],
+        m_air_reg: float,
+        func_percentage: float = 0.5,
+        tol: float = 1e-12,
+        max_iter: int = 100,
+    ) -> tuple["SolidDesiccantSystem", "SolidDesiccantSystem"]:
+        """
+        Adsorption and regeneration sections at the periodic steady state,
+        where the wheel moisture returns to its start after both sections.
+        See solveCycle, which also returns the iteration statistics.
+        """
+        ads, reg, _ = cls.solveCycle(
+            ads_air, m_air_ads, reg_air, m_air_reg, func_percentage, tol, max_iter
+        )
+        return ads, reg
+
+    @classmethod
+    def solveCycle(
+        cls,
+        ads_air: HumidAir,
+        m_air_ads: float,
+        reg_air: HumidAir | Callable[["SolidDesiccantSystem"], HumidAir],
+        m_air_reg: float,
+        func_percentage: float = 0.5,
+        tol: float = 1e-12,
+        max_iter: int = 100,
+        uncoupled_reg_air: HumidAir = None,
+        relaxation: float = 1.0,
+        initial_moisture: float = None,
+    ) -> tuple["SolidDesiccantSystem", "SolidDesiccantSystem", FixedPointResult]:
+        """
+        Periodic steady state of the adsorption and regeneration sections,
+        with the moisture iteration statistics.
+
+        Each section gives current = (1 - a) previous + a EMC, so with fixed
+        inlet air the cycle is affine and its fixed point is closed form.
+        ``reg_air`` may instead be a function of the adsorption section
+        (regeneration air heated through a heat exchanger on the adsorber
+        outlet). The solve is then staged: the closed-form cycle with
+        ``uncoupled_reg_air`` (or dry wheel moisture without it) starts the
+        coupled iteration, which runs with Aitken relaxation to ``tol``.
+        ``initial_moisture`` (e.g. a converged neighbouring operating point)
+        replaces that start.
+        """
+        if not callable(reg_air):
+            ads, reg = cls.__affineCycle(
+                ads_air, m_air_ads, reg_air, m_air_reg, func_percentage
+            )
+            return ads, reg, FixedPointResult(np.array([ads.previous_moisture]), 0, 0.0)
+
+        moisture = 0.0
+        if initial_moisture is not None:
+            moisture = initial_moisture
+        elif uncoupled_reg_air is not None:
+            moisture = cls.__affineCycle(
+                ads_air, m_air_ads, uncoupled_reg_air, m_air_reg, func_percentage
+            )[0].previous_moisture
+
+        last = {}
+
+        def cycle(moisture: np.ndarray) -> np.ndarray:
+            ads = cls(ads_air, m_air_ads, float(moisture[0]), func_percentage)
+            reg = cls(reg_air(ads), m_air_reg, ads.current_moisture, func_percentage)
+            last.update(ads=ads, reg=reg)
+            return np.array([reg.current_moisture])
+
+        result = fixedPoint(
+            cycle,
+            [moisture],
+            atol=tol,
+            rtol=0,
+            max_iter=max_iter,
+            acceleration=Acceleration.aitken,
+            mixing=relaxation,
+        )
+        if not result.converged:
+            raise ValueError("Desiccant wheel moisture did not converge")
+        return last["ads"], last["reg"], result
+
+    @classmethod
+    def __affineCycle(
+        cls,
+        ads_air: HumidAir,
+        m_air_ads: float,
+        reg_air: HumidAir,
+        m_air_reg: float,
+        func_percentage: float,
+    ) -> tuple["SolidDesiccantSystem", "SolidDesiccantSystem"]:
+        ads = cls(ads_air, m_air_ads, 0, func_percentage)
+        reg = cls(reg_air, m_air_reg, 0, func_percentage)
+        a1, a2 = ads.rate_constant, reg.rate_constant
+        moisture = ((1 - a2) * a1 * ads.EMC + a2 * reg.EMC) / (1 - (1 - a1) * (1 - a2))
+        ads = cls(ads_air, m_air_ads, moisture, func_percentage)
+        return ads, cls(reg_air, m_air_reg, ads.current_moisture, func_percentage)
+
+    # Isotherm and diffusion equations, usable on floats or numpy arrays.
+    # T [C], RH [%].
+
+    @staticmethod
+    def loading(T, RH):
+        """Fractional loading of the S-shaped isotherm."""
+        a = 1.192
+        delta_Q_kJ_per_kg = 1469  # kJ per kg of H2O
+        M_H2O = 0.018015  # kg/mol
+        b = 1.1178e-4
+
+        R = 8.314462618  # J/(mol·K)
+
+        T = T + 273.15  # K
+
+        # 把 ΔQ 轉成 J/mol
+        delta_Q_J_per_mol = delta_Q_kJ_per_kg * 1e3 * M_H2O
+
+        # 平衡常數 K
+        K = b * np.exp(a * delta_Q_J_per_mol / (R * T))
+
+        # 相對壓力 RH
+        RH = RH / 100
+
+        # S 形等溫線
+        return K * RH**a / (1 + (K - 1) * RH**a)
+
+    @staticmethod
+    def equilibriumMoisture(T, RH):
+        """Equilibrium moisture content [kg H2O per kg adsorbent]."""
+        return _MAX_MOISTURE * SolidDesiccantSystem.loading(T, RH)
+
+    @staticmethod
+    def rateCoefficient(T):
+        """Linear-driving-force coefficient 60 Ds / d^2 [1/s]."""
+        a1 = 1.05e-11  # m2/s
+        a2 = 28299  # J/mol
+        d = 1.5e-6  # m
+
+        R = 8.314462618  # J/(mol·K)
+
+        T = T + 273.15  # K
+
+        Ds = a1 * np.exp(-a2 / (R * T))
+
+        return (60 / d**2) * Ds
 
     @property
     def inlet_air(self) -> HumidAir:
@@ -64,6 +222,17 @@ class SolidDesiccantSystem:
             self.__getAdsorptionRate()
         return self.__adsorption_rate
 
+    @property
+    def rate_constant(self) -> float:
+        """Fraction of the gap to EMC the section closes per pass."""
+        if self.__rate_constant is None:
+            self.__getRateConstant()
+        return self.__rate_constant
+
+    @property
+    def previous_moisture(self) -> float:
+        return self.__previous_moisture
+
     @property
     def current_moisture(self) -> float:
         if self.__current_moisture is None:
@@ -75,56 +244,25 @@ class SolidDesiccantSystem:
     def __getEMC(self):
         air = self.__inlet_air
 
-        m0 = 0.39  # kg water per kg adsorbent
-        a = 1.192
-        delta_Q_kJ_per_kg = 1469  # kJ per kg of H2O
-        M_H2O = 0.018015  # kg/mol
-        b = 1.1178e-4
-
-        R = 8.314462618  # J/(mol·K)
-
-        T = air.temperature + 273.15  # K
-
-        # 把 ΔQ 轉成 J/mol
-        delta_Q_J_per_mol = delta_Q_kJ_per_kg * 1e3 * M_H2O
-
-        # 平衡常數 K
-        K = b * math.exp(a * delta_Q_J_per_mol / (R * T))
-
-        # 相對壓力 RH
-        RH = air.relative_humidity / 100
-
-        # S 形等溫線
-        q = K * RH**a / (1 + (K - 1) * RH**a)
+        q = self.loading(air.temperature, air.relative_humidity)
 
         # 平衡含水量 (kg H2O per kg adsorbent)
-        self.__EMC = m0 * q
+        self.__EMC = _MAX_MOISTURE * q
 
         self.__q = q
 
-    def __getAdsorptionRate(self):
-        air = self.__inlet_air
-
-        a1 = 1.05e-11  # m2/s
-        a2 = 28299  # J/mol
-        d = 1.5e-6  # m
-
-        R = 8.314462618  # J/(mol·K)
-
-        T = air.temperature + 273.15  # K
-
-        Ds = a1 * math.exp(-a2 / (R * T))
+    def __getRateConstant(self):
+        self.__rate_constant = (
+            self.rateCoefficient(self.__inlet_air.temperature) * self.__percentage
+        )
 
+    def __getAdsorptionRate(self):
         self.__adsorption_rate = (
-            (60 / d**2)
-            * Ds
-            * (self.EMC - self.__previous_moisture)
-            * self.__mass
-            * self.__percentage
+            self.rate_constant * (self.EMC - self.__previous_moisture) * self.__mass
         )
 
     def __setOutletAir(self):
-        delta_enthalpy = 53  # kJ/mol
+        delta_enthalpy = _ADSORPTION_ENTHALPY  # kJ/mol
         water_molar_mass = 0.01801524  # kg/mol
 
         w_out = self.__inlet_air.humidity - min(
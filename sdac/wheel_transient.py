@@ -0,0 +1,357 @@
+import math
+from typing import Callable
+
+import numpy as np
+
+from solver import bisect
+
+from .solid_desiccant_array import SolidDesiccantArray
+
+__all__ = ["WheelEvent", "WheelTransient"]
+
+
+class WheelEvent:
+    """
+    Zero crossing of ``function`` over the outputs of a WheelTransient
+    step (the columns of its result). ``direction`` +1 / -1 only counts
+    rising / falling crossings, ``terminal`` stops the simulation there.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[dict[str, np.ndarray]], np.ndarray],
+        direction: int = 0,
+        terminal: bool = False,
+    ):
+        self.__name: str = name
+        self.__function = function
+        self.__direction: int = direction
+        self.__terminal: bool = terminal
+
+    @classmethod
+    def saturation(cls, level: float = 0.95, terminal: bool = True) -> "WheelEvent":
+        """Wheel moisture reaching ``level`` of the adsorption-side EMC."""
+        return cls(
+            "saturation",
+            lambda state: state["moisture"] - level * state["EMC"],
+            direction=1,
+            terminal=terminal,
+        )
+
+    @classmethod
+    def setpoint(
+        cls,
+        column: str,
+        value: float,
+        direction: int = 0,
+        terminal: bool = False,
+    ) -> "WheelEvent":
+        """An output column, e.g. W_air_out, crossing ``value``."""
+        return cls(
+            f"{column}={value:g}",
+            lambda state: state[column] - value,
+            direction,
+            terminal,
+        )
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def direction(self) -> int:
+        return self.__direction
+
+    @property
+    def terminal(self) -> bool:
+        return self.__terminal
+
+    def __call__(self, state: dict[str, np.ndarray]) -> np.ndarray:
+        return self.__function(state)
+
+
+class _ColumnBuffer:
+    """Append-only named columns in preallocated arrays, grown by doubling."""
+
+    def __init__(self, names: tuple[str, ...], capacity: int = 1024):
+        self.__columns = {name: np.empty(capacity) for name in names}
+        self.__size: int = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def append(self, **values: float):
+        capacity = len(next(iter(self.__columns.values())))
+        if self.__size == capacity:
+            for name, column in self.__columns.items():
+                self.__columns[name] = np.concatenate((column, np.empty(capacity)))
+        for name, value in values.items():
+            self.__columns[name][self.__size] = value
+        self.__size += 1
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: column[: self.__size] for name, column in self.__columns.items()}
+
+
+class WheelTransient:
+    """
+    Wheel moisture under time-varying inlet air, as the continuous form of
+    SolidDesiccantSystem's per-pass update:
+
+        dm/dt = sum over sections of pct * k(T) * (EMC(T, RH) - m)
+
+    with the adsorption section taking ``func_percentage`` of the matrix
+    and the optional regeneration section the rest. Inlet air is given as
+    samples over ``time`` [s]; the section rate terms are interpolated
+    linearly between them.
+
+    The equation is linear in m and stiff over a year (the time constant
+    is minutes), so ``run`` uses the exponential midpoint rule, exact for
+    constant inlet air and stable for any step, with step doubling for the
+    error estimate and step-size control. Steps end on the samples, where
+    the interpolated rate terms kink, and ``atol`` defaults to ``rtol``
+    times the largest equilibrium moisture. While the moisture tracks a
+    moving equilibrium the rule is only first order (the lag behind the
+    equilibrium is taken at the midpoint), so hourly weather still takes
+    several steps per sample. Events are located on the exponential
+    solution inside the step. Every accepted step (and event) is recorded
+    to a columnar buffer. Outputs come from SolidDesiccantArray over the
+    recorded states, so they match the steady model's equations.
+    """
+
+    def __init__(
+        self,
+        time: np.ndarray,  # s
+        air_temperature: np.ndarray,  # C
+        air_humidity: np.ndarray,  # kg/kg
+        m_air: float = 1,  # kg/s
+        regeneration_temperature: np.ndarray = None,  # C
+        regeneration_humidity: np.ndarray = None,  # kg/kg
+        m_air_reg: float = 1.5,  # kg/s
+        func_percentage: float = 0.5,
+        rtol: float = 1e-4,
+        atol: float = None,  # kg/kg
+        max_step: float = math.inf,  # s, steps also end on the samples
+        first_step: float = 1.0,  # s
+    ):
+        if (regeneration_temperature is None) != (regeneration_humidity is None):
+            raise ValueError("Give both regeneration temperature and humidity")
+
+        self.__time = np.asarray(time, dtype=float)
+        self.__T_ads, self.__W_ads = (
+            np.broadcast_to(np.asarray(value, dtype=float), self.__time.shape)
+            for value in (air_temperature, air_humidity)
+        )
+        self.__m_air: float = m_air
+        self.__percentage: float = func_percentage
+
+        self.__regeneration: bool = regeneration_temperature is not None
+        if self.__regeneration:
+            self.__T_reg, self.__W_reg = (
+                np.broadcast_to(np.asarray(value, dtype=float), self.__time.shape)
+                for value in (regeneration_temperature, regeneration_humidity)
+            )
+            self.__m_air_reg: float = m_air_reg
+
+        # dm/dt = source - sink * m at the samples
+        ads = SolidDesiccantArray(self.__T_ads, self.__W_ads, m_air, 0, func_percentage)
+        source, sink = ads.rate_constant * ads.EMC, ads.rate_constant
+        if self.__regeneration:
+            reg = SolidDesiccantArray(
+                self.__T_reg, self.__W_reg, m_air_reg, 0, 1 - func_percentage
+            )
+            source = source + reg.rate_constant * reg.EMC
+            sink = sink + reg.rate_constant
+        self.__rtol: float = rtol
+        self.__atol: float = (
+            rtol * float(np.max(source / sink, initial=0)) if atol is None else atol
+        )
+        self.__max_step: float = max_step
+        self.__first_step: float = first_step
+
+        # linear pieces: constant before the first sample, one per sample
+        # interval and constant after the last sample; piece j starts at
+        # knots[j] and ends at bounds[j]
+        knots = np.concatenate((self.__time[:1], self.__time))
+        self.__knots: list[float] = knots.tolist()
+        self.__bounds: list[float] = self.__time.tolist() + [math.inf]
+        self.__source: tuple[list[float], list[float]] = self.__pieces(source)
+        self.__sink: tuple[list[float], list[float]] = self.__pieces(sink)
+
+        self.__events: list[tuple[str, float, float]] = []
+        self.__steps: int = 0
+        self.__rejected: int = 0
+
+    @property
+    def events(self) -> list[tuple[str, float, float]]:
+        """(name, time [s], moisture) of the events found by the last run."""
+        return self.__events
+
+    @property
+    def steps(self) -> int:
+        """Accepted steps of the last run."""
+        return self.__steps
+
+    @property
+    def rejected(self) -> int:
+        """Rejected steps of the last run."""
+        return self.__rejected
+
+    def outputs(self, time: np.ndarray, moisture: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        SolidDesiccantArray outputs at the given times and wheel moisture;
+        regeneration columns are prefixed with ``reg_``.
+        """
+        time = np.asarray(time, dtype=float)
+        ads = SolidDesiccantArray(
+            np.interp(time, self.__time, self.__T_ads),
+            np.interp(time, self.__time, self.__W_ads),
+            self.__m_air,
+            moisture,
+            self.__percentage,
+        )
+        columns = {"time": time, "moisture": np.asarray(moisture, dtype=float)}
+        columns.update(ads.table)
+        if self.__regeneration:
+            reg = SolidDesiccantArray(
+                np.interp(time, self.__time, self.__T_reg),
+                np.interp(time, self.__time, self.__W_reg),
+                self.__m_air_reg,
+                moisture,
+                1 - self.__percentage,
+            )
+            columns.update({f"reg_{k}": v for k, v in reg.table.items()})
+        columns.pop("current_moisture")
+        columns.pop("reg_current_moisture", None)
+        return columns
+
+    def run(
+        self,
+        moisture: float = 0.0,  # kg/kg at t_start
+        t_start: float = None,  # s, default first sample
+        t_end: float = None,  # s, default last sample
+        events: list[WheelEvent] = (),
+    ) -> dict[str, np.ndarray]:
+        """Integrate and return the output columns at the recorded states."""
+        t = float(self.__time[0] if t_start is None else t_start)
+        t_end = float(self.__time[-1] if t_end is None else t_end)
+        y = float(moisture)
+
+        buffer = _ColumnBuffer(("time", "moisture"))
+        buffer.append(time=t, moisture=y)
+        self.__events, self.__steps, self.__rejected = [], 0, 0
+
+        g = [float(event(self.outputs(t, y))) for event in events]
+        h = min(self.__first_step, self.__max_step, t_end - t)
+
+        while t < t_end:
+            # steps end on the samples, where the interpolated inputs kink
+            piece = int(np.searchsorted(self.__time, t, "right"))
+            bound = min(self.__bounds[piece], t_end)
+            step = min(h, bound - t)
+
+            # one full step against two half steps
+            full = self.__exponential(piece, t, y, step)
+            first = self.__exponential(piece, t, y, step / 2)
+            second = self.__exponential(piece, t + step / 2, first(step / 2), step / 2)
+            y_new = second(step / 2)
+            error = (y_new - full(step)) / 3  # second order: Richardson estimate
+            scale = self.__atol + self.__rtol * max(abs(y), abs(y_new))
+            ratio = abs(error) / scale
+
+            if ratio > 1:
+                self.__rejected += 1
+                h = step * max(0.2, 0.9 * ratio ** (-1 / 3))
+                continue
+
+            self.__steps += 1
+            t_new = bound if step == bound - t else t + step
+
+            def dense(time: np.ndarray, t0=t, h=step, first=first, second=second):
+                s = np.asarray(time) - t0
+                return np.where(s <= h / 2, first(s), second(s - h / 2))
+
+            stop = self.__detectEvents(events, g, t, t_new, y_new, dense, buffer)
+            if stop is not None:
+                t, y = stop
+                break
+
+            buffer.append(time=t_new, moisture=y_new)
+            t, y = t_new, y_new
+            growth = 5 if ratio == 0 else min(5, 0.9 * ratio ** (-1 / 3))
+            # a step cut short by a sample does not shrink the next one
+            h = min(max(step * growth, h if step < h else 0), self.__max_step)
+
+        columns = buffer.columns()
+        return self.outputs(columns["time"], columns["moisture"])
+
+    def __pieces(self, values: np.ndarray) -> tuple[list[float], list[float]]:
+        """(value at the knot, slope) of every piece, as floats for speed."""
+        with np.errstate(divide="ignore", invalid="ignore"):  # repeated samples
+            slopes = np.diff(values) / np.diff(self.__time)
+        return (
+            np.concatenate((values[:1], values)).tolist(),
+            [0.0] + slopes.tolist() + [0.0],
+        )
+
+    def __exponential(
+        self, piece: int, t: float, y: float, h: float
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Exponential midpoint step from (t, y) inside one linear piece of the
+        rate terms: the solution at t + s, s in [0, h], with the rate terms
+        frozen at the step midpoint.
+        """
+        offset = t + h / 2 - self.__knots[piece]
+        source, sink = (
+            values[piece] + slopes[piece] * offset
+            for values, slopes in (self.__source, self.__sink)
+        )
+        equilibrium = source / sink
+        return lambda s: equilibrium + (y - equilibrium) * np.exp(-sink * s)
+
+    def __detectEvents(
+        self,
+        events: list[WheelEvent],
+        g: list[float],
+        t0: float,
+        t1: float,
+        y1: float,
+        dense: Callable[[np.ndarray], np.ndarray],
+        buffer: _ColumnBuffer,
+    ) -> tuple[float, float] | None:
+        """
+        Check the events over an accepted step and record the crossings in
+        time order. Returns (t, moisture) of a terminal event, else None.
+        """
+        if not events:
+            return None
+
+        state = self.outputs(t1, y1)
+        crossings = []
+        for i, event in enumerate(events):
+            g_new = float(event(state))
+            rising, falling = g[i] < 0 <= g_new, g[i] > 0 >= g_new
+            hit = (
+                (rising and event.direction >= 0) or (falling and event.direction <= 0)
+            ) and g[i] != 0
+            g[i] = g_new
+            if not hit:
+                continue
+
+            t_event = bisect(
+                lambda t: event(self.outputs(t, dense(t))),
+                t0,
+                t1,
+                xtol=1e-6 * max(t1 - t0, 1),
+            )
+            crossings.append((t_event, event))
+
+        for t_event, event in sorted(crossings, key=lambda item: item[0]):
+            y_event = float(dense(t_event))
+            self.__events.append((event.name, t_event, y_event))
+            buffer.append(time=t_event, moisture=y_event)
+            if event.terminal:
+                return t_event, y_event
+        return None
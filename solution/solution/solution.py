@@ -4,7 +4,6 @@ from ..input import *
 from .solution_list import SolutionList
 from ..unit_converter import *
 
-
 __all__ = ["Solution"]
 
 
@@ -40,6 +39,11 @@ class Solution:
         self.__specific_heat: float | None = None
         self.__temperature: float | None = None
 
+    @property
+    def sol_list(self) -> SolutionList:
+        """Solution type, whose ``sol_cls`` holds the property equations."""
+        return self.__sol_list
+
     @property
     def concentration(self) -> float:
         """Concentration [%]."""
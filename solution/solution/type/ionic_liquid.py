@@ -1,3 +1,4 @@
+import numpy as np
 from CoolProp.CoolProp import PropsSI
 
 from .abstract_solution import AbstractSolution
@@ -41,7 +42,11 @@ class ILD(AbstractSolution):
         else:
             raise ValueError(f"Unknown purpose: {purpose}")
 
-    def __getPv_T_X(self, T, X):
+    # Property equations, usable on floats or numpy arrays. T [K], X [-].
+
+    @staticmethod
+    def partialPressure(T, X):
+        """Water vapour pressure over the solution [Pa]."""
         a0, a1, a2, a3 = 12.10, -28.01, 50.34, -24.63
         b0, b1, b2, b3 = 1212.67, 772.37, 614.59, 493.33
 
@@ -49,7 +54,66 @@ class ILD(AbstractSolution):
         B = b0 + b1 * X + b2 * X**2 + b3 * X**3
 
         P_mbar = 10 ** (A - B / T)
-        P_Pa = P_mbar * 100
+        return P_mbar * 100
+
+    @staticmethod
+    def humidity(T, X, Pa=101325):
+        """Humidity ratio of air in equilibrium with the solution [kg/kg]."""
+        Pv = ILD.partialPressure(T, X)
+        return 0.62198 * Pv / (Pa - Pv)
+
+    @staticmethod
+    def density(T, X):
+        """[kg/m3]"""
+        a0 = 804.28 + 1.585 * T - 0.0031 * T**2
+        a1 = 1036.04 - 4.42 * T + 0.0057 * T**2
+        a2 = -403.62 + 1.745 * T - 0.0021 * T**2
+
+        return a0 + a1 * X + a2 * X**2
+
+    @staticmethod
+    def enthalpy(T, X):
+        """[kJ/kg]"""
+        T_ref = 0
+
+        return X * (0.00238 * (T**2 - T_ref**2) - 4.01 * (T - T_ref)) + 4.21 * (
+            T - T_ref
+        )
+
+    @staticmethod
+    def specificHeat(T, X):
+        """[kJ/kg/K]"""
+        return (0.00476 * T - 4.01) * X + 4.21
+
+    @staticmethod
+    def temperature(H, X, tol=1e-6, max_iter=1000, T_guess=237.15):
+        """Temperature [K] from enthalpy [kJ/kg] by Newton iteration; arrays
+        are iterated together, each element stopping once converged."""
+        vectorized = np.ndim(H) or np.ndim(X) or np.ndim(T_guess)
+        if vectorized:
+            T = np.broadcast_to(T_guess, np.broadcast(H, X, T_guess).shape) * 1.0
+        else:
+            T = T_guess  # start test temperature
+
+        for _ in range(max_iter):
+            # residual
+            f = ILD.enthalpy(T, X) - H
+            if not vectorized:
+                if abs(f) < tol:
+                    break
+                # Dirivative = Cp(T,X)
+                T -= f / ILD.specificHeat(T, X)
+                continue
+
+            active = np.abs(f) >= tol
+            if not active.any():
+                break
+            T = np.where(active, T - f / ILD.specificHeat(T, X), T)
+
+        return T  # Kelvin
+
+    def __getPv_T_X(self, T, X):
+        P_Pa = ILD.partialPressure(T, X)
 
         self._properties["Pv"] = P_Pa
         return P_Pa
@@ -69,48 +133,25 @@ class ILD(AbstractSolution):
         return w
 
     def __getD_T_X(self, T, X):
-        a0 = 804.28 + 1.585 * T - 0.0031 * T**2
-        a1 = 1036.04 - 4.42 * T + 0.0057 * T**2
-        a2 = -403.62 + 1.745 * T - 0.0021 * T**2
-
-        d = a0 + a1 * X + a2 * X**2
+        d = ILD.density(T, X)
 
         self._properties["D"] = d
         return d
 
     def __getH_T_X(self, T, X):
-        T_ref = 0
-
-        h = X * (0.00238 * (T**2 - T_ref**2) - 4.01 * (T - T_ref)) + 4.21 * (T - T_ref)
+        h = ILD.enthalpy(T, X)
 
         self._properties["H"] = h
         return h
 
     def __getCp_T_X(self, T, X):
-        cp = (0.00476 * T - 4.01) * X + 4.21
+        cp = ILD.specificHeat(T, X)
 
         self._properties["Cp"] = cp
         return cp
 
     def __getT_H_X(self, H, X):
-        T_ref = 0
-        T = 237.15  # start test temperature
-
-        tol = 1e-6
-        max_iter = 1000
-
-        for _ in range(max_iter):
-            h = X * (0.00238 * (T**2 - T_ref**2) - 4.01 * (T - T_ref)) + 4.21 * (
-                T - T_ref
-            )
-            # residual
-            f = h - H
-            if abs(f) < tol:
-                break
-            # Dirivative = Cp(T,X)
-            cp = self.__getCp_T_X(T, X)
-            # refresh
-            T -= f / cp
+        T = ILD.temperature(H, X)
 
         self._properties["T"] = T
         return T  # Kelvin
@@ -0,0 +1,5 @@
+from .fixed_point import *
+from .root_finding import *
+from .warm_start import *
+
+__all__ = fixed_point.__all__ + root_finding.__all__ + warm_start.__all__
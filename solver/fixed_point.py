@@ -0,0 +1,142 @@
+from enum import Enum
+from typing import Callable
+
+import numpy as np
+
+__all__ = ["Acceleration", "FixedPointResult", "fixedPoint"]
+
+
+class Acceleration(Enum):
+    none = "none"  # plain (optionally relaxed) substitution
+    aitken = "aitken"  # vector Aitken / Irons-Tuck dynamic relaxation
+    anderson = "anderson"  # Anderson mixing over the last few updates
+    broyden = "broyden"  # quasi-Newton on g(x) - x, good Broyden inverse update
+
+
+class FixedPointResult:
+    """
+    Outcome of fixedPoint. ``x`` is the last point the map was evaluated
+    at and ``residual`` the largest scaled residual there, so a converged
+    result has residual <= 1. For a batch of rows, ``residual``,
+    ``converged`` and ``diverged`` are per row.
+    """
+
+    def __init__(self, x: np.ndarray, iterations: int, residual: float | np.ndarray):
+        self.__x: np.ndarray = x
+        self.__iterations: int = iterations
+        self.__residual: float | np.ndarray = residual
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.__x
+
+    @property
+    def iterations(self) -> int:
+        """Evaluations of the map."""
+        return self.__iterations
+
+    @property
+    def residual(self) -> float | np.ndarray:
+        return self.__residual
+
+    @property
+    def converged(self) -> bool | np.ndarray:
+        return self.__residual <= 1
+
+    @property
+    def diverged(self) -> bool | np.ndarray:
+        return ~np.isfinite(self.__residual)
+
+
+def fixedPoint(
+    g: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    atol: float | np.ndarray = 1e-9,
+    rtol: float | np.ndarray = 1e-9,
+    max_iter: int = 200,
+    acceleration: Acceleration | str = Acceleration.anderson,
+    mixing: float = 0.5,
+    depth: int = 5,
+) -> FixedPointResult:
+    """
+    Solve x = g(x) by successive substitution with optional acceleration.
+
+    Stops when |g(x) - x| <= atol + rtol * |x| element-wise (the tolerances
+    broadcast against x, so variables of different scale or ones that
+    should not be tested, with atol = inf, can be mixed), when the residual
+    is no longer finite, or after ``max_iter`` evaluations. Never raises on
+    non-convergence; check ``converged`` / ``diverged`` on the result.
+
+    A 2-D ``x0`` is a batch of independent systems, one per row, solved
+    together: g maps the whole batch, each row keeps its own acceleration
+    history and stops moving once it has converged or diverged.
+
+    ``mixing`` is the relaxation of plain and Anderson steps and the
+    initial relaxation of Aitken steps; ``depth`` is the Anderson history.
+    Broyden starts from the inverse Jacobian -mixing * I of g(x) - x, i.e.
+    a relaxed substitution step, and refines it from every update.
+    """
+    acceleration = Acceleration(acceleration)
+    x = np.array(x0, dtype=float)
+    batch = x.ndim == 2
+    x = x if batch else x[None, :]
+    rows, size = x.shape
+    atol, rtol = np.asarray(atol, dtype=float), np.asarray(rtol, dtype=float)
+
+    states, residuals = [], []
+    omega = np.full(rows, float(mixing))
+    previous = None
+    if acceleration is Acceleration.broyden:
+        # inverse Jacobian estimate of g(x) - x, per row
+        H = np.tile(-mixing * np.eye(size), (rows, 1, 1))
+
+    for iteration in range(1, max_iter + 1):
+        residual = np.asarray(g(x if batch else x[0]), dtype=float).reshape(x.shape)
+        residual = residual - x
+        scaled = np.max(
+            np.abs(residual) / (atol + rtol * np.abs(x)), axis=1, initial=0.0
+        )
+        active = np.isfinite(scaled) & (scaled > 1)
+        if not active.any() or iteration == max_iter:
+            break
+        # finished rows keep their point; their history must stay finite
+        residual = np.where(active[:, None], residual, 0.0)
+
+        if acceleration is Acceleration.anderson:
+            states = (states + [x])[-depth - 1 :]
+            residuals = (residuals + [residual])[-depth - 1 :]
+            step = mixing * residual
+            if len(states) > 1:
+                dX = np.diff(states, axis=0)  # k, rows, size
+                dF = np.diff(residuals, axis=0)
+                for row in range(rows):
+                    gamma = np.linalg.lstsq(dF[:, row].T, residual[row], rcond=None)[0]
+                    step[row] -= (dX[:, row].T + mixing * dF[:, row].T) @ gamma
+        elif acceleration is Acceleration.aitken:
+            if previous is not None:
+                for row in range(rows):
+                    change = residual[row] - previous[row]
+                    norm = change @ change
+                    if norm > 0:
+                        omega[row] = -omega[row] * (previous[row] @ change) / norm
+            previous = residual
+            step = omega[:, None] * residual
+        elif acceleration is Acceleration.broyden:
+            if previous is not None:
+                for row in range(rows):
+                    H_change = H[row] @ (residual[row] - previous[row])
+                    denominator = step[row] @ H_change
+                    if denominator != 0:
+                        H[row] += (
+                            np.outer(step[row] - H_change, step[row] @ H[row])
+                            / denominator
+                        )
+            previous = residual
+            step = np.stack([-H[row] @ residual[row] for row in range(rows)])
+        else:
+            step = mixing * residual
+        x = x + np.where(active[:, None], step, 0.0)
+
+    if batch:
+        return FixedPointResult(x, iteration, scaled)
+    return FixedPointResult(x[0], iteration, float(scaled[0]))
@@ -0,0 +1,44 @@
+import math
+from typing import Callable
+
+import numpy as np
+
+__all__ = ["bisect"]
+
+
+def bisect(
+    f: Callable[[np.ndarray], np.ndarray],
+    lo: float | np.ndarray,
+    hi: float | np.ndarray,
+    xtol: float = 1e-6,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    Vectorized bisection. ``f`` is evaluated on whole arrays and every
+    element is bracketed by its own [lo, hi]. Elements whose bracket has no
+    sign change, or where ``f`` turns NaN during the search, are returned
+    as NaN.
+    """
+    lo, hi = np.broadcast_arrays(
+        np.asarray(lo, dtype=float), np.asarray(hi, dtype=float)
+    )
+    lo, hi = lo.copy(), hi.copy()
+
+    f_lo = np.asarray(f(lo), dtype=float)
+    f_hi = np.asarray(f(hi), dtype=float)
+    valid = np.sign(f_lo) * np.sign(f_hi) <= 0
+
+    width = float(np.nanmax(np.abs(hi - lo))) if lo.size else 0.0
+    n_iter = min(max_iter, max(1, math.ceil(math.log2(width / xtol)))) if width else 1
+
+    for _ in range(n_iter):
+        mid = 0.5 * (lo + hi)
+        f_mid = np.asarray(f(mid), dtype=float)
+        valid &= ~np.isnan(f_mid)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+
+    root = np.where(valid, 0.5 * (lo + hi), np.nan)
+    return root if root.ndim else float(root)
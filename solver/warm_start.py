@@ -0,0 +1,196 @@
+import heapq
+from typing import Hashable, Sequence
+
+import numpy as np
+
+__all__ = ["KDTree", "WarmStartStore"]
+
+
+class KDTree:
+    """
+    k-d tree for nearest-neighbour lookup of points added one at a time.
+
+    Points go into a short buffer that is scanned linearly; once it holds
+    more than ``rebuild`` points (or sqrt of the tree size, whichever is
+    larger) the tree is rebuilt balanced by median splits, so sweeps that
+    add points in sorted order do not degrade it into a list.
+    """
+
+    def __init__(self, dimension: int, rebuild: int = 32):
+        self.__dimension: int = dimension
+        self.__rebuild: int = rebuild
+
+        self.__points: list[np.ndarray] = []
+        self.__values: list[object] = []
+        self.__tree: np.ndarray = np.empty((0, dimension))  # points in the tree
+        self.__root: tuple = None  # (index, axis, left, right)
+
+    def __len__(self) -> int:
+        return len(self.__points)
+
+    def add(self, point: Sequence[float], value: object):
+        """Add ``value`` at ``point``; an equal point has its value replaced."""
+        point = np.asarray(point, dtype=float)
+        if point.shape != (self.__dimension,):
+            raise ValueError(f"Point must have {self.__dimension} coordinates")
+
+        found = self.nearest(point)
+        if found and found[0][2] == 0:
+            self.__values[found[0][0]] = value
+            return
+
+        self.__points.append(point)
+        self.__values.append(value)
+        buffered = len(self.__points) - len(self.__tree)
+        if buffered > max(self.__rebuild, np.sqrt(len(self.__tree))):
+            self.__build()
+
+    def nearest(
+        self, point: Sequence[float], k: int = 1
+    ) -> list[tuple[int, object, float]]:
+        """
+        (insertion index, value, Euclidean distance) of the ``k`` nearest
+        points, nearest first.
+        """
+        point = np.asarray(point, dtype=float)
+        best: list[tuple[float, int]] = []  # max-heap on -distance
+        if self.__root is not None:
+            self.__search(self.__root, point, best, k)
+
+        start = len(self.__tree)
+        if start < len(self.__points):
+            distances = np.linalg.norm(np.array(self.__points[start:]) - point, axis=1)
+            for index, distance in enumerate(distances):
+                self.__push(best, float(distance), start + index, k)
+
+        return [
+            (index, self.__values[index], -distance)
+            for distance, index in sorted(best, reverse=True)
+        ]
+
+    def clear(self):
+        self.__points.clear()
+        self.__values.clear()
+        self.__tree = np.empty((0, self.__dimension))
+        self.__root = None
+
+    def __build(self):
+        self.__tree = np.array(self.__points)
+
+        def split(indices: np.ndarray, depth: int) -> tuple:
+            if indices.size == 0:
+                return None
+            axis = depth % self.__dimension
+            indices = indices[np.argsort(self.__tree[indices, axis], kind="stable")]
+            middle = indices.size // 2
+            return (
+                int(indices[middle]),
+                axis,
+                split(indices[:middle], depth + 1),
+                split(indices[middle + 1 :], depth + 1),
+            )
+
+        self.__root = split(np.arange(len(self.__tree)), 0)
+
+    def __search(self, node: tuple, point: np.ndarray, best: list, k: int):
+        index, axis, left, right = node
+        self.__push(best, float(np.linalg.norm(self.__tree[index] - point)), index, k)
+
+        offset = point[axis] - self.__tree[index, axis]
+        near, far = (left, right) if offset < 0 else (right, left)
+        if near is not None:
+            self.__search(near, point, best, k)
+        if far is not None and (len(best) < k or abs(offset) < -best[0][0]):
+            self.__search(far, point, best, k)
+
+    @staticmethod
+    def __push(best: list, distance: float, index: int, k: int):
+        if len(best) < k:
+            heapq.heappush(best, (-distance, index))
+        elif distance < -best[0][0]:
+            heapq.heapreplace(best, (-distance, index))
+
+
+class WarmStartStore:
+    """
+    Converged solver states (e.g. tear vectors) indexed by operating point,
+    to start a new solve from the ones already solved nearby.
+
+    States are grouped by a hashable ``tag`` (system and discrete options
+    such as hx_on) and looked up in a KDTree over the continuous
+    coordinates. The system classes use air temperature [C], air relative
+    humidity [%], water temperature [C] and target temperature [C], so one
+    unit of distance is about 1 K or 1 %RH. Points farther than
+    ``max_distance`` are not used.
+
+    With several stored ``neighbours`` in range and the new point inside
+    their span (their bounding box), the guess is their least-squares
+    affine fit evaluated there; otherwise it is the nearest state. The
+    fit is never extrapolated, since the loops can leave the property
+    range from a guess that is far off. A guess is only a starting point:
+    callers should fall back to their cold start if it fails.
+    """
+
+    __shared: "WarmStartStore" = None
+
+    def __init__(self, max_distance: float = 2.0, neighbours: int = 3):
+        self.__max_distance: float = max_distance
+        self.__neighbours: int = neighbours
+
+        self.__trees: dict[Hashable, KDTree] = {}
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @classmethod
+    def shared(cls) -> "WarmStartStore":
+        """Process-wide store used by the system classes."""
+        if cls.__shared is None:
+            cls.__shared = cls()
+        return cls.__shared
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def __len__(self) -> int:
+        return sum(len(tree) for tree in self.__trees.values())
+
+    def clear(self):
+        self.__trees.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def add(self, tag: Hashable, point: Sequence[float], state: Sequence[float]):
+        point = np.asarray(point, dtype=float)
+        tree = self.__trees.get(tag)
+        if tree is None:
+            tree = self.__trees[tag] = KDTree(point.size)
+        tree.add(point, (point, np.array(state, dtype=float)))
+
+    def nearest(self, tag: Hashable, point: Sequence[float]) -> np.ndarray | None:
+        """Starting state for ``point`` from the stored neighbours, or None."""
+        point = np.asarray(point, dtype=float)
+        tree = self.__trees.get(tag)
+        found = [] if tree is None else tree.nearest(point, self.__neighbours)
+        found = [
+            value for _, value, distance in found if distance <= self.__max_distance
+        ]
+        if not found:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+
+        points = np.array([p for p, _ in found])
+        states = np.array([state for _, state in found])
+        inside = np.all((points.min(axis=0) <= point) & (point <= points.max(axis=0)))
+        if len(found) == 1 or not inside:
+            return states[0].copy()
+
+        # affine fit about the nearest state; minimum norm in unsampled directions
+        slope = np.linalg.lstsq(points[1:] - points[0], states[1:] - states[0])[0]
+        guess = states[0] + (point - points[0]) @ slope
+        return guess if np.all(np.isfinite(guess)) else states[0].copy()
@@ -1,4 +1,4 @@
-from coolingtower import CoolingTower
+from coolingtower import CoolingTower, CoolingTowerCache
 from pyfluids import HumidAir, InputHumidAir, Fluid, FluidsList, Input
 from fanpump import Pump
 
@@ -34,6 +34,7 @@ class BaseSys:
         self.__m_air = 1  # 空氣質量流率 (kg/s)
 
         self.__CT: CoolingTower = None
+        self.__ct_cache: CoolingTowerCache = CoolingTowerCache.shared()
 
         self.__LG: float = self.__m_water / self.__m_air
         self.__CT_outlet_air: HumidAir = CT_outlet_air
@@ -83,7 +84,7 @@ class BaseSys:
         建立冷卻塔，並回傳 CoolingTower 物件
         """
         if self.__CT_outlet_air is None:
-            self.__CT = CoolingTower(
+            self.__CT = self.__ct_cache.get(
                 self.__air,
                 self.__water.temperature,
                 self.__m_water,
@@ -91,7 +92,7 @@ class BaseSys:
                 self.__target_temp,
             )
         else:
-            self.__CT = CoolingTower(
+            self.__CT = self.__ct_cache.get(
                 self.__air,
                 self.__water.temperature,
                 self.__m_water,
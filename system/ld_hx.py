@@ -1,9 +1,17 @@
-from ldac import LiquidDesiccantSystem
+import numpy as np
+
+from ldac import (
+    ContactorGeometry,
+    LiquidDesiccantKernel,
+    LiquidDesiccantSystem,
+    SolutionState,
+)
 from wasteheat import HeatExchanger, HeatPump, Refrigerant
-from coolingtower import CoolingTower
+from coolingtower import CoolingTower, CoolingTowerCache
 from pyfluids import HumidAir, InputHumidAir, Fluid, FluidsList, Input
 from solution import Solution, InputSolution
 from fanpump import Fan, Pump
+from solver import Acceleration, FixedPointResult, WarmStartStore, fixedPoint
 
 __all__ = ["LD_HX"]
 
@@ -20,9 +28,15 @@ class LD_HX:
         inlet_water_temp: float = 55,
         target_temp: float = 30,
         hx_on: bool = True,
+        dehumid_eff: float | ContactorGeometry = 0.64,
+        tol: float = 1e-9,  # 溶液迴路收斂容差（絕對與相對）
+        max_iter: int = 1000,
+        warm_start: bool = False,  # 以共用儲存中鄰近操作點的收斂狀態作為迭代初值
     ):
         # 是否啟用熱交換器迴路
         self.__hx_on: bool = hx_on
+        # 除濕效率，或以填料幾何計算隨流量變化的效率
+        self.__dehumid_eff: float | ContactorGeometry = dehumid_eff
 
         # 初始水、空氣條件
         self.__water = Fluid(FluidsList.Water).with_state(
@@ -53,6 +67,7 @@ class LD_HX:
         self.__m_sol = 2  # 溶液質量流率 (kg/s)
 
         self.__CT: CoolingTower = None
+        self.__ct_cache: CoolingTowerCache = CoolingTowerCache.shared()
         self.__CT_sol: CoolingTower = None
         self.__LG: float = self.__m_water / self.__m_air
         self.__CT_outlet_air: HumidAir = CT_outlet_air
@@ -62,6 +77,21 @@ class LD_HX:
         self.__abs: LiquidDesiccantSystem = None
         self.__reg: LiquidDesiccantSystem = None
 
+        # 溶液迴路收斂控制
+        self.__tol: float = tol
+        self.__max_iter: int = max_iter
+        self.__salt: float = None
+        self.__iterations: int = None
+        self.__residual: float = None
+        self.__warm_start: bool = warm_start
+
+        # 溶液冷卻用冷卻水塔的出水條件
+        self.__sol_CT_water = Fluid(FluidsList.Water).with_state(
+            Input.pressure(101325), Input.temperature(25)
+        )
+        self.__m_water_sol_CT = 1.01
+        self.__m_water_sol_HX_CT = 0.651
+
         self.__pump: Pump = None
         self.__pump_abs: Pump = None
         self.__pump_reg: Pump = None
@@ -104,6 +134,20 @@ class LD_HX:
             self.__setLiqDesSystem()
         return self.__reg
 
+    @property
+    def iterations(self) -> int:
+        """溶液迴路收斂所需的迭代次數"""
+        if self.__iterations is None:
+            self.__setLiqDesSystem()
+        return self.__iterations
+
+    @property
+    def residual(self) -> float:
+        """溶液迴路最終殘差（相對於容差，<= 1 即收斂）"""
+        if self.__residual is None:
+            self.__setLiqDesSystem()
+        return self.__residual
+
     @property
     def CT(self) -> CoolingTower:
         if self.__CT is None:
@@ -160,47 +204,38 @@ class LD_HX:
             )
         return self.__total_work
 
-    def __coolingSolSys(self, sys: LiquidDesiccantSystem) -> Solution:
-        """
-        無熱交換器模式：直接對再生溶液與除濕出水進行處理
-        """
-        water = Fluid(FluidsList.Water).with_state(
-            Input.pressure(101325), Input.temperature(25)
+    def __solution(self, state: SolutionState) -> Solution:
+        return self.__sol_type.withState(
+            InputSolution.temperature(state.T),
+            InputSolution.concentration(state.X),
         )
-        m_water_sol_CT = 1.01
 
-        HX = HeatExchanger(sys.outlet_solution, sys.m_s_out, water, m_water_sol_CT)
-        sol_out = sys.inlet_solution.withState(
-            InputSolution.temperature(HX.outlet_hot.temperature),
-            InputSolution.concentration(HX.outlet_hot.concentration),
-        )
-
-        self.__CT_sol = CoolingTower(
-            self.__air, HX.outlet_cold.temperature, m_water_sol_CT, self.__LG, 25
+    def __liqDesSystem(self, solution: Solution, m_sol: float) -> LiquidDesiccantSystem:
+        return LiquidDesiccantSystem(
+            self.__sol_type,
+            self.__air,
+            solution,
+            self.__m_air,
+            m_sol,
+            self.__dehumid_eff,
         )
-        return sol_out
 
-    def __coolingSolHx(self, hx: HeatExchanger) -> Solution:
+    def __coolingSol(self, state: SolutionState, m_water_sol: float) -> Solution:
         """
-        有熱交換器模式：使用傳入的 HeatExchanger 對吸附與再生環進行處理
+        以冷卻水塔出水冷卻溶液，並建立對應的溶液冷卻水塔
         """
-        water = Fluid(FluidsList.Water).with_state(
-            Input.pressure(101325), Input.temperature(25)
+        HX = HeatExchanger(
+            self.__solution(state), state.m, self.__sol_CT_water, m_water_sol
         )
-        m_water_sol_HX_CT = 0.651
-
-        HX = HeatExchanger(hx.outlet_hot, hx.m_hot, water, m_water_sol_HX_CT)
-        sol_out = hx.inlet_hot.withState(
-            InputSolution.temperature(HX.outlet_hot.temperature),
-            InputSolution.concentration(HX.outlet_hot.concentration),
-        )
-
-        self.__CT_sol = CoolingTower(
-            self.__air, HX.outlet_cold.temperature, m_water_sol_HX_CT, self.__LG, 25
+        self.__CT_sol = self.__ct_cache.get(
+            self.__air, HX.outlet_cold.temperature, m_water_sol, self.__LG, 25
         )
-        return sol_out
+        return HX.outlet_hot
 
-    def __setLiqDesSystem(self, iterations: int = 1000):
+    def __initialTear(self) -> list[float]:
+        """
+        以初始溶液依序通過除濕、加熱與再生，作為撕裂變數的初值
+        """
         # 初始除濕與再生系統
         abs = LiquidDesiccantSystem(
             self.__sol_type,
@@ -208,85 +243,151 @@ class LD_HX:
             self.__init_solution,
             self.__m_air,
             self.__m_sol,
-            0.64,
+            self.__dehumid_eff,
         )
 
-        self.__HX = HeatExchanger(
+        HX = HeatExchanger(
             self.__water, self.__m_water, abs.outlet_solution, abs.m_s_out
         )
 
         reg = LiquidDesiccantSystem(
             self.__sol_type,
             self.__air,
-            self.__HX.outlet_cold,
+            HX.outlet_cold,
             self.__m_air,
-            self.__HX.m_cold,
-            0.64,
+            HX.m_cold,
+            self.__dehumid_eff,
         )
 
         if self.__hx_on:
-            for _ in range(iterations):
-                HX_cycle = HeatExchanger(
-                    reg.outlet_solution,
-                    reg.m_s_out,
-                    abs.outlet_solution,
-                    abs.m_s_out,
-                )
-                abs_sol = self.__coolingSolHx(HX_cycle)
-                abs = LiquidDesiccantSystem(
-                    self.__sol_type,
-                    self.__air,
-                    abs_sol,
-                    self.__m_air,
-                    reg.m_s_out,
-                    0.64,
-                )
+            return [
+                abs.inlet_solution.temperature,
+                self.__m_sol,
+                reg.inlet_solution.temperature,
+                abs.m_s_out,
+            ]
+        return [reg.inlet_solution.temperature, abs.m_s_out]
+
+    def __tag(self) -> tuple:
+        """熱啟動分組：系統、熱交換器模式與影響迴路的設定"""
+        CT_outlet_air = self.__CT_outlet_air
+        return (
+            "LD_HX",
+            self.__hx_on,
+            self.__dehumid_eff,
+            None if CT_outlet_air is None else CT_outlet_air.enthalpy,
+        )
 
-                self.__HX = HeatExchanger(
-                    self.__water, self.__m_water, HX_cycle.outlet_cold, abs.m_s_out
-                )
+    def __point(self) -> tuple[float, float, float, float]:
+        """熱啟動索引座標：空氣溫度、相對濕度、熱水溫度、目標溫度"""
+        return (
+            self.__air.temperature,
+            self.__air.relative_humidity,
+            self.__water.temperature,
+            self.__target_temp,
+        )
+
+    def __setLiqDesSystem(self):
+        """
+        溶液迴路以 SolutionState 浮點狀態迭代，收斂後才建立元件物件
+        """
+        K = LiquidDesiccantKernel(
+            self.__sol_type, self.__air, self.__m_air, self.__dehumid_eff
+        )
+        # 迴路中鹽流量守恆，撕裂變數只取溶液溫度與流量
+        # hx_on 時舊迴路的鹽流量由 1.600 漂移至 1.591 kg/s，守恆後結果差約 0.1 %
+        self.__salt = salt = self.__m_sol * self.__init_solution.concentration
+        last = {}
 
-                reg = LiquidDesiccantSystem(
-                    self.__sol_type,
-                    self.__air,
-                    self.__HX.outlet_cold,
-                    self.__m_air,
-                    self.__HX.m_cold,
-                    0.64,
+        if self.__hx_on:
+            # 撕裂變數：除濕與再生入口的 (溫度, 流量)
+            def cycle(x: np.ndarray) -> np.ndarray:
+                abs = K.contact(SolutionState(x[0], salt / x[1], x[1]))
+                reg = K.contact(SolutionState(x[2], salt / x[3], x[3]))
+
+                cycle_hot, cycle_cold = K.exchange(reg, abs)
+                abs_sol = K.exchangeWater(
+                    cycle_hot, self.__sol_CT_water, self.__m_water_sol_HX_CT
                 )
+                abs = K.contact(abs_sol)
+
+                recovered = SolutionState(cycle_cold.T, cycle_cold.X, abs.m)
+                heated = K.exchangeWater(recovered, self.__water, self.__m_water)
+                last.update(cooling=cycle_hot, recovered=recovered)
+                return np.array([abs_sol.T, reg.m, heated.T, abs.m])
+
         else:
-            for _ in range(iterations):
-                abs_sol = self.__coolingSolSys(reg)
-                abs = LiquidDesiccantSystem(
-                    self.__sol_type,
-                    self.__air,
-                    abs_sol,
-                    self.__m_air,
-                    reg.m_s_out,
-                    0.64,
-                )
+            # 撕裂變數：再生入口的 (溫度, 流量)
+            def cycle(x: np.ndarray) -> np.ndarray:
+                reg = K.contact(SolutionState(x[0], salt / x[1], x[1]))
 
-                self.__HX = HeatExchanger(
-                    self.__water, self.__m_water, abs.outlet_solution, abs.m_s_out
+                abs_sol = K.exchangeWater(
+                    reg, self.__sol_CT_water, self.__m_water_sol_CT
                 )
+                abs = K.contact(abs_sol)
+
+                heated = K.exchangeWater(abs, self.__water, self.__m_water)
+                last.update(cooling=reg)
+                return np.array([heated.T, abs.m])
+
+        def solve(x0: list[float]) -> FixedPointResult:
+            return fixedPoint(
+                cycle,
+                x0,
+                atol=self.__tol,
+                rtol=self.__tol,
+                max_iter=self.__max_iter,
+                acceleration=Acceleration.anderson,
+                mixing=1.0,
+            )
 
-                reg = LiquidDesiccantSystem(
-                    self.__sol_type,
-                    self.__air,
-                    self.__HX.outlet_cold,
-                    self.__m_air,
-                    self.__HX.m_cold,
-                    0.64,
-                )
-        self.__abs = abs
-        self.__reg = reg
+        # 由鄰近操作點的收斂狀態熱啟動，失敗時改由初始溶液重新求解
+        store = WarmStartStore.shared() if self.__warm_start else None
+        x0 = None if store is None else store.nearest(self.__tag(), self.__point())
+        result, passes = None, 0
+        if x0 is not None:
+            try:
+                result = solve(x0)
+                passes = result.iterations
+            except ValueError:  # 初值使物性超出範圍
+                result = None
+        if result is None or not result.converged:
+            result = solve(self.__initialTear())
+            passes += result.iterations
+
+        if not result.converged:
+            raise ValueError(
+                f"Solution loop did not converge after {result.iterations} "
+                f"passes (residual {result.residual:.3g} x tol)"
+            )
+        self.__iterations = passes
+        self.__residual = result.residual
+        if store is not None:
+            store.add(self.__tag(), self.__point(), result.x)
+
+        # 以收斂狀態建立一次元件物件
+        cooling = last["cooling"]
+        if self.__hx_on:
+            abs_sol = self.__coolingSol(cooling, self.__m_water_sol_HX_CT)
+        else:
+            abs_sol = self.__coolingSol(cooling, self.__m_water_sol_CT)
+        self.__abs = self.__liqDesSystem(abs_sol, cooling.m)
+
+        if self.__hx_on:
+            heated_sol = self.__solution(last["recovered"])
+        else:
+            heated_sol = self.__abs.outlet_solution
+        self.__HX = HeatExchanger(
+            self.__water, self.__m_water, heated_sol, self.__abs.m_s_out
+        )
+        self.__reg = self.__liqDesSystem(self.__HX.outlet_cold, self.__HX.m_cold)
 
     def __setCoolingTower(self):
         """
         建立冷卻塔，並回傳 CoolingTower 物件
         """
         if self.__CT_outlet_air is None:
-            self.__CT = CoolingTower(
+            self.__CT = self.__ct_cache.get(
                 self.abs.outlet_air,
                 self.__HX.outlet_hot.temperature,
                 self.__m_water,
@@ -294,7 +395,7 @@ class LD_HX:
                 self.__target_temp,
             )
         else:
-            self.__CT = CoolingTower(
+            self.__CT = self.__ct_cache.get(
                 self.abs.outlet_air,
                 self.__HX.outlet_hot.temperature,
                 self.__m_water,
@@ -1,8 +1,9 @@
 from sdac import SolidDesiccantSystem
 from wasteheat import HeatExchanger, HeatPump, Refrigerant
-from coolingtower import CoolingTower
+from coolingtower import CoolingTower, CoolingTowerCache
 from pyfluids import HumidAir, InputHumidAir, Fluid, FluidsList, Input
 from fanpump import Fan, Pump
+from solver import WarmStartStore
 
 __all__ = ["SD_HP"]
 
@@ -19,6 +20,10 @@ class SD_HP:
         inlet_water_temp: float = 55,
         target_temp: float = 30,
         hx_on: bool = True,
+        tol: float = 1e-12,  # 轉輪含水量收斂容差 (kg/kg)
+        max_iter: int = 100,
+        relaxation: float = 1.0,  # 熱回收耦合迭代的初始鬆弛係數
+        warm_start: bool = False,  # 以共用儲存中鄰近操作點的收斂含水量作為迭代初值
     ):
         # 是否啟用熱交換器迴路
         self.__hx_on = hx_on
@@ -48,6 +53,7 @@ class SD_HP:
         self.__HP: HeatPump = None
 
         self.__CT: CoolingTower = None
+        self.__ct_cache: CoolingTowerCache = CoolingTowerCache.shared()
         self.__LG: float = self.__m_water / self.__m_air
         self.__CT_outlet_air: HumidAir = CT_outlet_air
 
@@ -68,6 +74,15 @@ class SD_HP:
         self.__total_work: float = None
 
         self.__hp_in_air: HumidAir = None
+        self.__HX_cycle: HeatExchanger = None
+
+        # 轉輪含水量收斂控制
+        self.__tol: float = tol
+        self.__max_iter: int = max_iter
+        self.__relaxation: float = relaxation
+        self.__warm_start: bool = warm_start
+        self.__iterations: int = None
+        self.__residual: float = None
 
     @property
     def water(self):
@@ -103,6 +118,20 @@ class SD_HP:
             self.__setSolidDesSystem()
         return self.__reg
 
+    @property
+    def iterations(self) -> int:
+        """熱回收耦合迭代次數（未耦合時為 0）"""
+        if self.__iterations is None:
+            self.__setSolidDesSystem()
+        return self.__iterations
+
+    @property
+    def residual(self) -> float:
+        """轉輪含水量最終殘差（相對於容差，<= 1 即收斂）"""
+        if self.__residual is None:
+            self.__setSolidDesSystem()
+        return self.__residual
+
     @property
     def CT(self) -> CoolingTower:
         if self.__CT is None:
@@ -157,70 +186,99 @@ class SD_HP:
             self.__m_air,
         )
 
-    def __setSolidDesSystem(self, iterations: int = 1000):
-        # 初始除濕與再生系統
-        ads = SolidDesiccantSystem(self.__air, self.__m_air, 0)
-
+    def __setSolidDesSystem(self):
+        # 第一階段：未耦合熱回收，再生空氣以固定熱量加熱環境空氣
         Q = 20.493519919167444 if self.__hx_on else self.HP.Q_cond
-        print(self.HP.Q_cond)
         reg_air = HumidAir().with_state(
             InputHumidAir.pressure(101325),  # Pa
             InputHumidAir.enthalpy(self.__air.enthalpy + Q / self.__m_air * 1e3),
             InputHumidAir.humidity(self.__air.humidity),
         )
-        reg = SolidDesiccantSystem(reg_air, self.__m_air_reg, ads.current_moisture)
 
         if self.__hx_on:
-            for _ in range(iterations):
-                if _ > 300:
-                    HX_cycle = HeatExchanger(
-                        ads.outlet_air, self.__m_air, self.__air, self.__m_air, 0.3
-                    )
-
-                    self.__hp_in_air = HumidAir().with_state(
-                        InputHumidAir.pressure(101325),  # Pa
-                        InputHumidAir.enthalpy(HX_cycle.outlet_cold.enthalpy),
-                        InputHumidAir.humidity(HX_cycle.outlet_cold.humidity),
-                    )
-
-                    reg_air = HumidAir().with_state(
-                        InputHumidAir.pressure(101325),  # Pa
-                        InputHumidAir.enthalpy(
-                            HX_cycle.outlet_cold.enthalpy
-                            + self.HP.Q_cond / self.__m_air * 1e3
-                        ),
-                        InputHumidAir.humidity(HX_cycle.outlet_cold.humidity),
-                    )
-
-                ads = SolidDesiccantSystem(
-                    self.__air, self.__m_air, reg.current_moisture
+            # 第二階段：再生空氣經吸附出口熱回收後由熱泵加熱，隨吸附段狀態改變
+            def regenerationAir(ads: SolidDesiccantSystem) -> HumidAir:
+                HX_cycle = HeatExchanger(
+                    ads.outlet_air, self.__m_air, self.__air, self.__m_air, 0.3
+                )
+                self.__hp_in_air = HumidAir().with_state(
+                    InputHumidAir.pressure(101325),  # Pa
+                    InputHumidAir.enthalpy(HX_cycle.outlet_cold.enthalpy),
+                    InputHumidAir.humidity(HX_cycle.outlet_cold.humidity),
+                )
+                self.__HX_cycle = HX_cycle
+                return HumidAir().with_state(
+                    InputHumidAir.pressure(101325),  # Pa
+                    InputHumidAir.enthalpy(
+                        HX_cycle.outlet_cold.enthalpy
+                        + self.HP.Q_cond / self.__m_air * 1e3
+                    ),
+                    InputHumidAir.humidity(HX_cycle.outlet_cold.humidity),
                 )
 
-                reg = SolidDesiccantSystem(
-                    reg_air, self.__m_air_reg, ads.current_moisture
+            def solve(moisture: float = None):
+                return SolidDesiccantSystem.solveCycle(
+                    self.__air,
+                    self.__m_air,
+                    regenerationAir,
+                    self.__m_air_reg,
+                    tol=self.__tol,
+                    max_iter=self.__max_iter,
+                    uncoupled_reg_air=reg_air,
+                    relaxation=self.__relaxation,
+                    initial_moisture=moisture,
                 )
 
-            ads.setOutletAir(HX_cycle.outlet_hot)
+            # 由鄰近操作點的收斂含水量熱啟動，未收斂時改由未耦合解重新求解
+            store = WarmStartStore.shared() if self.__warm_start else None
+            stored = (
+                None if store is None else store.nearest(self.__tag(), self.__point())
+            )
+            solved = None
+            if stored is not None:
+                try:
+                    solved = solve(float(stored[0]))
+                except ValueError:  # 熱啟動未收斂
+                    pass
+            ads, reg, result = solve() if solved is None else solved
+            ads.setOutletAir(self.__HX_cycle.outlet_hot)
+            if store is not None:
+                store.add(self.__tag(), self.__point(), result.x)
 
         else:
-            for _ in range(iterations):
-                ads = SolidDesiccantSystem(
-                    self.__air, self.__m_air, reg.current_moisture
-                )
-
-                reg = SolidDesiccantSystem(
-                    reg_air, self.__m_air_reg, ads.current_moisture
-                )
+            ads, reg, result = SolidDesiccantSystem.solveCycle(
+                self.__air, self.__m_air, reg_air, self.__m_air_reg
+            )
 
+        self.__iterations = result.iterations
+        self.__residual = result.residual
         self.__ads = ads
         self.__reg = reg
 
+    def __tag(self) -> tuple:
+        """熱啟動分組：系統、熱交換器模式與冷卻塔出口空氣設定"""
+        CT_outlet_air = self.__CT_outlet_air
+        return (
+            "SD_HP",
+            self.__hx_on,
+            None if CT_outlet_air is None else CT_outlet_air.enthalpy,
+        )
+
+    def __point(self) -> tuple[float, float, float, float]:
+        """熱啟動索引座標：空氣溫度、相對濕度、熱水溫度、目標溫度"""
+        return (
+            self.__air.temperature,
+            self.__air.relative_humidity,
+            self.__water.temperature,
+            self.__target_temp,
+        )
+
     def __setCoolingTower(self):
         """
         建立冷卻塔，並回傳 CoolingTower 物件
         """
         if self.__CT_outlet_air is None:
-            self.__CT = CoolingTower(
+            self.__CT = self.__ct_cache.get(
                 self.CoolHX.outlet_hot,
                 self.HP.outlet_evap.temperature,
                 self.__m_water,
@@ -228,7 +286,7 @@ class SD_HP:
                 self.__target_temp,
             )
         else:
-            self.__CT = CoolingTower(
+            self.__CT = self.__ct_cache.get(
                 self.CoolHX.outlet_hot,
                 self.HP.outlet_evap.temperature,
                 self.__m_water,
@@ -1,5 +1,17 @@
+from .effectiveness import *
 from .heat_exchanger import *
+from .heat_exchanger_array import *
+from .heat_exchanger_network import *
 from .heat_pump import *
 from .refrigerant import *
+from .refrigerant_screening import *
 
-__all__ = heat_exchanger.__all__ + heat_pump.__all__ + refrigerant.__all__
+__all__ = (
+    effectiveness.__all__
+    + heat_exchanger.__all__
+    + heat_exchanger_array.__all__
+    + heat_exchanger_network.__all__
+    + heat_pump.__all__
+    + refrigerant.__all__
+    + refrigerant_screening.__all__
+)
@@ -0,0 +1,59 @@
+from enum import Enum
+
+import numpy as np
+
+__all__ = ["FlowArrangement", "effectivenessNTU"]
+
+
+class FlowArrangement(Enum):
+    counterflow = "counterflow"
+    parallel = "parallel"
+    crossflow_unmixed = "crossflow_unmixed"  # both streams unmixed
+    crossflow_mixed = "crossflow_mixed"  # both streams mixed
+    crossflow_cmax_mixed = "crossflow_cmax_mixed"  # C_max mixed, C_min unmixed
+    crossflow_cmin_mixed = "crossflow_cmin_mixed"  # C_min mixed, C_max unmixed
+
+
+def effectivenessNTU(
+    NTU: float | np.ndarray,
+    Cr: float | np.ndarray,
+    arrangement: FlowArrangement | str = FlowArrangement.counterflow,
+) -> float | np.ndarray:
+    """
+    Heat exchanger effectiveness from NTU = UA / C_min and Cr = C_min / C_max.
+    Works element-wise on arrays; Cr -> 0 and Cr = 1 are handled explicitly.
+    """
+    arrangement = FlowArrangement(arrangement)
+    NTU, Cr = np.broadcast_arrays(
+        np.asarray(NTU, dtype=float), np.asarray(Cr, dtype=float)
+    )
+
+    # Cr = 0: one stream does not change temperature, all arrangements agree
+    eps_zero = 1 - np.exp(-NTU)
+    small = Cr < 1e-9
+    Cr_safe = np.where(small, 1.0, Cr)
+
+    if arrangement is FlowArrangement.counterflow:
+        balanced = np.abs(1 - Cr) < 1e-9
+        Cr_cf = np.where(balanced | small, 0.5, Cr)
+        e = np.exp(-NTU * (1 - Cr_cf))
+        eps = np.where(balanced, NTU / (1 + NTU), (1 - e) / (1 - Cr_cf * e))
+    elif arrangement is FlowArrangement.parallel:
+        eps = (1 - np.exp(-NTU * (1 + Cr))) / (1 + Cr)
+    elif arrangement is FlowArrangement.crossflow_unmixed:
+        eps = 1 - np.exp(NTU**0.22 / Cr_safe * (np.exp(-Cr_safe * NTU**0.78) - 1))
+    elif arrangement is FlowArrangement.crossflow_mixed:
+        NTU_safe = np.where(NTU > 0, NTU, 1.0)
+        eps = 1 / (
+            1 / (1 - np.exp(-NTU_safe))
+            + Cr_safe / (1 - np.exp(-Cr_safe * NTU_safe))
+            - 1 / NTU_safe
+        )
+        eps = np.where(NTU > 0, eps, 0.0)
+    elif arrangement is FlowArrangement.crossflow_cmax_mixed:
+        eps = (1 - np.exp(-Cr_safe * (1 - np.exp(-NTU)))) / Cr_safe
+    else:
+        eps = 1 - np.exp(-(1 - np.exp(-Cr_safe * NTU)) / Cr_safe)
+
+    eps = np.where(small, eps_zero, eps)
+    return eps if eps.ndim else float(eps)
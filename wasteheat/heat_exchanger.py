@@ -1,10 +1,52 @@
 from pyfluids import HumidAir, InputHumidAir, Fluid, Input
 from solution import Solution, InputSolution
 
+from .effectiveness import FlowArrangement, effectivenessNTU
 
 __all__ = ["HeatExchanger"]
 
 
+def _streamKind(fluid) -> type:
+    """Resolve the stream type once: HumidAir, Fluid or Solution."""
+    if isinstance(fluid, HumidAir):
+        return HumidAir
+    elif isinstance(fluid, Fluid):
+        return Fluid
+    elif isinstance(fluid, Solution):
+        return Solution
+    raise TypeError("Unsupported fluid type: {}".format(type(fluid)))
+
+
+def _cpT(kind: type, fluid) -> tuple[float, float]:
+    """
+    Return (cp [J/kg/K], T_in [C]) for a stream of an already resolved kind.
+    HumidAir: cp = fluid.specific_heat, T = fluid.temperature
+    Fluid: cp = fluid.specific_heat, T = fluid.temperature
+    Solution: cp = fluid.specific_heat * 1e3, T = fluid.temperature.toC
+    """
+    if kind is Solution:
+        return fluid.specific_heat * 1e3, fluid.temperature.toC
+    return fluid.specific_heat, fluid.temperature
+
+
+def _outlet(kind: type, inlet_fluid, T_out: float):
+    """Outlet stream of the same kind as ``inlet_fluid`` at ``T_out`` [C]."""
+    if kind is HumidAir:
+        return HumidAir().with_state(
+            InputHumidAir.pressure(inlet_fluid.pressure),
+            InputHumidAir.temperature(T_out),
+            InputHumidAir.humidity(inlet_fluid.humidity),
+        )
+    elif kind is Fluid:
+        return inlet_fluid.with_state(
+            Input.temperature(T_out), Input.pressure(inlet_fluid.pressure)
+        )
+    return inlet_fluid.withState(
+        InputSolution.temperature(T_out + 273.15),
+        InputSolution.concentration(inlet_fluid.concentration),
+    )
+
+
 class HeatExchanger:
     def __init__(
         self,
@@ -13,6 +55,8 @@ class HeatExchanger:
         inlet_cold: HumidAir | Fluid | Solution,
         m_cold: float,
         efficiency_rate: float = 0.80,
+        UA: float = None,  # W/K, switches to the effectiveness-NTU model
+        arrangement: FlowArrangement = FlowArrangement.counterflow,
     ):
 
         self.__inlet_hot = inlet_hot
@@ -20,36 +64,25 @@ class HeatExchanger:
         self.__m_hot = m_hot
         self.__m_cold = m_cold
         self.__efficiency_rate = efficiency_rate
+        self.__UA = UA
+        self.__arrangement = FlowArrangement(arrangement)
+        self.__effectiveness: float = None
+
+        self.__hot_kind: type = _streamKind(inlet_hot)
+        self.__cold_kind: type = _streamKind(inlet_cold)
 
         self.__cp_hot: float = None
         self.__cp_cold: float = None
         self.__T_hot_in: float = None
         self.__T_cold_in: float = None
 
+        self.__T_hot_out: float = None
+        self.__T_cold_out: float = None
+
         self.__outlet_hot: HumidAir | Fluid | Solution = None
         self.__outlet_cold: HumidAir | Fluid | Solution = None
         self.__Q = None  # Heat transfer rate in kW
 
-    def __get_cp_T(self, fluid):
-        """
-        Return (cp, T_in) for supported fluid types.
-        HumidAir: cp = fluid.Cp_moistair, T = fluid.Tdb
-        Fluid: cp = fluid.Cp, T = fluid.T
-        Solution: cp = fluid.cp, T = fluid.T
-        """
-        if isinstance(fluid, HumidAir):
-            cp = fluid.specific_heat
-            T = fluid.temperature
-        elif isinstance(fluid, Fluid):
-            cp = fluid.specific_heat
-            T = fluid.temperature
-        elif isinstance(fluid, Solution):
-            cp = fluid.specific_heat * 1e3
-            T = fluid.temperature.toC
-        else:
-            raise TypeError("Unsupported fluid type: {}".format(type(fluid)))
-        return cp, T
-
     @property
     def inlet_hot(self) -> HumidAir | Fluid | Solution:
         return self.__inlet_hot
@@ -61,13 +94,15 @@ class HeatExchanger:
     @property
     def outlet_hot(self) -> HumidAir | Fluid | Solution:
         if self.__outlet_hot is None:
-            self.__setOutletHotCold()
+            self.__outlet_hot = _outlet(self.__hot_kind, self.inlet_hot, self.T_hot_out)
         return self.__outlet_hot
 
     @property
     def outlet_cold(self) -> HumidAir | Fluid | Solution:
         if self.__outlet_cold is None:
-            self.__setOutletHotCold()
+            self.__outlet_cold = _outlet(
+                self.__cold_kind, self.inlet_cold, self.T_cold_out
+            )
         return self.__outlet_cold
 
     @property
@@ -78,6 +113,76 @@ class HeatExchanger:
     def m_cold(self) -> float:
         return self.__m_cold
 
+    @property
+    def efficiency_rate(self) -> float:
+        return self.__efficiency_rate
+
+    @property
+    def UA(self) -> float | None:
+        """[W/K]"""
+        return self.__UA
+
+    @property
+    def arrangement(self) -> FlowArrangement:
+        return self.__arrangement
+
+    @property
+    def effectiveness(self) -> float:
+        """Fixed efficiency_rate, or epsilon(NTU, Cr) when UA is given."""
+        if self.__effectiveness is None:
+            if self.__UA is None:
+                self.__effectiveness = self.__efficiency_rate
+            else:
+                C_h = self.__m_hot * self.cp_hot
+                C_c = self.__m_cold * self.cp_cold
+                C_min, C_max = min(C_h, C_c), max(C_h, C_c)
+                self.__effectiveness = effectivenessNTU(
+                    self.__UA / C_min, C_min / C_max, self.__arrangement
+                )
+        return self.__effectiveness
+
+    @property
+    def cp_hot(self) -> float:
+        """[J/kg/K]"""
+        if self.__cp_hot is None:
+            self.__cp_hot, self.__T_hot_in = _cpT(self.__hot_kind, self.inlet_hot)
+        return self.__cp_hot
+
+    @property
+    def cp_cold(self) -> float:
+        """[J/kg/K]"""
+        if self.__cp_cold is None:
+            self.__cp_cold, self.__T_cold_in = _cpT(self.__cold_kind, self.inlet_cold)
+        return self.__cp_cold
+
+    @property
+    def T_hot_in(self) -> float:
+        """[C]"""
+        if self.__T_hot_in is None:
+            self.__cp_hot, self.__T_hot_in = _cpT(self.__hot_kind, self.inlet_hot)
+        return self.__T_hot_in
+
+    @property
+    def T_cold_in(self) -> float:
+        """[C]"""
+        if self.__T_cold_in is None:
+            self.__cp_cold, self.__T_cold_in = _cpT(self.__cold_kind, self.inlet_cold)
+        return self.__T_cold_in
+
+    @property
+    def T_hot_out(self) -> float:
+        """[C]"""
+        if self.__T_hot_out is None:
+            self.__setOutletHotCold()
+        return self.__T_hot_out
+
+    @property
+    def T_cold_out(self) -> float:
+        """[C]"""
+        if self.__T_cold_out is None:
+            self.__setOutletHotCold()
+        return self.__T_cold_out
+
     @property
     def heat_transfer_rate(self) -> float:
         """Heat transfer rate [kW]."""
@@ -86,42 +191,12 @@ class HeatExchanger:
         return self.__Q
 
     def __setOutletHotCold(self):
-        if self.__cp_hot is None or self.__T_hot_in is None:
-            self.__cp_hot, self.__T_hot_in = self.__get_cp_T(self.inlet_hot)
-
-        if self.__cp_cold is None or self.__T_cold_in is None:
-            self.__cp_cold, self.__T_cold_in = self.__get_cp_T(self.inlet_cold)
-
-        C_h = self.__m_hot * self.__cp_hot
-        C_c = self.__m_cold * self.__cp_cold
+        C_h = self.__m_hot * self.cp_hot
+        C_c = self.__m_cold * self.cp_cold
         C_min = min(C_h, C_c)
-        delta_T = self.__T_hot_in - self.__T_cold_in
-
-        self.__Q = self.__efficiency_rate * C_min * delta_T
-
-        T_hot_out = self.__T_hot_in - self.__Q / C_h
-        T_cold_out = self.__T_cold_in + self.__Q / C_c
+        delta_T = self.T_hot_in - self.T_cold_in
 
-        self.__outlet_hot = self.__outletType(self.inlet_hot, T_hot_out)
-        self.__outlet_cold = self.__outletType(self.inlet_cold, T_cold_out)
-
-    def __outletType(
-        self, inlet_fluid: HumidAir | Fluid | Solution, T_out
-    ) -> HumidAir | Fluid | Solution:
-        if isinstance(inlet_fluid, HumidAir):
-            outlet_fluid = HumidAir().with_state(
-                InputHumidAir.pressure(inlet_fluid.pressure),
-                InputHumidAir.temperature(T_out),
-                InputHumidAir.humidity(inlet_fluid.humidity),
-            )
-        elif isinstance(inlet_fluid, Fluid):
-            outlet_fluid = inlet_fluid.with_state(
-                Input.temperature(T_out), Input.pressure(inlet_fluid.pressure)
-            )
-        elif isinstance(inlet_fluid, Solution):
-            outlet_fluid = inlet_fluid.withState(
-                InputSolution.temperature(T_out + 273.15),
-                InputSolution.concentration(inlet_fluid.concentration),
-            )
+        self.__Q = self.effectiveness * C_min * delta_T
 
-        return outlet_fluid
+        self.__T_hot_out = self.T_hot_in - self.__Q / C_h
+        self.__T_cold_out = self.T_cold_in + self.__Q / C_c
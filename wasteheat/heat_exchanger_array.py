@@ -0,0 +1,214 @@
+import numpy as np
+from pyfluids import HumidAir, Fluid
+from solution import Solution
+
+from .effectiveness import FlowArrangement, effectivenessNTU
+from .heat_exchanger import _streamKind, _cpT, _outlet
+
+__all__ = ["HeatExchangerArray"]
+
+
+def _listKind(streams: list) -> type:
+    """Stream kind shared by every element of a list, mixed kinds are rejected."""
+    kinds = {_streamKind(f) for f in streams}
+    if len(kinds) != 1:
+        raise TypeError(
+            "Streams must share one kind, got: {}".format(
+                ", ".join(sorted(kind.__name__ for kind in kinds)) or "none"
+            )
+        )
+    return kinds.pop()
+
+
+class HeatExchangerArray:
+    """
+    Batch counterpart of HeatExchanger working on arrays of stream
+    properties. Outlet temperatures and heat transfer rates are computed in
+    one vectorized pass; outlet HumidAir / Fluid / Solution objects are only
+    built for the indices that are actually requested.
+
+    With ``UA`` given the effectiveness follows the effectiveness-NTU
+    correlation of ``arrangement`` for every element instead of the fixed
+    ``efficiency_rate``.
+    """
+
+    def __init__(
+        self,
+        cp_hot: np.ndarray,  # J/kg/K
+        T_hot_in: np.ndarray,  # C
+        m_hot: np.ndarray,  # kg/s
+        cp_cold: np.ndarray,  # J/kg/K
+        T_cold_in: np.ndarray,  # C
+        m_cold: np.ndarray,  # kg/s
+        efficiency_rate: float | np.ndarray = 0.80,
+        UA: float | np.ndarray = None,  # W/K
+        arrangement: FlowArrangement = FlowArrangement.counterflow,
+    ):
+        (
+            self.__cp_hot,
+            self.__T_hot_in,
+            self.__m_hot,
+            self.__cp_cold,
+            self.__T_cold_in,
+            self.__m_cold,
+            self.__efficiency_rate,
+        ) = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    cp_hot,
+                    T_hot_in,
+                    m_hot,
+                    cp_cold,
+                    T_cold_in,
+                    m_cold,
+                    efficiency_rate,
+                )
+            )
+        )
+
+        self.__UA: np.ndarray | None = None if UA is None else np.asarray(UA, float)
+        self.__arrangement: FlowArrangement = FlowArrangement(arrangement)
+        self.__effectiveness: np.ndarray = None
+
+        self.__inlet_hot: list | None = None
+        self.__inlet_cold: list | None = None
+        self.__hot_kind: type = None
+        self.__cold_kind: type = None
+
+        self.__T_hot_out: np.ndarray = None
+        self.__T_cold_out: np.ndarray = None
+        self.__Q: np.ndarray = None
+
+        self.__outlet_hot: dict[int, HumidAir | Fluid | Solution] = {}
+        self.__outlet_cold: dict[int, HumidAir | Fluid | Solution] = {}
+
+    @classmethod
+    def fromStreams(
+        cls,
+        inlet_hot: list[HumidAir | Fluid | Solution],
+        m_hot: np.ndarray,
+        inlet_cold: list[HumidAir | Fluid | Solution],
+        m_cold: np.ndarray,
+        efficiency_rate: float | np.ndarray = 0.80,
+        UA: float | np.ndarray = None,
+        arrangement: FlowArrangement = FlowArrangement.counterflow,
+    ) -> "HeatExchangerArray":
+        """
+        Build the batch from inlet stream objects. Every list must hold a
+        single stream kind, otherwise TypeError is raised.
+        """
+        hot_kind = _listKind(inlet_hot)
+        cold_kind = _listKind(inlet_cold)
+
+        cp_hot, T_hot_in = np.array([_cpT(hot_kind, f) for f in inlet_hot]).T
+        cp_cold, T_cold_in = np.array([_cpT(cold_kind, f) for f in inlet_cold]).T
+
+        hx = cls(
+            cp_hot,
+            T_hot_in,
+            m_hot,
+            cp_cold,
+            T_cold_in,
+            m_cold,
+            efficiency_rate,
+            UA,
+            arrangement,
+        )
+        hx.__inlet_hot = list(inlet_hot)
+        hx.__inlet_cold = list(inlet_cold)
+        hx.__hot_kind = hot_kind
+        hx.__cold_kind = cold_kind
+        return hx
+
+    @property
+    def size(self) -> int:
+        return self.__T_hot_in.size
+
+    @property
+    def m_hot(self) -> np.ndarray:
+        return self.__m_hot
+
+    @property
+    def m_cold(self) -> np.ndarray:
+        return self.__m_cold
+
+    @property
+    def T_hot_in(self) -> np.ndarray:
+        """[C]"""
+        return self.__T_hot_in
+
+    @property
+    def T_cold_in(self) -> np.ndarray:
+        """[C]"""
+        return self.__T_cold_in
+
+    @property
+    def T_hot_out(self) -> np.ndarray:
+        """[C]"""
+        if self.__T_hot_out is None:
+            self.__setOutletHotCold()
+        return self.__T_hot_out
+
+    @property
+    def T_cold_out(self) -> np.ndarray:
+        """[C]"""
+        if self.__T_cold_out is None:
+            self.__setOutletHotCold()
+        return self.__T_cold_out
+
+    @property
+    def effectiveness(self) -> np.ndarray:
+        if self.__effectiveness is None:
+            self.__setOutletHotCold()
+        return self.__effectiveness
+
+    @property
+    def heat_transfer_rate(self) -> np.ndarray:
+        """Heat transfer rate [W]."""
+        if self.__Q is None:
+            self.__setOutletHotCold()
+        return self.__Q
+
+    def outletHot(self, index: int) -> HumidAir | Fluid | Solution:
+        """Hot-side outlet stream object of one element, built on demand."""
+        if index not in self.__outlet_hot:
+            self.__outlet_hot[index] = self.__materialize(
+                self.__hot_kind, self.__inlet_hot, self.T_hot_out, index
+            )
+        return self.__outlet_hot[index]
+
+    def outletCold(self, index: int) -> HumidAir | Fluid | Solution:
+        """Cold-side outlet stream object of one element, built on demand."""
+        if index not in self.__outlet_cold:
+            self.__outlet_cold[index] = self.__materialize(
+                self.__cold_kind, self.__inlet_cold, self.T_cold_out, index
+            )
+        return self.__outlet_cold[index]
+
+    def __materialize(self, kind: type, inlets: list | None, T_out, index: int):
+        if inlets is None:
+            raise ValueError(
+                "Outlet objects need inlet streams, build with fromStreams()"
+            )
+        inlet = inlets[index] if len(inlets) > 1 else inlets[0]
+        return _outlet(kind, inlet, float(T_out[index]))
+
+    def __setOutletHotCold(self):
+        C_h = self.__m_hot * self.__cp_hot
+        C_c = self.__m_cold * self.__cp_cold
+        C_min = np.minimum(C_h, C_c)
+        delta_T = self.__T_hot_in - self.__T_cold_in
+
+        if self.__UA is None:
+            self.__effectiveness = self.__efficiency_rate
+        else:
+            C_max = np.maximum(C_h, C_c)
+            self.__effectiveness = np.asarray(
+                effectivenessNTU(self.__UA / C_min, C_min / C_max, self.__arrangement)
+            )
+
+        self.__Q = self.__effectiveness * C_min * delta_T
+
+        self.__T_hot_out = self.__T_hot_in - self.__Q / C_h
+        self.__T_cold_out = self.__T_cold_in + self.__Q / C_c
@@ -0,0 +1,162 @@
+import numpy as np
+from pyfluids import HumidAir, Fluid
+from solution import Solution
+
+from .heat_exchanger import HeatExchanger, _streamKind, _outlet
+
+__all__ = ["HeatExchangerNetwork"]
+
+_SIDES = ("hot", "cold")
+
+
+class HeatExchangerNetwork:
+    """
+    Several HeatExchanger units connected by streams, solved simultaneously.
+
+    With the effectiveness of every unit fixed, each outlet temperature is a
+    linear combination of the unit's two inlet temperatures, and each
+    connected inlet equals the outlet feeding it. All inlet and outlet
+    temperatures therefore follow from one linear solve instead of
+    successive substitution around recuperation loops.
+
+    Inlets that are not connected keep the temperature of the inlet stream
+    the HeatExchanger was built with.
+
+    It is meant for exchanger-only networks with recycles among the units
+    themselves (e.g. multi-stage recuperation). The LD/SD systems do not use
+    it: their exchanger chains are acyclic between the contactors, and the
+    recycle closes through the nonlinear contactors, which the solution
+    loop fixed point already iterates.
+    """
+
+    def __init__(self, units: list[HeatExchanger] = None):
+        self.__units: list[HeatExchanger] = []
+        # (target unit, target side) -> (source unit, source side)
+        self.__links: dict[tuple[int, str], tuple[int, str]] = {}
+
+        self.__T: np.ndarray = None  # [T_hot_in, T_cold_in, T_hot_out, T_cold_out]
+
+        for unit in units or ():
+            self.addUnit(unit)
+
+    @property
+    def units(self) -> list[HeatExchanger]:
+        return self.__units
+
+    @property
+    def T_hot_in(self) -> np.ndarray:
+        """[C]"""
+        return self.__temperatures()[0]
+
+    @property
+    def T_cold_in(self) -> np.ndarray:
+        """[C]"""
+        return self.__temperatures()[1]
+
+    @property
+    def T_hot_out(self) -> np.ndarray:
+        """[C]"""
+        return self.__temperatures()[2]
+
+    @property
+    def T_cold_out(self) -> np.ndarray:
+        """[C]"""
+        return self.__temperatures()[3]
+
+    @property
+    def heat_transfer_rate(self) -> np.ndarray:
+        """Heat transfer rate of every unit [W]."""
+        C_h = np.array([hx.m_hot * hx.cp_hot for hx in self.__units])
+        return C_h * (self.T_hot_in - self.T_hot_out)
+
+    def addUnit(self, unit: HeatExchanger) -> int:
+        """Add a unit and return its index."""
+        self.__units.append(unit)
+        self.__T = None
+        return len(self.__units) - 1
+
+    def connect(self, source: int, source_side: str, target: int, target_side: str):
+        """Feed the ``source_side`` outlet of ``source`` into the ``target_side``
+        inlet of ``target``. Sides are "hot" or "cold"."""
+        for index in (source, target):
+            if not 0 <= index < len(self.__units):
+                raise ValueError(f"Unknown unit: {index!r}")
+        for side in (source_side, target_side):
+            if side not in _SIDES:
+                raise ValueError(f"Unknown side: {side!r}")
+        if (target, target_side) in self.__links:
+            raise ValueError(f"Inlet {target_side!r} of unit {target} already fed")
+
+        self.__links[(target, target_side)] = (source, source_side)
+        self.__T = None
+
+    def unit(self, index: int) -> HeatExchanger:
+        """HeatExchanger rebuilt at the solved inlet temperatures of a unit."""
+        hx = self.__units[index]
+        inlet_hot = self.__stream(hx.inlet_hot, self.T_hot_in[index])
+        inlet_cold = self.__stream(hx.inlet_cold, self.T_cold_in[index])
+        return HeatExchanger(
+            inlet_hot,
+            hx.m_hot,
+            inlet_cold,
+            hx.m_cold,
+            hx.efficiency_rate,
+            hx.UA,
+            hx.arrangement,
+        )
+
+    def outletHot(self, index: int) -> HumidAir | Fluid | Solution:
+        return self.__stream(self.__units[index].inlet_hot, self.T_hot_out[index])
+
+    def outletCold(self, index: int) -> HumidAir | Fluid | Solution:
+        return self.__stream(self.__units[index].inlet_cold, self.T_cold_out[index])
+
+    def __stream(self, template, T: float):
+        return _outlet(_streamKind(template), template, float(T))
+
+    def __temperatures(self) -> np.ndarray:
+        if self.__T is None:
+            self.__solve()
+        return self.__T
+
+    def __solve(self):
+        """
+        Unknowns per unit i (offset 4i): T_hot_in, T_cold_in, T_hot_out,
+        T_cold_out, solved as A x = b.
+        """
+        n = len(self.__units)
+        A = np.zeros((4 * n, 4 * n))
+        b = np.zeros(4 * n)
+
+        def col(i: int, side: str, outlet: bool) -> int:
+            return 4 * i + _SIDES.index(side) + (2 if outlet else 0)
+
+        for i, hx in enumerate(self.__units):
+            C_h = hx.m_hot * hx.cp_hot
+            C_c = hx.m_cold * hx.cp_cold
+            C_min = min(C_h, C_c)
+            a_h = hx.effectiveness * C_min / C_h
+            a_c = hx.effectiveness * C_min / C_c
+
+            # T_hot_out = T_hot_in - a_h (T_hot_in - T_cold_in)
+            row = col(i, "hot", True)
+            A[row, row] = 1
+            A[row, col(i, "hot", False)] = -(1 - a_h)
+            A[row, col(i, "cold", False)] = -a_h
+
+            # T_cold_out = T_cold_in + a_c (T_hot_in - T_cold_in)
+            row = col(i, "cold", True)
+            A[row, row] = 1
+            A[row, col(i, "hot", False)] = -a_c
+            A[row, col(i, "cold", False)] = -(1 - a_c)
+
+            for side, T_in in (("hot", hx.T_hot_in), ("cold", hx.T_cold_in)):
+                row = col(i, side, False)
+                A[row, row] = 1
+                source = self.__links.get((i, side))
+                if source is None:
+                    b[row] = T_in
+                else:
+                    A[row, col(source[0], source[1], True)] = -1
+
+        self.__T = np.linalg.solve(A, b).reshape(n, 4).T
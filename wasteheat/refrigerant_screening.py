@@ -0,0 +1,198 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from CoolProp.CoolProp import PropsSI
+
+__all__ = ["RefrigerantScreening"]
+
+
+@lru_cache(maxsize=None)
+def _evapStates(fluid_name: str, T_evap: float, overheat: float):
+    """(P_evap [Pa], h1 [kJ/kg], h1_overheat [kJ/kg], s1 [J/kg/K]) at T_evap [K]."""
+    P_evap = PropsSI("P", "T", T_evap, "Q", 0, fluid_name)
+    h1 = PropsSI("H", "T", T_evap, "Q", 1, fluid_name) / 1000
+
+    if overheat:
+        h1_overheat = (
+            PropsSI("H", "T", T_evap + overheat, "P", P_evap, fluid_name) / 1000
+        )
+        s1 = PropsSI("S", "T", T_evap + overheat, "P", P_evap, fluid_name)
+    else:
+        h1_overheat = None
+        s1 = PropsSI("S", "T", T_evap, "Q", 1, fluid_name)
+
+    return P_evap, h1, h1_overheat, s1
+
+
+@lru_cache(maxsize=None)
+def _condStates(fluid_name: str, T_cond: float, subcool: float):
+    """(P_cond [Pa], h3 [kJ/kg], h3_subcool [kJ/kg]) at T_cond [K]."""
+    P_cond = PropsSI("P", "T", T_cond, "Q", 0, fluid_name)
+    h3 = PropsSI("H", "T", T_cond, "Q", 0, fluid_name) / 1000
+
+    if subcool:
+        h3_subcool = PropsSI("H", "T", T_cond - subcool, "P", P_cond, fluid_name) / 1000
+    else:
+        h3_subcool = None
+
+    return P_cond, h3, h3_subcool
+
+
+def _screenFluid(args):
+    """
+    Evaluate one refrigerant over the whole T_evap/T_cond grid.
+
+    Runs in a worker process. Saturation states on the evaporator and
+    condenser side are cached per fluid, so only the compressor outlet
+    (h2s) is evaluated for every grid point.
+    """
+    fluid_name, T_evap_C, T_cond_C, m_ref, overheat, subcool, entropy_eff = args
+
+    n = len(T_evap_C)
+    columns = {
+        "Q_cond": np.full(n, np.nan),
+        "Q_evap": np.full(n, np.nan),
+        "W_comp": np.full(n, np.nan),
+        "COP_h": np.full(n, np.nan),
+        "P_evap": np.full(n, np.nan),
+        "P_cond": np.full(n, np.nan),
+        "pressure_ratio": np.full(n, np.nan),
+    }
+
+    try:
+        T_crit = PropsSI("Tcrit", fluid_name)
+    except ValueError:
+        # predefined blends (e.g. "R513A.mix") have no single critical point
+        T_crit = np.inf
+
+    for i, (t_evap, t_cond) in enumerate(zip(T_evap_C, T_cond_C)):
+        T_evap = t_evap + 273.15
+        T_cond = t_cond + 273.15
+        if not T_evap < T_cond < T_crit:
+            continue
+
+        try:
+            P_evap, h1, h1_overheat, s1 = _evapStates(fluid_name, T_evap, overheat)
+            P_cond, h3, h3_subcool = _condStates(fluid_name, T_cond, subcool)
+            h2s = PropsSI("H", "P", P_cond, "S", s1, fluid_name) / 1000
+        except ValueError:
+            # CoolProp could not resolve the state, leave the row as NaN
+            continue
+
+        # same cycle definition as Refrigerant / HeatPump
+        h1_in = h1_overheat if h1_overheat is not None else h1
+        h2 = h1_in + (h2s - h1) / entropy_eff
+        h4 = h3_subcool if h3_subcool is not None else h3
+
+        Q_cond = m_ref * (h2 - h4)
+        Q_evap = m_ref * (h1_in - h4)
+        W_comp = Q_cond - Q_evap
+
+        columns["Q_cond"][i] = Q_cond
+        columns["Q_evap"][i] = Q_evap
+        columns["W_comp"][i] = W_comp
+        columns["COP_h"][i] = Q_cond / W_comp
+        columns["P_evap"][i] = P_evap
+        columns["P_cond"][i] = P_cond
+        columns["pressure_ratio"][i] = P_cond / P_evap
+
+    return columns
+
+
+class RefrigerantScreening:
+    """
+    Screen several refrigerants over a grid of evaporating/condensing
+    temperatures. Each fluid is evaluated in its own worker process.
+
+    Fluid names are CoolProp names; predefined blends use the ``.mix``
+    suffix (e.g. "R513A.mix").
+    """
+
+    def __init__(
+        self,
+        fluid_names: list[str],
+        T_evap_C: list[float],  # C
+        T_cond_C: list[float],  # C
+        m_ref: float = 1.0,  # kg/s
+        overheat: float = 5,
+        subcool: float = 5,
+        entropy_eff: float = 0.74,
+        max_workers: int | None = None,
+    ):
+        self.__fluid_names: list[str] = list(fluid_names)
+        self.__m_ref: float = m_ref
+        self.__overheat: float = overheat
+        self.__subcool: float = subcool
+        self.__entropy_eff: float = entropy_eff
+        self.__max_workers: int | None = max_workers
+
+        # full T_evap x T_cond grid, flattened
+        T_evap, T_cond = np.meshgrid(
+            np.asarray(T_evap_C, dtype=float),
+            np.asarray(T_cond_C, dtype=float),
+            indexing="ij",
+        )
+        self.__T_evap: np.ndarray = T_evap.ravel()
+        self.__T_cond: np.ndarray = T_cond.ravel()
+
+        self.__table: dict[str, np.ndarray] = None
+
+    @property
+    def fluid_names(self) -> list[str]:
+        return self.__fluid_names
+
+    @property
+    def table(self) -> dict[str, np.ndarray]:
+        """
+        Columnar result table, one row per (fluid, T_evap, T_cond).
+
+        Columns: fluid, T_evap [C], T_cond [C], Q_cond [kW], Q_evap [kW],
+        W_comp [kW], COP_h [-], P_evap [Pa], P_cond [Pa], pressure_ratio [-].
+        Infeasible points (e.g. T_cond above the critical point) are NaN.
+        """
+        if self.__table is None:
+            self.__setTable()
+        return self.__table
+
+    def best(self, key: str = "COP_h") -> dict[str, float | str]:
+        """Row with the highest value of ``key``."""
+        idx = int(np.nanargmax(self.table[key]))
+        return {name: column[idx] for name, column in self.table.items()}
+
+    def __setTable(self):
+        jobs = [
+            (
+                name,
+                self.__T_evap,
+                self.__T_cond,
+                self.__m_ref,
+                self.__overheat,
+                self.__subcool,
+                self.__entropy_eff,
+            )
+            for name in self.__fluid_names
+        ]
+
+        with ProcessPoolExecutor(max_workers=self.__max_workers) as pool:
+            results = list(pool.map(_screenFluid, jobs))
+
+        n = len(self.__T_evap)
+        table = {
+            "fluid": np.repeat(np.asarray(self.__fluid_names, dtype=object), n),
+            "T_evap": np.tile(self.__T_evap, len(self.__fluid_names)),
+            "T_cond": np.tile(self.__T_cond, len(self.__fluid_names)),
+        }
+        for key in results[0] if results else ():
+            table[key] = np.concatenate([result[key] for result in results])
+
+        self.__table = table
+
+
+if __name__ == "__main__":
+    screening = RefrigerantScreening(
+        ["R134A", "R1234yf", "R1234ze(E)", "R290", "R32", "R513A.mix"],
+        [35, 40, 45],
+        [50, 55, 60],
+    )
+    print(screening.best())